@@ -0,0 +1,381 @@
+#!/usr/bin/env python
+#
+# Benchmarks for Route53Provider's plan and apply hot paths.
+#
+# Synthetic zones are served by an in-memory fake of the Route53 API so that
+# what's measured is the provider's own work rather than the network. See
+# `./script/benchmark --help` for usage.
+#
+
+import json
+import logging
+import platform
+import sys
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter
+
+from octodns.provider.plan import Plan
+from octodns.record import Record, Update
+from octodns.zone import Zone
+
+from octodns_route53 import Route53Provider
+
+ZONE_ID = '/hostedzone/Z42BENCH'
+ZONE_NAME = 'bench.tests.'
+COLLECTION_ID = 'c42'
+
+
+class FakeRoute53:
+    '''
+    Just enough of the Route53 API, with its paging, to back a provider.
+    Changes are accepted but not applied so that every iteration sees the same
+    zone.
+    '''
+
+    PAGE_SIZE = 300
+
+    def __init__(self):
+        self.rrsets = []
+        self.health_checks = {}
+        self.cidr_blocks = {}
+
+    def list_hosted_zones(self, **kwargs):
+        return {
+            'HostedZones': [
+                {
+                    'Name': ZONE_NAME,
+                    'Id': ZONE_ID,
+                    'CallerReference': 'bench',
+                    'ResourceRecordSetCount': len(self.rrsets),
+                }
+            ],
+            'IsTruncated': False,
+        }
+
+    def get_hosted_zone(self, Id):
+        return {'HostedZone': {'ResourceRecordSetCount': len(self.rrsets)}}
+
+    def list_resource_record_sets(self, HostedZoneId, **kwargs):
+        # the real API pages by name/type/identifier, an offset is simpler
+        start = int(kwargs.get('StartRecordName', 0))
+        end = start + self.PAGE_SIZE
+        resp = {
+            'ResourceRecordSets': self.rrsets[start:end],
+            'IsTruncated': end < len(self.rrsets),
+        }
+        if resp['IsTruncated']:
+            resp['NextRecordName'] = str(end)
+            resp['NextRecordType'] = 'A'
+        return resp
+
+    def change_resource_record_sets(self, HostedZoneId, ChangeBatch):
+        return {'ChangeInfo': {'Id': 'bench', 'Status': 'PENDING'}}
+
+    def list_health_checks(self, **kwargs):
+        return {
+            'HealthChecks': list(self.health_checks.values()),
+            'IsTruncated': False,
+        }
+
+    def get_health_check(self, HealthCheckId):
+        return {'HealthCheck': self.health_checks[HealthCheckId]}
+
+    def create_health_check(self, CallerReference, HealthCheckConfig):
+        id = f'hc{len(self.health_checks):06d}'
+        health_check = {
+            'Id': id,
+            'CallerReference': CallerReference,
+            'HealthCheckConfig': HealthCheckConfig,
+            'HealthCheckVersion': 1,
+        }
+        self.health_checks[id] = health_check
+        return {'HealthCheck': dict(health_check)}
+
+    def change_tags_for_resource(self, **kwargs):
+        return {}
+
+    def delete_health_check(self, HealthCheckId):
+        return {}
+
+    def list_cidr_collections(self, **kwargs):
+        return {
+            'CidrCollections': [
+                {'Id': COLLECTION_ID, 'Name': 'octodns', 'Version': 1}
+            ]
+        }
+
+    def list_cidr_blocks(self, CollectionId, **kwargs):
+        return {
+            'CidrBlocks': [
+                {'CidrBlock': cidr, 'LocationName': location}
+                for location, cidrs in self.cidr_blocks.items()
+                for cidr in cidrs
+            ]
+        }
+
+    def change_cidr_collection(self, Id, Changes):
+        return {}
+
+
+def _provider(fake):
+    provider = Route53Provider('bench', 'abc', '123')
+    provider._conn = fake
+    return provider
+
+
+def _dynamic(i, geo=False, subnet=False):
+    pools = {
+        f'p{p}': {
+            'values': [
+                {'value': f'10.{i % 250}.{p}.{v + 1}', 'weight': v + 1}
+                for v in range(2)
+            ]
+        }
+        for p in range(3)
+    }
+    pools['p0']['fallback'] = 'p1'
+    pools['p1']['fallback'] = 'p2'
+    if geo:
+        rules = [
+            {'pool': 'p0', 'geos': ['NA-US-CA', 'NA-US-OR']},
+            {'pool': 'p1', 'geos': ['EU']},
+            {'pool': 'p2'},
+        ]
+    elif subnet:
+        rules = [
+            {'pool': 'p0', 'subnets': [f'10.{i % 250}.0.0/16']},
+            {'pool': 'p1', 'subnets': ['192.168.0.0/16']},
+            {'pool': 'p2'},
+        ]
+    else:
+        rules = [{'pool': 'p0'}]
+    return {
+        'type': 'A',
+        'ttl': 60,
+        'values': ['1.1.1.1', '2.2.2.2'],
+        'dynamic': {'pools': pools, 'rules': rules},
+    }
+
+
+def build_zone(size, ratios):
+    '''
+    Generates a zone with at least `size` rrsets, picking the kinds of records
+    in line with `ratios`, and a fake with Route53's view of it.
+    '''
+    fake = FakeRoute53()
+    provider = _provider(fake)
+    provider._health_checks = {}
+    zone = Zone(ZONE_NAME, [])
+
+    kinds = sorted(ratios.items())
+    counts = {kind: 0 for kind, _ in kinds}
+    i = 0
+    while len(fake.rrsets) < size:
+        # pick whichever kind is furthest behind its share
+        kind = min(
+            (counts[kind] / ratio, kind) for kind, ratio in kinds if ratio
+        )[1]
+        counts[kind] += 1
+        name = f'{kind}-{i}'
+        if kind == 'simple':
+            data = {'type': 'A', 'ttl': 60, 'values': ['1.2.3.4', '5.6.7.8']}
+        elif kind == 'alias':
+            data = {
+                'type': 'Route53Provider/ALIAS',
+                'ttl': 942942942,
+                'values': [{'name': f'simple-{i}', 'type': 'A'}],
+            }
+        else:
+            data = _dynamic(i, geo=kind == 'geo', subnet=kind == 'subnet')
+            for rule in data['dynamic']['rules']:
+                subnets = rule.get('subnets')
+                if subnets:
+                    location = provider._cidr_location_name(subnets)
+                    fake.cidr_blocks[location] = subnets
+        record = Record.new(zone, name, data)
+        zone.add_record(record)
+        for r53 in provider._gen_records(
+            record, ZONE_ID, creating=True, collection_id=COLLECTION_ID
+        ):
+            fake.rrsets.append(r53.mod('CREATE', [])['ResourceRecordSet'])
+        i += 1
+
+    return zone, fake
+
+
+def _populated(fake):
+    provider = _provider(fake)
+    existing = Zone(ZONE_NAME, [])
+    # as a target, sources don't hold on to the rrsets planning needs
+    provider.populate(existing, target=True)
+    provider.health_checks
+    return provider, existing
+
+
+def bench_populate(zone, fake):
+    def run():
+        # a new provider each time so that everything is listed again
+        _provider(fake).populate(Zone(ZONE_NAME, []))
+
+    return run
+
+
+def bench_extra_changes(zone, fake):
+    provider, _ = _populated(fake)
+
+    def run():
+        provider._extra_changes(desired=zone, changes=[])
+
+    return run
+
+
+def bench_apply(zone, fake):
+    provider, existing = _populated(fake)
+    # bump every record's ttl so that everything is an update
+    desired = Zone(ZONE_NAME, [])
+    changes = []
+    for record in existing.records:
+        new = record.copy()
+        new.ttl += 1
+        desired.add_record(new)
+        changes.append(Update(record, new))
+    plan = Plan(existing, desired, changes, True)
+
+    def run():
+        provider._apply(plan)
+
+    return run
+
+
+def bench_health_check_matching(zone, fake):
+    provider, _ = _populated(fake)
+    lookups = [
+        (record, value['value'])
+        for record in zone.records
+        if getattr(record, 'dynamic', False)
+        for pool in record.dynamic.pools.values()
+        for value in pool.data['values']
+    ]
+
+    def run():
+        for record, value in lookups:
+            provider.get_health_check_id(record, value, 'obey', False)
+
+    return run
+
+
+BENCHMARKS = {
+    'populate': bench_populate,
+    'extra_changes': bench_extra_changes,
+    'apply': bench_apply,
+    'health_check_matching': bench_health_check_matching,
+}
+
+
+def main():
+    parser = ArgumentParser(
+        description='Benchmarks Route53Provider against synthetic zones'
+    )
+    parser.add_argument(
+        '--sizes',
+        default='1000,10000',
+        help='Comma separated zone sizes, in rrsets (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Runs of each benchmark, the median is reported '
+        '(default: %(default)s)',
+    )
+    for kind, default in (
+        ('simple', 0.6),
+        ('alias', 0.1),
+        ('dynamic', 0.1),
+        ('geo', 0.1),
+        ('subnet', 0.1),
+    ):
+        parser.add_argument(
+            f'--{kind}',
+            type=float,
+            default=default,
+            help=f'Share of {kind} records (default: %(default)s)',
+        )
+    parser.add_argument(
+        '--only', action='append', choices=sorted(BENCHMARKS), default=None
+    )
+    parser.add_argument('--save', metavar='PATH', help='Write results to PATH')
+    parser.add_argument(
+        '--compare',
+        metavar='PATH',
+        help='Compare results to those stored in PATH, saved on the same '
+        'machine, and fail if any regressed',
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.25,
+        help='Slowdown, as a fraction, counted as a regression '
+        '(default: %(default)s)',
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    ratios = {
+        kind: getattr(args, kind)
+        for kind in ('simple', 'alias', 'dynamic', 'geo', 'subnet')
+    }
+    names = args.only or list(BENCHMARKS)
+    results = {name: {} for name in names}
+    for size in (int(s) for s in args.sizes.split(',')):
+        zone, fake = build_zone(size, ratios)
+        print(
+            f'size={size}: {len(fake.rrsets)} rrsets, {len(zone.records)} '
+            f'records, {len(fake.health_checks)} health checks'
+        )
+        for name in names:
+            run = BENCHMARKS[name](zone, fake)
+            times = []
+            for _ in range(args.repeat):
+                start = perf_counter()
+                run()
+                times.append(perf_counter() - start)
+            results[name][str(size)] = median(times)
+            print(f'  {name:<24} {median(times) * 1000:>10.1f}ms')
+
+    if args.save:
+        with open(args.save, 'w') as fh:
+            json.dump(
+                {
+                    'python': platform.python_version(),
+                    'ratios': ratios,
+                    'results': results,
+                },
+                fh,
+                indent=2,
+                sort_keys=True,
+            )
+            fh.write('\n')
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)['results']
+        regressions = []
+        for name, sizes in results.items():
+            for size, took in sizes.items():
+                before = baseline.get(name, {}).get(size)
+                if before is None:
+                    continue
+                change = took / before - 1
+                print(f'  {name}[{size}] {change:+.0%}')
+                if change > args.threshold:
+                    regressions.append(f'{name}[{size}]')
+        if regressions:
+            print(f'Regressed: {", ".join(regressions)}')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,33 +3,73 @@
 #
 
 import re
+from threading import RLock
 
 from boto3 import Session
 from botocore.config import Config
+from botocore.credentials import (
+    CredentialProvider,
+    CredentialResolver,
+    DeferredRefreshableCredentials,
+)
+from botocore.session import get_session
+
+# Sessions and clients are shared process-wide so that multiple providers and
+# sources using the same credentials don't each have to set things up, and
+# assume roles, from scratch. Both are safe to use from multiple threads once
+# created, creating them is done under the (re-entrant, for assuming roles)
+# lock.
+_cache_lock = RLock()
+# (profile, access_key_id, secret_access_key, session_token, role_arn,
+# role_session_name) -> Session
+_sessions = {}
+# (session key, service_name, client_max_attempts, rate_limiter, args,
+# kwargs) -> client
+_clients = {}
+
+
+def _clear_caches():
+    with _cache_lock:
+        _sessions.clear()
+        _clients.clear()
+
+
+class _AssumeRoleProvider(CredentialProvider):
+    '''
+    Provides a role's credentials. They're only assumed when they're first
+    used, rather than while the session's being created under _cache_lock,
+    and are re-assumed before they expire so that long runs, and everyone
+    sharing the session, keep working.
+    '''
+
+    METHOD = 'sts-assume-role'
+
+    def __init__(self, assume_role):
+        super().__init__()
+        self.assume_role = assume_role
+
+    def load(self):
+        return DeferredRefreshableCredentials(
+            refresh_using=self.assume_role, method=self.METHOD
+        )
 
 
 class _AuthMixin:
-    def client(
+    def _session(
         self,
-        service_name,
         access_key_id,
         secret_access_key,
         session_token,
         role_arn,
+        role_session_name,
         profile,
         client_max_attempts,
         *args,
         **kwargs,
     ):
-        self.log.debug(
-            'client: service_name=%s, access_key_id=%s, secret_access_key=%s, session_token=%s, client_max_attempts=%s, profile=%s',
-            service_name,
-            access_key_id,
-            secret_access_key is not None,
-            session_token is not None,
-            client_max_attempts,
-            profile,
-        )
+        session_kwargs = {}
+        if profile is not None:
+            session_kwargs['profile_name'] = profile
 
         if role_arn:
             self.log.debug('client:   assuming role %s', role_arn)
@@ -47,21 +87,29 @@ class _AuthMixin:
                 **kwargs,
             )
 
-            # make sure to only uses chars that are allowed in role session
-            # names
-            ident = re.sub(r"[^a-zA-Z0-9_=,.@-]+", "-", self.id)
+            def assume_role():
+                # assume the specified role with the base auth info
+                credentials = sts_client.assume_role(
+                    RoleArn=role_arn, RoleSessionName=role_session_name
+                )['Credentials']
+                self.log.debug(
+                    'client:   assumed role %s, expiration=%s',
+                    role_arn,
+                    credentials['Expiration'],
+                )
+                return {
+                    'access_key': credentials['AccessKeyId'],
+                    'secret_key': credentials['SecretAccessKey'],
+                    'token': credentials['SessionToken'],
+                    'expiry_time': credentials['Expiration'].isoformat(),
+                }
 
-            # assume the specified role with the base auth info
-            credentials = sts_client.assume_role(
-                RoleArn=role_arn, RoleSessionName="octodns-route53-" + ident
+            botocore_session = get_session()
+            botocore_session.register_component(
+                'credential_provider',
+                CredentialResolver([_AssumeRoleProvider(assume_role)]),
             )
-
-            # and get new auth info for that role assumption, replacing the
-            # stuff that was passed in and continue on to get the requested
-            # client with the new auth
-            access_key_id = credentials['Credentials']['AccessKeyId']
-            secret_access_key = credentials['Credentials']['SecretAccessKey']
-            session_token = credentials['Credentials']['SessionToken']
+            return Session(botocore_session=botocore_session, **session_kwargs)
 
         use_fallback_auth = (
             access_key_id is None
@@ -70,25 +118,98 @@ class _AuthMixin:
         )
         if use_fallback_auth:
             self.log.debug('client:   using fallback auth')
-
-        config = None
-        if client_max_attempts is not None:
-            self.log.info(
-                '__init__: setting max_attempts to %d', client_max_attempts
-            )
-            config = Config(retries={'max_attempts': client_max_attempts})
-
-        session_kwargs = {}
-        if profile is not None:
-            session_kwargs['profile_name'] = profile
-
-        if not use_fallback_auth:
+        else:
             session_kwargs['aws_access_key_id'] = access_key_id
             session_kwargs['aws_secret_access_key'] = secret_access_key
             session_kwargs['aws_session_token'] = session_token
 
-        session = Session(**session_kwargs)
+        return Session(**session_kwargs)
 
-        return session.client(
-            *args, service_name=service_name, config=config, **kwargs
+    def client(
+        self,
+        service_name,
+        access_key_id,
+        secret_access_key,
+        session_token,
+        role_arn,
+        profile,
+        client_max_attempts,
+        *args,
+        rate_limiter=None,
+        role_session_name=None,
+        **kwargs,
+    ):
+        self.log.debug(
+            'client: service_name=%s, access_key_id=%s, secret_access_key=%s, session_token=%s, client_max_attempts=%s, profile=%s',
+            service_name,
+            access_key_id,
+            secret_access_key is not None,
+            session_token is not None,
+            client_max_attempts,
+            profile,
+        )
+
+        if not role_arn:
+            # only meaningful when assuming a role
+            role_session_name = None
+        elif role_session_name is None:
+            # make sure to only uses chars that are allowed in role session
+            # names
+            ident = re.sub(r"[^a-zA-Z0-9_=,.@-]+", "-", self.id)
+            role_session_name = f'octodns-route53-{ident}'
+
+        session_key = (
+            profile,
+            access_key_id,
+            secret_access_key,
+            session_token,
+            role_arn,
+            role_session_name,
+        )
+        client_key = (
+            session_key,
+            service_name,
+            client_max_attempts,
+            rate_limiter,
+            args,
+            tuple(sorted(kwargs.items())),
         )
+
+        with _cache_lock:
+            client = _clients.get(client_key)
+            if client is not None:
+                self.log.debug('client:   reusing existing client')
+                return client
+
+            session = _sessions.get(session_key)
+            if session is None:
+                session = _sessions[session_key] = self._session(
+                    access_key_id,
+                    secret_access_key,
+                    session_token,
+                    role_arn,
+                    role_session_name,
+                    profile,
+                    client_max_attempts,
+                    *args,
+                    **kwargs,
+                )
+
+            config = None
+            if client_max_attempts is not None:
+                self.log.info(
+                    '__init__: setting max_attempts to %d', client_max_attempts
+                )
+                config = Config(retries={'max_attempts': client_max_attempts})
+
+            client = session.client(
+                *args, service_name=service_name, config=config, **kwargs
+            )
+
+            if rate_limiter is not None:
+                self.log.debug('client:   installing rate limiter')
+                rate_limiter.install(client)
+
+            _clients[client_key] = client
+
+        return client
@@ -0,0 +1,77 @@
+#
+#
+#
+
+import sqlite3
+from contextlib import closing
+from json import dumps, loads
+from logging import getLogger
+from time import time
+
+
+class _SnapshotCache:
+    '''
+    Persistent, on-disk, cache of API results stored in a SQLite database.
+
+    Each entry is stored along with the time it was written and an optional
+    validator, e.g. a zone's record count. Entries are only returned when they
+    are younger than `ttl` seconds and, when one is provided, their validator
+    matches the one the caller expects.
+    '''
+
+    def __init__(self, path, ttl, clock=time):
+        self.log = getLogger(f'SnapshotCache[{path}]')
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS snapshots ('
+                'key TEXT PRIMARY KEY, '
+                'updated REAL NOT NULL, '
+                'validator TEXT, '
+                'data TEXT NOT NULL)'
+            )
+
+    def _connect(self):
+        # connections are cheap and can't be shared across threads, so we use
+        # one per operation
+        return closing(sqlite3.connect(self.path))
+
+    def get(self, key, validator=None):
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT updated, validator, data FROM snapshots WHERE key = ?',
+                (key,),
+            ).fetchone()
+        if row is None:
+            self.log.debug('get: key=%s, miss', key)
+            return None
+        updated, stored_validator, data = row
+        if self._clock() - updated > self.ttl:
+            self.log.debug('get: key=%s, expired', key)
+            return None
+        if validator is not None and stored_validator != dumps(validator):
+            self.log.debug('get: key=%s, invalid', key)
+            return None
+        self.log.debug('get: key=%s, hit', key)
+        return loads(data)
+
+    def put(self, key, data, validator=None):
+        self.log.debug('put: key=%s', key)
+        if validator is not None:
+            validator = dumps(validator)
+        with self._connect() as conn:
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO snapshots '
+                    '(key, updated, validator, data) VALUES (?, ?, ?, ?)',
+                    (key, self._clock(), validator, dumps(data, default=str)),
+                )
+
+    def delete(self, key):
+        self.log.debug('delete: key=%s', key)
+        with self._connect() as conn:
+            with conn:
+                conn.execute('DELETE FROM snapshots WHERE key = ?', (key,))
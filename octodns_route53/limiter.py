@@ -0,0 +1,125 @@
+#
+#
+#
+
+from logging import getLogger
+from threading import Lock
+from time import monotonic, sleep
+
+# Error codes AWS services use to tell us we're making requests too quickly
+_THROTTLE_CODES = frozenset(
+    (
+        'PriorRequestNotComplete',
+        'RequestLimitExceeded',
+        'Throttling',
+        'ThrottlingException',
+        'TooManyRequestsException',
+    )
+)
+
+
+class _TokenBucket:
+    '''
+    Simple thread-safe token bucket. Each call to `acquire` consumes a token,
+    blocking until one is available. Tokens are reserved under the lock and
+    the wait happens outside of it so that concurrent callers queue up behind
+    each other rather than all waking at once.
+
+    Buckets can be installed on boto clients, in which case every request the
+    client sends, including retries, will first acquire a token.
+    '''
+
+    _shared = {}
+    _shared_lock = Lock()
+
+    @classmethod
+    def shared(cls, group, rate, burst=None):
+        '''
+        Returns the bucket for `group`, creating it if this is the first time
+        it's been asked for. All users of a group must agree on its settings.
+        '''
+        with cls._shared_lock:
+            try:
+                bucket = cls._shared[group]
+            except KeyError:
+                bucket = cls._shared[group] = cls(rate, burst, name=group)
+                return bucket
+        if bucket.rate != rate or (burst and bucket.burst != burst):
+            raise ValueError(
+                f'rate limit group "{group}" already configured with '
+                f'rate={bucket.rate}, burst={bucket.burst}'
+            )
+        return bucket
+
+    def __init__(
+        self, rate, burst=None, name=None, clock=monotonic, sleep=sleep
+    ):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = float(rate)
+        self.burst = float(burst or max(1, rate))
+        self.name = name
+        self.log = getLogger(f'TokenBucket[{name}]')
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = Lock()
+        self._tokens = self.burst
+        self._last = clock()
+
+        self.requests = 0
+        self.waits = 0
+        self.wait_time = 0
+        self.throttles = 0
+
+    def acquire(self):
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            wait = 0
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                self.waits += 1
+                self.wait_time += wait
+            # reserve our token, possibly going into debt that the callers
+            # after us will have to wait out
+            self._tokens -= 1
+            self.requests += 1
+
+        if wait:
+            self._sleep(wait)
+        return wait
+
+    def throttled(self):
+        with self._lock:
+            self.throttles += 1
+            # we've been told we're going too fast, give up any burst we've
+            # built up so that the callers behind us back off
+            self._tokens = min(self._tokens, 0)
+        self.log.warning('throttled: throttles=%d', self.throttles)
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'waits': self.waits,
+            'wait_time': self.wait_time,
+            'throttles': self.throttles,
+        }
+
+    def install(self, client):
+        events = client.meta.events
+        events.register('before-send', self._before_send)
+        events.register('needs-retry', self._needs_retry)
+        return client
+
+    def _before_send(self, **kwargs):
+        self.acquire()
+
+    def _needs_retry(self, response=None, **kwargs):
+        if response is None:
+            return
+        code = response[1].get('Error', {}).get('Code')
+        if code in _THROTTLE_CODES:
+            self.throttled()
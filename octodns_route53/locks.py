@@ -0,0 +1,28 @@
+#
+#
+#
+
+from threading import Lock, RLock
+
+
+class _KeyedLocks:
+    '''
+    Hands out a lock per key so that loading one thing doesn't hold up loading
+    another while any one thing is only ever loaded once, threads that arrive
+    while it's being loaded wait and then find it already there.
+
+    The locks are re-entrant since a load can end up asking for the same key
+    again, e.g. `_get_zone_id` calling `update_r53_zones`.
+    '''
+
+    def __init__(self):
+        self._lock = Lock()
+        self._locks = {}
+
+    def __call__(self, key):
+        with self._lock:
+            try:
+                return self._locks[key]
+            except KeyError:
+                lock = self._locks[key] = RLock()
+                return lock
@@ -6,19 +6,28 @@ import hashlib
 import logging
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha256
 from ipaddress import AddressValueError, ip_address
+from itertools import chain, count
+from random import uniform
+from sys import intern
+from threading import local
+from time import monotonic, sleep
 from uuid import uuid4
 
+from botocore.exceptions import ClientError
 from pycountry_convert import country_alpha2_to_continent_code
 
-from octodns.equality import EqualityTupleMixin
 from octodns.provider import ProviderException, SupportsException
 from octodns.provider.base import BaseProvider
 from octodns.record import Create, Record, Update
 from octodns.record.geo import GeoCodes
 
 from .auth import _AuthMixin
+from .cache import _SnapshotCache
+from .limiter import _TokenBucket
+from .locks import _KeyedLocks
 from .record import Route53AliasRecord
 
 octal_re = re.compile(r'\\(\d\d\d)')
@@ -55,7 +64,12 @@ def _healthcheck_ref_prefix(version, record_type, record_fqdn):
     return ref
 
 
-class _Route53Record(EqualityTupleMixin):
+class _Route53Record(object):
+    # Large dynamic records turn into thousands of these so they're kept
+    # compact. They aren't modified once they've been created, which lets their
+    # hash be worked out up front.
+    __slots__ = ('fqdn', '_type', 'ttl', 'record', '_values', '_hash')
+
     @classmethod
     def _new_route53_alias(cls, provider, record, hosted_zone_id, creating):
         # HostedZoneId wants just the last bit, but the place we're getting
@@ -252,12 +266,15 @@ class _Route53Record(EqualityTupleMixin):
         return set((_Route53Record(provider, record, creating),))
 
     def __init__(self, provider, record, creating, fqdn_override=None):
-        self.fqdn = fqdn_override or record.fqdn
+        # the values of a pool, and the rules pointing at it, all share names
+        # so they share a single copy of them
+        self.fqdn = intern(fqdn_override or record.fqdn)
         self._type = record._type
         self.ttl = record.ttl
         self.record = record
 
         self._values = None
+        self._hash = hash((self.fqdn, self._type))
 
     @property
     def values(self):
@@ -282,15 +299,33 @@ class _Route53Record(EqualityTupleMixin):
     # _Route53Records equivalent if they have the same class, fqdn, and _type.
     # Values are ignored. This is useful when computing diffs/changes.
 
+    # Sub-classes set _hash to include any additional fields they need to
+    # have considered.
+
     def __hash__(self):
-        'sub-classes should never use this method'
-        return f'{self.fqdn}:{self._type}'.__hash__()
+        return self._hash
 
     def _equality_tuple(self):
-        '''Sub-classes should call up to this and return its value and add
-        any additional fields they need to hav considered.'''
         return (self.__class__.__name__, self.fqdn, self._type)
 
+    def __eq__(self, other):
+        return self._equality_tuple() == other._equality_tuple()
+
+    def __ne__(self, other):
+        return self._equality_tuple() != other._equality_tuple()
+
+    def __lt__(self, other):
+        return self._equality_tuple() < other._equality_tuple()
+
+    def __le__(self, other):
+        return self._equality_tuple() <= other._equality_tuple()
+
+    def __gt__(self, other):
+        return self._equality_tuple() > other._equality_tuple()
+
+    def __ge__(self, other):
+        return self._equality_tuple() >= other._equality_tuple()
+
     def __repr__(self):
         return (
             f'_Route53Record<{self.fqdn} {self._type} {self.ttl} {self.values}>'
@@ -368,6 +403,13 @@ class _Route53Record(EqualityTupleMixin):
 
 
 class _Route53Alias(_Route53Record):
+    __slots__ = (
+        'hosted_zone_id',
+        'target_name',
+        'target_type',
+        'evaluate_target_health',
+    )
+
     def __init__(self, provider, hosted_zone_id, record, value, creating):
         super().__init__(provider, record, creating)
         self.hosted_zone_id = hosted_zone_id
@@ -386,6 +428,7 @@ class _Route53Alias(_Route53Record):
             self.target_name = record.zone.name
         self.target_type = value._type
         self.evaluate_target_health = value.evaluate_target_health
+        self._hash = hash((self.fqdn, self.target_type, self.target_name))
 
     def mod(self, action, existing_rrsets):
         return {
@@ -401,9 +444,6 @@ class _Route53Alias(_Route53Record):
             },
         }
 
-    def __hash__(self):
-        return f'{self.fqdn}:{self.target_type}:{self.target_name}'.__hash__()
-
     def __repr__(self):
         return (
             f'_Route53Alias<{self.fqdn} {self.target_type} {self.target_name}>'
@@ -411,6 +451,13 @@ class _Route53Alias(_Route53Record):
 
 
 class _Route53DynamicPool(_Route53Record):
+    __slots__ = (
+        'hosted_zone_id',
+        'pool_name',
+        'target_name',
+        'target_dns_name',
+    )
+
     def __init__(
         self,
         provider,
@@ -431,10 +478,16 @@ class _Route53DynamicPool(_Route53Record):
         self.target_name = target_name
         if target_name:
             # We're pointing down the chain
-            self.target_dns_name = f'_octodns-{target_name}-pool.{record.fqdn}'
+            self.target_dns_name = intern(
+                f'_octodns-{target_name}-pool.{record.fqdn}'
+            )
         else:
             # We're a paimary, point at our values
-            self.target_dns_name = f'_octodns-{pool_name}-value.{record.fqdn}'
+            self.target_dns_name = intern(
+                f'_octodns-{pool_name}-value.{record.fqdn}'
+            )
+
+        self._hash = hash((self.fqdn, self._type, self.identifer))
 
     @property
     def mode(self):
@@ -462,14 +515,19 @@ class _Route53DynamicPool(_Route53Record):
             },
         }
 
-    def __hash__(self):
-        return f'{self.fqdn}:{self._type}:{self.identifer}'.__hash__()
-
     def __repr__(self):
         return f'_Route53DynamicPool<{self.fqdn} {self._type} {self.mode} {self.target_dns_name}>'
 
 
 class _Route53DynamicRule(_Route53Record):
+    __slots__ = (
+        'hosted_zone_id',
+        'geo',
+        'pool_name',
+        'index',
+        'target_dns_name',
+    )
+
     def __init__(
         self,
         provider,
@@ -487,7 +545,10 @@ class _Route53DynamicRule(_Route53Record):
         self.pool_name = pool_name
         self.index = index
 
-        self.target_dns_name = f'_octodns-{pool_name}-pool.{record.fqdn}'
+        self.target_dns_name = intern(
+            f'_octodns-{pool_name}-pool.{record.fqdn}'
+        )
+        self._hash = hash((self.fqdn, self._type, self.identifer))
 
     @property
     def identifer(self):
@@ -521,14 +582,21 @@ class _Route53DynamicRule(_Route53Record):
 
         return {'Action': action, 'ResourceRecordSet': rrset}
 
-    def __hash__(self):
-        return f'{self.fqdn}:{self._type}:{self.identifer}'.__hash__()
-
     def __repr__(self):
         return f'_Route53DynamicRule<{self.fqdn} {self._type} {self.index} {self.geo} {self.target_dns_name}>'
 
 
 class _Route53DynamicSubnetRule(_Route53Record):
+    __slots__ = (
+        'hosted_zone_id',
+        'pool_name',
+        'index',
+        'collection_id',
+        'default',
+        'location_name',
+        'target_dns_name',
+    )
+
     def __init__(
         self,
         provider,
@@ -550,7 +618,10 @@ class _Route53DynamicSubnetRule(_Route53Record):
         self.default = default
         self.location_name = location_name
 
-        self.target_dns_name = f'_octodns-{pool_name}-pool.{record.fqdn}'
+        self.target_dns_name = intern(
+            f'_octodns-{pool_name}-pool.{record.fqdn}'
+        )
+        self._hash = hash((self.fqdn, self._type, self.identifer))
 
     @property
     def identifer(self):
@@ -575,9 +646,6 @@ class _Route53DynamicSubnetRule(_Route53Record):
             },
         }
 
-    def __hash__(self):
-        return f'{self.fqdn}:{self._type}:{self.identifer}'.__hash__()
-
     def __repr__(self):
         return (
             f'_Route53DynamicSubnetRule<{self.fqdn} {self._type}'
@@ -586,6 +654,15 @@ class _Route53DynamicSubnetRule(_Route53Record):
 
 
 class _Route53DynamicValue(_Route53Record):
+    __slots__ = (
+        'pool_name',
+        'status',
+        'index',
+        'value',
+        'weight',
+        'health_check_id',
+    )
+
     def __init__(
         self,
         provider,
@@ -612,6 +689,7 @@ class _Route53DynamicValue(_Route53Record):
         self.health_check_id = provider.get_health_check_id(
             record, self.value, self.status, creating
         )
+        self._hash = hash((self.fqdn, self._type, self.identifer))
 
     @property
     def identifer(self):
@@ -646,9 +724,6 @@ class _Route53DynamicValue(_Route53Record):
 
         return ret
 
-    def __hash__(self):
-        return f'{self.fqdn}:{self._type}:{self.identifer}'.__hash__()
-
     def __repr__(self):
         return f'_Route53DynamicValue<{self.fqdn} {self._type} {self.identifer} {self.value}>'
 
@@ -730,6 +805,296 @@ def _mod_keyer(mod):
     return (action_priority, record_priority, unique_id)
 
 
+def _mod_cost(mod):
+    '''
+    Returns the (ResourceRecords, characters) that a mod counts against the
+    limits of a ChangeBatch.
+    '''
+    records = mod['ResourceRecordSet'].get('ResourceRecords')
+    if records:
+        rrs = len(records)
+        chars = sum(len(r['Value']) for r in records)
+    else:
+        # alias rrsets have no values, but they're still a change so we count
+        # them as one to be safe
+        rrs = 1
+        chars = 0
+    if mod['Action'] == 'UPSERT':
+        # Route53 counts UPSERTs twice, once for the delete and once for the
+        # create
+        rrs *= 2
+        chars *= 2
+    return rrs, chars
+
+
+def _batch_mods(mod_groups, max_rrs, max_chars):
+    '''
+    Packs groups of mods, one group per change, into ChangeBatches that
+    respect Route53's limits on ResourceRecords and characters.
+
+    Groups are kept in order and, whenever possible, whole. Filling each batch
+    as full as possible before moving on results in the fewest batches that
+    preserve that order. A group that is too big to fit in any batch is split
+    up mod by mod, the mods must already be ordered by `_mod_keyer`, so that
+    the things it depends on are always sent in an earlier batch.
+
+    Yields (batch, rrs, chars) tuples.
+    '''
+    batch = []
+    batch_rrs = batch_chars = 0
+    for mods in mod_groups:
+        costs = [_mod_cost(m) for m in mods]
+        rrs = sum(c[0] for c in costs)
+        chars = sum(c[1] for c in costs)
+
+        if batch_rrs + rrs <= max_rrs and batch_chars + chars <= max_chars:
+            batch.extend(mods)
+            batch_rrs += rrs
+            batch_chars += chars
+            continue
+
+        if rrs <= max_rrs and chars <= max_chars:
+            # the group will fit in a batch of its own, start a new one
+            # rather than splitting it up
+            yield batch, batch_rrs, batch_chars
+            batch = list(mods)
+            batch_rrs = rrs
+            batch_chars = chars
+            continue
+
+        # make sure every mod can be sent before we send any of them
+        for mod, (rrs, chars) in zip(mods, costs):
+            if rrs > max_rrs or chars > max_chars:
+                rrset = mod['ResourceRecordSet']
+                raise Route53ProviderException(
+                    f'Too many modifications for {rrset["Name"]} '
+                    f'{rrset["Type"]}: {rrs} ResourceRecords, {chars} '
+                    'characters'
+                )
+
+        for mod, (rrs, chars) in zip(mods, costs):
+            if batch_rrs + rrs > max_rrs or batch_chars + chars > max_chars:
+                yield batch, batch_rrs, batch_chars
+                batch = []
+                batch_rrs = batch_chars = 0
+            batch.append(mod)
+            batch_rrs += rrs
+            batch_chars += chars
+
+    if batch:
+        yield batch, batch_rrs, batch_chars
+
+
+def _health_check_ip_address(value):
+    try:
+        return ip_address(str(value))
+    except ValueError:
+        return value
+
+
+class _HealthCheckIndex:
+    '''
+    Secondary indexes over a dict of health check id -> health check so that
+    lookups don't have to scan every health check in the account.
+    '''
+
+    def __init__(self, health_checks):
+        self.source = health_checks
+        # CallerReference prefix, everything but the trailing uuid, -> checks
+        self.by_prefix = defaultdict(dict)
+        # (record type, record fqdn) -> checks
+        self.by_record = defaultdict(dict)
+        # (legacy record type, host) -> checks
+        self.by_legacy = defaultdict(dict)
+        # (CallerReference prefix, config w/o IPAddress) -> [(ip, id), ...]
+        self.by_config = defaultdict(list)
+        # id -> position, used to keep results in the source's order
+        self.order = {}
+        self._positions = count()
+        # id -> the keys it's indexed under, so that it can be removed
+        self._keys = {}
+
+        for id, health_check in health_checks.items():
+            self.add(id, health_check)
+
+    @staticmethod
+    def config_key(
+        host,
+        path,
+        protocol,
+        port,
+        measure_latency,
+        request_interval,
+        failure_threshold,
+        disabled,
+        inverted,
+    ):
+        return (
+            host,
+            path,
+            protocol,
+            port,
+            measure_latency,
+            request_interval,
+            failure_threshold,
+            disabled,
+            inverted,
+        )
+
+    def add(self, id, health_check):
+        if id not in self.order:
+            self.order[id] = next(self._positions)
+
+        ref = health_check['CallerReference']
+        prefix = ref.rsplit(':', 1)[0]
+        self.by_prefix[prefix][id] = health_check
+        record_key = legacy_key = None
+
+        pieces = ref.split(':', 2)
+        if len(pieces) == 3 and len(pieces[0]) == 4 and pieces[0].isdigit():
+            version, _type, rest = pieces
+            if ':' in rest:
+                fqdn = rest.rsplit(':', 1)[0]
+                record_key = (_type, fqdn)
+                self.by_record[record_key][id] = health_check
+            if version == '0000':
+                host = health_check['HealthCheckConfig'].get(
+                    'FullyQualifiedDomainName'
+                )
+                legacy_key = (_type, host)
+                self.by_legacy[legacy_key][id] = health_check
+
+        config = health_check['HealthCheckConfig']
+        key = self.config_key(
+            config.get('FullyQualifiedDomainName'),
+            config.get('ResourcePath'),
+            config.get('Type'),
+            config.get('Port'),
+            config.get('MeasureLatency'),
+            config.get('RequestInterval'),
+            config.get('FailureThreshold'),
+            config.get('Disabled'),
+            config.get('Inverted'),
+        )
+        ip = config.get('IPAddress')
+        if ip is not None:
+            ip = _health_check_ip_address(ip)
+        self.by_config[(prefix, key)].append((ip, id))
+        self._keys[id] = (prefix, record_key, legacy_key, (prefix, key))
+
+    def remove(self, id):
+        try:
+            prefix, record_key, legacy_key, config_key = self._keys.pop(id)
+        except KeyError:
+            # not something we've indexed
+            return
+        del self.order[id]
+        self.by_prefix[prefix].pop(id)
+        if record_key is not None:
+            self.by_record[record_key].pop(id)
+        if legacy_key is not None:
+            self.by_legacy[legacy_key].pop(id)
+        self.by_config[config_key] = [
+            entry for entry in self.by_config[config_key] if entry[1] != id
+        ]
+
+    def find(self, prefix, key, value):
+        # So interestingly Route53 normalizes IPv6 addresses to a funky, but
+        # valid, form which will cause us to fail to find see things as
+        # equivalent. To work around this we'll ip_address's returned objects
+        # for equivalence.
+        # E.g 2001:4860:4860:0:0:0:0:8842 -> 2001:4860:4860::8842
+        # When we don't have a value any IPAddress, or lack thereof, is a
+        # match.
+        if value is not None:
+            value = _health_check_ip_address(value)
+        for ip, id in self.by_config.get((prefix, key), ()):
+            if value is None or value == ip:
+                return id
+        return None
+
+    def for_record(self, _type, fqdn, legacy_host):
+        '''
+        Returns (id, current, legacy) for each of the health checks that
+        belong to the record, current checks are those with our CallerReference
+        format and legacy ones those created by the pre-versioned format.
+        '''
+        current = self.by_record.get((_type, fqdn), {})
+        legacy = self.by_legacy.get((_type, legacy_host), {})
+        ids = sorted(set(current) | set(legacy), key=self.order.__getitem__)
+        return [(id, id in current, id in legacy) for id in ids]
+
+
+def _rrset_key(rrset):
+    return (
+        _octal_replace(rrset['Name']),
+        rrset['Type'],
+        rrset.get('SetIdentifier'),
+    )
+
+
+def _normalize_rrset(rrset):
+    # Route53 escapes some characters in names and doesn't necessarily return
+    # values in the order we sent them
+    rrset = dict(rrset)
+    rrset['Name'] = _octal_replace(rrset['Name'])
+    if 'ResourceRecords' in rrset:
+        rrset['ResourceRecords'] = sorted(
+            r['Value'] for r in rrset['ResourceRecords']
+        )
+    return rrset
+
+
+class _ZoneRRSetIndex:
+    '''
+    Indexes a zone's rrsets by their identity and by the dynamic record they
+    belong to so that checking a record only has to look at its own rrsets.
+    '''
+
+    def __init__(self, rrsets):
+        self.source = rrsets
+        self._rrsets = None
+        # (record fqdn, type) -> subnet rule rrsets
+        self.cidr_rules = defaultdict(list)
+        # (record fqdn, type) -> non-default pool value rrsets
+        self.values = defaultdict(list)
+
+        for rrset in rrsets:
+            if 'CidrRoutingConfig' in rrset:
+                target = rrset.get('AliasTarget', {}).get('DNSName', '')
+                if target.startswith('_octodns-'):
+                    # subnet rules point at _octodns-<pool>-pool.<fqdn>
+                    fqdn = target.split('.', 1)[1]
+                    self.cidr_rules[(fqdn, rrset['Type'])].append(rrset)
+                continue
+
+            name = rrset['Name']
+            # Break off the first piece of the name, it'll let us figure out if
+            # this is an rrset we're interested in.
+            maybe_meta, rest = name.split('.', 1)
+            if (
+                maybe_meta.startswith('_octodns-')
+                and maybe_meta.endswith('-value')
+                and '-default-' not in name
+            ):
+                # We're only interested in non-default dynamic value records,
+                # as that's where healthchecks live
+                self.values[(rest, rrset['Type'])].append(rrset)
+
+    @property
+    def rrsets(self):
+        '''
+        (name, type, set identifier) -> normalized rrset, only needed when
+        applying updates so it's built on first use rather than at plan time.
+        '''
+        if self._rrsets is None:
+            self._rrsets = {
+                _rrset_key(rrset): _normalize_rrset(rrset)
+                for rrset in self.source
+            }
+        return self._rrsets
+
+
 def _parse_pool_name(n):
     # Parse the pool name out of _octodns-<pool-name>-pool...
     return n.split('.', 1)[0][9:-5]
@@ -785,6 +1150,32 @@ class Route53Provider(_AuthMixin, BaseProvider):
     # health check config.
     HEALTH_CHECK_VERSION = '0001'
 
+    # Route53's API is limited to 5 requests per second per account
+    # https://docs.aws.amazon.com/Route53/latest/DeveloperGuide/DNSLimitations.html#limits-api-requests
+    API_RATE_LIMIT = 5
+
+    # Bounds, in seconds, of the back-off used when polling for changes to
+    # become INSYNC
+    INSYNC_POLL_MIN = 1
+    INSYNC_POLL_MAX = 30
+
+    # Number of health checks to fetch, or delete, concurrently
+    HEALTH_CHECK_WORKERS = 4
+
+    # Number of VPCs to list the zones of concurrently
+    VPC_WORKERS = 4
+
+    # Route53 limits the total number of characters in all of the Value
+    # elements of a single ChangeBatch
+    # https://docs.aws.amazon.com/Route53/latest/DeveloperGuide/DNSLimitations.html#limits-api-requests-changeresourcerecordsets
+    MAX_CHANGE_CHARS = 32000
+
+    # Route53 limits the number of changes, and of CIDR blocks in each, in a
+    # single ChangeCidrCollection request
+    # https://docs.aws.amazon.com/Route53/latest/APIReference/API_ChangeCidrCollection.html
+    MAX_CIDR_CHANGES = 1000
+    MAX_CIDR_BLOCKS = 1000
+
     def __init__(
         self,
         id,
@@ -800,10 +1191,44 @@ class Route53Provider(_AuthMixin, BaseProvider):
         private=None,
         vpc_id=None,
         vpc_region=None,
+        vpcs=None,
         vpc_multi_action='error',
+        prefetch_workers=None,
+        rate_limit=None,
+        rate_limit_burst=None,
+        rate_limit_group=None,
+        cache_path=None,
+        cache_ttl=3600,
+        zone_cache_ttl=None,
+        wait_for_insync=False,
+        insync_workers=4,
+        insync_timeout=900,
+        role_session_name=None,
         *args,
         **kwargs,
     ):
+        # Validate vpcs configuration, the first is used like vpc_id
+        if vpcs is not None:
+            if vpc_id is not None:
+                raise Route53ProviderException(
+                    'vpcs cannot be used with vpc_id'
+                )
+            if (
+                not isinstance(vpcs, list)
+                or not vpcs
+                or not all(
+                    isinstance(vpc, dict) and 'id' in vpc and 'region' in vpc
+                    for vpc in vpcs
+                )
+            ):
+                raise Route53ProviderException(
+                    'vpcs must be a list of VPCs, each with an id and region'
+                )
+            vpc_id = vpcs[0]['id']
+            vpc_region = vpcs[0]['region']
+        elif vpc_id is not None:
+            vpcs = [{'id': vpc_id, 'region': vpc_region}]
+
         # Validate vpc_id configuration
         if vpc_id is not None:
             if vpc_region is None:
@@ -825,6 +1250,22 @@ class Route53Provider(_AuthMixin, BaseProvider):
                 "vpc_multi_action must be 'error', 'warn', or 'ignore'"
             )
 
+        if get_zones_by_name not in (True, False, 'auto'):
+            raise Route53ProviderException(
+                "get_zones_by_name must be true, false, or 'auto'"
+            )
+
+        if prefetch_workers is not None and (
+            not isinstance(prefetch_workers, int) or prefetch_workers < 1
+        ):
+            raise Route53ProviderException(
+                'prefetch_workers must be a positive integer'
+            )
+        if not isinstance(insync_workers, int) or insync_workers < 1:
+            raise Route53ProviderException(
+                'insync_workers must be a positive integer'
+            )
+
         # Validate delegation_set_id and private compatibility
         if delegation_set_id is not None and private is True:
             raise Route53ProviderException(
@@ -838,13 +1279,22 @@ class Route53Provider(_AuthMixin, BaseProvider):
         self.private = private
         self.vpc_id = vpc_id
         self.vpc_region = vpc_region
+        self.vpcs = vpcs
         self.vpc_multi_action = vpc_multi_action
+        self.prefetch_workers = prefetch_workers
+        self.wait_for_insync = wait_for_insync
+        self.insync_workers = insync_workers
+        self.insync_timeout = insync_timeout
 
         self.log = logging.getLogger(f'Route53Provider[{id}]')
         self.log.info(
             '__init__: id=%s, access_key_id=%s, max_changes=%d, '
             'delegation_set_id=%s, get_zones_by_name=%s, vpc_id=%s, '
-            'vpc_region=%s, vpc_multi_action=%s',
+            'vpc_region=%s, vpcs=%s, vpc_multi_action=%s, '
+            'prefetch_workers=%s, '
+            'rate_limit=%s, rate_limit_burst=%s, rate_limit_group=%s, '
+            'cache_path=%s, cache_ttl=%s, zone_cache_ttl=%s, '
+            'wait_for_insync=%s, insync_workers=%d, insync_timeout=%s',
             id,
             access_key_id,
             max_changes,
@@ -852,10 +1302,45 @@ class Route53Provider(_AuthMixin, BaseProvider):
             get_zones_by_name,
             vpc_id,
             vpc_region,
+            vpcs,
             vpc_multi_action,
+            prefetch_workers,
+            rate_limit,
+            rate_limit_burst,
+            rate_limit_group,
+            cache_path,
+            cache_ttl,
+            zone_cache_ttl,
+            wait_for_insync,
+            insync_workers,
+            insync_timeout,
         )
         super().__init__(id, *args, **kwargs)
 
+        # Health checks, VPC zone listings, and more, are always worked on
+        # concurrently so we need to make sure that our requests collectively
+        # stay under the account's API rate limit. Without an explicit
+        # rate_limit that's the API's, shared by everyone using the same
+        # credentials, i.e. the same account, and so also the same client
+        try:
+            if rate_limit is None:
+                self._rate_limiter = _TokenBucket.shared(
+                    rate_limit_group
+                    or f'route53:{profile}:{access_key_id}:{role_arn}',
+                    self.API_RATE_LIMIT,
+                    rate_limit_burst,
+                )
+            elif rate_limit_group:
+                self._rate_limiter = _TokenBucket.shared(
+                    rate_limit_group, rate_limit, rate_limit_burst
+                )
+            else:
+                self._rate_limiter = _TokenBucket(
+                    rate_limit, rate_limit_burst, name=id
+                )
+        except ValueError as e:
+            raise Route53ProviderException(str(e))
+
         self._conn = self.client(
             service_name='route53',
             access_key_id=access_key_id,
@@ -864,14 +1349,93 @@ class Route53Provider(_AuthMixin, BaseProvider):
             role_arn=role_arn,
             profile=profile,
             client_max_attempts=client_max_attempts,
+            rate_limiter=self._rate_limiter,
+            role_session_name=role_session_name,
         )
 
+        self._cache = None
+        if cache_path is not None:
+            self._cache = _SnapshotCache(cache_path, cache_ttl)
+        # The zone catalog is only persisted when asked, without its fresh
+        # record counts every cached zone's count has to be looked up
+        self._zone_cache = None
+        if cache_path is not None and zone_cache_ttl is not None:
+            self._zone_cache = _SnapshotCache(cache_path, zone_cache_ttl)
+
         self._r53_zones = None
+        # Whether _r53_zones came from the zone catalog, and thus holds every
+        # zone there is
+        self._r53_zones_listed = False
+        # Request counts used to choose between looking zones up by name and
+        # listing them, see _use_zones_by_name
+        self._zones_by_name_requests = 0
+        self._zone_catalog_requests = None
+        # Cache: zone_id -> ResourceRecordSetCount, used to validate the
+        # persistent rrset cache
+        self._r53_zone_record_counts = {}
         self._r53_rrsets = {}
+        self._r53_rrset_indexes = {}  # Cache: zone_id -> _ZoneRRSetIndex
         self._health_checks = None
+        # Cache: health check id -> health check, or None if there isn't one
+        # of ours, used until the full list is needed
+        self._health_checks_by_id = {}
+        self._health_check_index = None
+        # The account's total number of health checks, used to validate the
+        # persistent health check cache
+        self._health_check_count = None
+        # Cache: {'delegated': bool, 'zones': [zone]}, see _load_zone_catalog
+        self._zone_catalog = None
+        # Cache: [zone], those in our delegation set, see _load_delegated_zones
+        self._delegated_zones = None
         self._vpc_zone_ids = None  # Cache of zone IDs associated with vpc_id
-        self._multi_vpc_zones = None  # Cache: {zone_id: [vpc_ids]}
+        self._multi_vpc_zones = {}  # Cache: {zone_id: [vpc_ids]}
         self._cidr_collections = {}  # Cache: collection_id -> {loc: [cidrs]}
+        # Cache: collection name -> collection_id, or None if there isn't one
+        self._cidr_collection_ids = {}
+        # Cache: collection_id -> Version, used to validate the persistent
+        # CIDR block cache
+        self._cidr_collection_versions = {}
+        # CIDR locations, {loc: [cidrs]}, needed by the zones that have been
+        # planned, created all together by the first apply that needs any
+        self._planned_cidr_locations = {}
+        # Zones may be planned and applied concurrently, the caches above are
+        # loaded under these so that each thing is only ever loaded once
+        self._locks = _KeyedLocks()
+        # State that belongs to a single _apply, and thus thread
+        self._apply_state = local()
+
+    @property
+    def _health_check_queue(self):
+        # While looking ahead in _apply: (expected_ref, value, config) ->
+        # health check that needs creating
+        return getattr(self._apply_state, 'health_check_queue', None)
+
+    @_health_check_queue.setter
+    def _health_check_queue(self, queue):
+        self._apply_state.health_check_queue = queue
+
+    @property
+    def _health_check_gc(self):
+        # Ids of health checks that are no longer in use, they're deleted
+        # once the changes that stop referencing them have been submitted
+        try:
+            return self._apply_state.health_check_gc
+        except AttributeError:
+            gc = self._apply_state.health_check_gc = set()
+            return gc
+
+    def _log_rate_limit_stats(self, context, level=logging.DEBUG):
+        stats = self._rate_limiter.stats()
+        self.log.log(
+            level,
+            '%s:   rate limit requests=%d, waits=%d, wait_time=%.3fs, '
+            'throttles=%d',
+            context,
+            stats['requests'],
+            stats['waits'],
+            stats['wait_time'],
+            stats['throttles'],
+        )
 
     def _get_zone_id_by_name(self, name):
         # attempt to get zone by name
@@ -898,56 +1462,251 @@ class Route53Provider(_AuthMixin, BaseProvider):
                             f'Multiple zones named "{z["Name"]}" were found.'
                         )
                     id = z['Id']
+                    self._r53_zone_record_counts[id] = z.get(
+                        'ResourceRecordSetCount'
+                    )
                     self.log.debug('get_zones_by_name:   id=%s', id)
         return id
 
-    def _get_zones_by_vpc(self):
+    def _list_zones_by_vpc(self, vpc):
         '''
-        Returns a dict of zone_name -> zone_id for zones associated with
-        self.vpc_id. Uses list_hosted_zones_by_vpc API which requires
-        VPCId and VPCRegion.
+        Returns a list of (zone_id, zone_name) for the zones associated with
+        `vpc`. Uses list_hosted_zones_by_vpc API which requires VPCId and
+        VPCRegion.
         '''
-        self.log.debug('_get_zones_by_vpc: vpc_id=%s', self.vpc_id)
+        self.log.debug(
+            '_list_zones_by_vpc: vpc_id=%s, vpc_region=%s',
+            vpc['id'],
+            vpc['region'],
+        )
 
-        zones = {}
+        zones = []
         more = True
         next_token = None
 
         while more:
-            params = {'VPCId': self.vpc_id, 'VPCRegion': self.vpc_region}
+            params = {'VPCId': vpc['id'], 'VPCRegion': vpc['region']}
             if next_token:
                 params['NextToken'] = next_token
 
             resp = self._conn.list_hosted_zones_by_vpc(**params)
 
             for zone_summary in resp.get('HostedZoneSummaries', []):
-                zone_id = zone_summary['HostedZoneId']
-                zone_name = _octal_replace(zone_summary['Name'])
-
-                zone_id = self._normalize_zone_id(zone_id)
-
-                if zone_name in zones:
-                    raise Route53ProviderException(
-                        f'Multiple zones named "{zone_name}" were found.'
+                zones.append(
+                    (
+                        self._normalize_zone_id(zone_summary['HostedZoneId']),
+                        _octal_replace(zone_summary['Name']),
                     )
-                zones[zone_name] = zone_id
+                )
 
             next_token = resp.get('NextToken')
             more = next_token is not None
 
         return zones
 
+    def _get_zones_by_vpc(self):
+        '''
+        Returns catalog entries for the zones associated with any of
+        self.vpcs, each with which of them it's associated with. The VPCs are
+        listed concurrently.
+        '''
+        self.log.debug(
+            '_get_zones_by_vpc: vpcs=%d, workers=%d',
+            len(self.vpcs),
+            self.VPC_WORKERS,
+        )
+        with ThreadPoolExecutor(max_workers=self.VPC_WORKERS) as pool:
+            listings = list(pool.map(self._list_zones_by_vpc, self.vpcs))
+
+        zones = {}
+        for vpc, listing in zip(self.vpcs, listings):
+            for zone_id, zone_name in listing:
+                try:
+                    zones[zone_id]['vpcs'].append(vpc['id'])
+                except KeyError:
+                    zones[zone_id] = {
+                        'id': zone_id,
+                        'name': zone_name,
+                        # zones associated with a VPC are always private
+                        'private': True,
+                        'delegation_set_id': None,
+                        # the summaries don't include a record count
+                        'record_count': None,
+                        # only those of self.vpcs, there may be others
+                        'vpcs': [vpc['id']],
+                    }
+        self.log.debug(
+            '_get_zones_by_vpc: found %d zones in %d VPCs',
+            len(zones),
+            len(self.vpcs),
+        )
+        return list(zones.values())
+
+    def _get_zones(self, **params):
+        '''
+        Returns catalog entries for the zones list_hosted_zones returns when
+        called with `params`.
+        '''
+        zones = []
+        more = True
+        while more:
+            resp = self._conn.list_hosted_zones(**params)
+            for z in resp['HostedZones']:
+                zones.append(
+                    {
+                        'id': z['Id'],
+                        'name': _octal_replace(z['Name']),
+                        'private': z.get('Config', {}).get(
+                            'PrivateZone', False
+                        ),
+                        'delegation_set_id': params.get('DelegationSetId'),
+                        'record_count': z.get('ResourceRecordSetCount'),
+                        # only available when listing by VPC
+                        'vpcs': None,
+                    }
+                )
+            more = resp['IsTruncated']
+            params['Marker'] = resp.get('NextMarker', None)
+        return zones
+
+    @property
+    def _zone_catalog_key(self):
+        if self.vpc_id is None:
+            return f'{self.id}:hosted-zones'
+        vpc_ids = ','.join(vpc['id'] for vpc in self.vpcs)
+        return f'{self.id}:hosted-zones:{vpc_ids}'
+
+    def _store_zone_catalog(self):
+        if self._zone_cache is not None:
+            self._zone_cache.put(self._zone_catalog_key, self._zone_catalog)
+
+    def _add_to_zone_catalog(self, id, name, delegation_set_id):
+        zone = {
+            'id': id,
+            'name': name,
+            'private': self.vpc_id is not None or bool(self.private),
+            'delegation_set_id': delegation_set_id,
+            'record_count': None,
+            'vpcs': None if self.vpc_id is None else [self.vpc_id],
+        }
+        with self._locks('zone-catalog'):
+            if self._delegated_zones is not None and delegation_set_id:
+                self._delegated_zones.append(zone)
+            if self._zone_catalog is None:
+                # we never listed, but a cached catalog would now be missing
+                # the zone
+                if self._zone_cache is not None:
+                    self._zone_cache.delete(self._zone_catalog_key)
+                return
+            self._zone_catalog['zones'].append(zone)
+            self._store_zone_catalog()
+
+    def _cached_zone_catalog(self):
+        '''
+        Returns the catalog if it's already been loaded, or can be from the
+        cache, without listing anything. Must be called under the
+        zone-catalog lock.
+        '''
+        if self._zone_catalog is None and self._zone_cache is not None:
+            catalog = self._zone_cache.get(self._zone_catalog_key)
+            if catalog is not None:
+                self.log.debug('_cached_zone_catalog: cache hit')
+                self._zone_catalog = catalog
+                if self.vpc_id is not None:
+                    self._map_zone_vpcs(catalog['zones'])
+        return self._zone_catalog
+
+    def _mark_delegated_zones(self, catalog):
+        ids = set(z['id'] for z in self._delegated_zones)
+        for zone in catalog['zones']:
+            if zone['id'] in ids:
+                zone['delegation_set_id'] = self.delegation_set_id
+        catalog['delegated'] = True
+
+    def _load_zone_catalog(self):
+        '''
+        Returns the catalog of the hosted zones we can see, listed at most once
+        per run, or not at all when there's a fresh copy in the cache. Each zone
+        is a dict with its id, name, private flag, delegation set, when known,
+        record count, when known, and, when listed by VPC, which of our VPCs
+        it's associated with.
+
+        Filtering, by privacy, delegation set, or name, is done in memory by
+        the callers so that they all share the one listing. Delegation sets
+        aren't part of the listing, the zones in ours are marked once they've
+        been listed by _load_delegated_zones.
+        '''
+        with self._locks('zone-catalog'):
+            if self._cached_zone_catalog() is None:
+                self.log.debug('_load_zone_catalog: listing')
+                if self.vpc_id is not None:
+                    zones = self._get_zones_by_vpc()
+                else:
+                    zones = self._get_zones()
+                # the counts are only trustworthy when they're fresh, a
+                # cached catalog must not validate cached rrsets
+                for zone in zones:
+                    self._r53_zone_record_counts[zone['id']] = zone[
+                        'record_count'
+                    ]
+                catalog = {'delegated': False, 'zones': zones}
+                if self._delegated_zones is not None:
+                    self._mark_delegated_zones(catalog)
+                self._zone_catalog = catalog
+                self._store_zone_catalog()
+                if self.vpc_id is not None:
+                    self._map_zone_vpcs(zones)
+            return self._zone_catalog
+
+    def _load_delegated_zones(self):
+        '''
+        Returns catalog entries for the zones in our delegation set. When the
+        catalog has already been marked with them they come from there,
+        otherwise they're listed, once, on their own, without listing all of
+        the account's zones.
+        '''
+        with self._locks('zone-catalog'):
+            if self._delegated_zones is None:
+                catalog = self._cached_zone_catalog()
+                if catalog is not None and catalog['delegated']:
+                    self._delegated_zones = [
+                        z
+                        for z in catalog['zones']
+                        if z['delegation_set_id'] == self.delegation_set_id
+                    ]
+                else:
+                    self.log.debug(
+                        '_load_delegated_zones: listing delegation_set_id=%s',
+                        self.delegation_set_id,
+                    )
+                    zones = self._get_zones(
+                        DelegationSetId=self.delegation_set_id
+                    )
+                    for zone in zones:
+                        self._r53_zone_record_counts[zone['id']] = zone[
+                            'record_count'
+                        ]
+                    self._delegated_zones = zones
+                    if catalog is not None:
+                        self._mark_delegated_zones(catalog)
+                        self._store_zone_catalog()
+            return self._delegated_zones
+
     @property
     def vpc_zone_ids(self):
         '''
-        Returns a set of zone IDs associated with self.vpc_id.
-        Lazy-loaded on first access via list_hosted_zones_by_vpc().
+        Returns a set of zone IDs associated with any of self.vpcs.
+        Lazy-loaded on first access via the zone catalog.
         '''
-        if self._vpc_zone_ids is None and self.vpc_id is not None:
-            self.log.debug('vpc_zone_ids: loading for vpc_id=%s', self.vpc_id)
-            zones = self._get_zones_by_vpc()
-            self._vpc_zone_ids = set(zones.values())
-        return self._vpc_zone_ids
+        with self._locks('vpc-zone-ids'):
+            if self._vpc_zone_ids is None and self.vpc_id is not None:
+                self.log.debug(
+                    'vpc_zone_ids: loading for vpc_id=%s', self.vpc_id
+                )
+                self._vpc_zone_ids = set(
+                    z['id'] for z in self._load_zone_catalog()['zones']
+                )
+            return self._vpc_zone_ids
 
     def _normalize_zone_id(self, zone_id):
         '''
@@ -966,94 +1725,180 @@ class Route53Provider(_AuthMixin, BaseProvider):
         return zone_id
 
     def _zone_has_vpc(self, zone_id):
-        '''Check if a zone is associated with self.vpc_id using cached data'''
+        '''Check if a zone is associated with self.vpcs using cached data'''
         return self._normalize_zone_id(zone_id) in self.vpc_zone_ids
 
+    def _map_zone_vpcs(self, zones):
+        '''
+        Zones associated with more than one of our VPCs are known to be shared
+        without having to ask Route53 about each of them. Those associated
+        with just one of ours may be associated with others and are still
+        looked up by _get_zone_vpcs.
+        '''
+        with self._locks('multi-vpc-zones'):
+            for zone in zones:
+                if len(zone['vpcs']) > 1:
+                    self._multi_vpc_zones.setdefault(zone['id'], zone['vpcs'])
+
     def _get_zone_vpcs(self, zone_id):
         '''Get list of VPCs for a zone, with caching.'''
-        if self._multi_vpc_zones is None:
-            self._multi_vpc_zones = {}
-        if zone_id not in self._multi_vpc_zones:
+        # a zone's lookup doesn't hold up other zones, the shared lock only
+        # guards the dict itself
+        with self._locks(f'multi-vpc-zones:{zone_id}'):
+            with self._locks('multi-vpc-zones'):
+                try:
+                    return self._multi_vpc_zones[zone_id]
+                except KeyError:
+                    pass
             resp = self._conn.get_hosted_zone(Id=zone_id)
-            self._multi_vpc_zones[zone_id] = [
-                vpc.get('VPCId') for vpc in resp.get('VPCs', [])
-            ]
-        return self._multi_vpc_zones[zone_id]
+            vpcs = [vpc.get('VPCId') for vpc in resp.get('VPCs', [])]
+            with self._locks('multi-vpc-zones'):
+                return self._multi_vpc_zones.setdefault(zone_id, vpcs)
+
+    def _list_hosted_zones(self, delegated=False):
+        '''
+        Returns a dict of zone_name -> zone_id for the zones in the catalog
+        that match our filters, when `delegated` is set that includes being in
+        our delegation set.
+        '''
+        if delegated and self.delegation_set_id is not None:
+            catalog_zones = self._load_delegated_zones()
+        else:
+            catalog_zones = self._load_zone_catalog()['zones']
+        zones = {}
+        for z in catalog_zones:
+            if self.private is not None and self.private != z['private']:
+                continue
+            zname = z['name']
+            if zname in zones:
+                raise Route53ProviderException(
+                    f'Multiple zones named "{zname}" were found.'
+                )
+            zones[zname] = z['id']
+        return zones
+
+    def _use_zones_by_name(self):
+        '''
+        Whether zones should be looked up one at a time by name rather than
+        found in the catalog of all of them.
+
+        With get_zones_by_name: auto we don't know how many zones we'll be
+        asked for so we look them up by name until doing so has cost as many
+        requests as listing all of the zones would, and then list them. That
+        never costs more than twice the cheaper of the two.
+        '''
+        if self.get_zones_by_name != 'auto':
+            return self.get_zones_by_name
+        if self.vpc_id is not None:
+            # by name lookups are filtered with the catalog of the VPC's zones
+            return False
+        with self._locks('zone-catalog'):
+            if self._zone_catalog is not None or (
+                self._zone_cache is not None
+                and self._zone_cache.get(self._zone_catalog_key) is not None
+            ):
+                # we already have the catalog
+                return False
+        if self._zone_catalog_requests is None:
+            count = self._conn.get_hosted_zone_count()['HostedZoneCount']
+            # list_hosted_zones returns up to 100 zones per page
+            self._zone_catalog_requests = max((count + 99) // 100, 1)
+            self.log.info(
+                'get_zones_by_name: auto, %d hosted zones take %d requests to '
+                'list, looking zones up by name until that many have been',
+                count,
+                self._zone_catalog_requests,
+            )
+        return self._zones_by_name_requests < self._zone_catalog_requests
+
+    def _load_r53_zones(self):
+        zones = self._list_hosted_zones()
+        if self._r53_zones:
+            # keep any we've created since listing
+            for name, id in list(self._r53_zones.items()):
+                if id is not None:
+                    zones.setdefault(name, id)
+        self._r53_zones = zones
+        self._r53_zones_listed = True
+        if self.prefetch_workers:
+            self._prefetch_records()
 
     def update_r53_zones(self, name):
-        if self._r53_zones is None:
-            if self.get_zones_by_name:
+        with self._locks('r53-zones'):
+            if self._r53_zones is None:
+                if self._use_zones_by_name():
+                    self._r53_zones = {}
+                else:
+                    self._load_r53_zones()
+            if (
+                name in self._r53_zones
+                or self.get_zones_by_name is False
+                or self._r53_zones_listed
+            ):
+                return
+
+        # zones are looked up concurrently, but each only once
+        with self._locks(f'zone:{name}'):
+            if name in self._r53_zones:
+                return
+            with self._locks('r53-zones'):
+                by_name = self._use_zones_by_name()
+                if by_name:
+                    self._zones_by_name_requests += 1
+                elif not self._r53_zones_listed:
+                    self.log.info(
+                        'get_zones_by_name: auto, looked up %d zones by name, '
+                        'listing them instead',
+                        self._zones_by_name_requests,
+                    )
+                    self._load_r53_zones()
+            if by_name:
+                # the lookup is made without holding up other zones, but
+                # _r53_zones may have been replaced by a listing meanwhile so
+                # it's only updated under the lock
                 id = self._get_zone_id_by_name(name)
-                zones = {}
-                zones[name] = id
-                self._r53_zones = zones
-            elif self.vpc_id is not None:
+                with self._locks('r53-zones'):
+                    self._r53_zones[name] = id
                 self.log.debug(
-                    'r53_zones: loading by vpc_id=%s, vpc_region=%s',
-                    self.vpc_id,
-                    self.vpc_region,
+                    'get_zones_by_name: looked up %d zones by name',
+                    self._zones_by_name_requests,
                 )
-                self._r53_zones = self._get_zones_by_vpc()
-            else:
-                self.log.debug('r53_zones: loading')
-                zones = {}
-                more = True
-                start = {}
-                while more:
-                    resp = self._conn.list_hosted_zones(**start)
-                    for z in resp['HostedZones']:
-                        private_zone = z.get('Config', {}).get(
-                            'PrivateZone', False
-                        )
-                        if (
-                            self.private is not None
-                            and self.private != private_zone
-                        ):
-                            continue
-                        zname = _octal_replace(z['Name'])
-                        if zname in zones:
-                            raise Route53ProviderException(
-                                f'Multiple zones named "{zname}" were found.'
-                            )
-                        zones[zname] = z['Id']
-                    more = resp['IsTruncated']
-                    start['Marker'] = resp.get('NextMarker', None)
-                self._r53_zones = zones
-        else:
-            if name not in self._r53_zones and self.get_zones_by_name:
-                id = self._get_zone_id_by_name(name)
-                self._r53_zones[name] = id
 
     def _get_zone_id(self, name, create=False):
-        self.log.debug('_get_zone_id: name=%s', name)
-        self.update_r53_zones(name)
-        id = None
-        if name in self._r53_zones:
-            id = self._r53_zones[name]
-            self.log.debug('_get_zone_id:   id=%s', id)
-        if create and not id:
-            ref = uuid4().hex
-            del_set = self.delegation_set_id
-            self.log.debug(
-                '_get_zone_id:   no matching zone, creating, ref=%s', ref
-            )
-            params = {"Name": name, "CallerReference": ref}
-            if del_set:
-                params["DelegationSetId"] = del_set
-
-            # Handle VPC and private zone configuration
-            if self.vpc_id is not None:
-                # When vpc_id is specified, create as private zone with VPC
-                params["VPC"] = {
-                    "VPCId": self.vpc_id,
-                    "VPCRegion": self.vpc_region,
-                }
-            elif self.private is not None:
-                params["HostedZoneConfig"] = {"PrivateZone": self.private}
+        with self._locks(f'zone:{name}'):
+            self.log.debug('_get_zone_id: name=%s', name)
+            self.update_r53_zones(name)
+            id = None
+            if name in self._r53_zones:
+                id = self._r53_zones[name]
+                self.log.debug('_get_zone_id:   id=%s', id)
+            if create and not id:
+                ref = uuid4().hex
+                del_set = self.delegation_set_id
+                self.log.debug(
+                    '_get_zone_id:   no matching zone, creating, ref=%s', ref
+                )
+                params = {"Name": name, "CallerReference": ref}
+                if del_set:
+                    params["DelegationSetId"] = del_set
 
-            resp = self._conn.create_hosted_zone(**params)
-            self._r53_zones[name] = id = resp['HostedZone']['Id']
-        return id
+                # Handle VPC and private zone configuration
+                if self.vpc_id is not None:
+                    # When vpc_id is specified, create as private zone with VPC
+                    params["VPC"] = {
+                        "VPCId": self.vpc_id,
+                        "VPCRegion": self.vpc_region,
+                    }
+                elif self.private is not None:
+                    params["HostedZoneConfig"] = {"PrivateZone": self.private}
+
+                resp = self._conn.create_hosted_zone(**params)
+                id = resp['HostedZone']['Id']
+                # a listing may be replacing _r53_zones
+                with self._locks('r53-zones'):
+                    self._r53_zones[name] = id
+                self._add_to_zone_catalog(id, name, del_set)
+            return id
 
     def _parse_geo(self, rrset):
         loc = rrset['GeoLocation']
@@ -1198,33 +2043,130 @@ class Route53Provider(_AuthMixin, BaseProvider):
             'ttl': int(rrset['TTL']),
         }
 
-    def _load_records(self, zone_id):
-        if zone_id not in self._r53_rrsets:
-            self.log.debug('_load_records: zone_id=%s loading', zone_id)
-            rrsets = []
-            more = True
-            start = {}
-            while more:
-                resp = self._conn.list_resource_record_sets(
-                    HostedZoneId=zone_id, **start
-                )
-                rrsets += resp['ResourceRecordSets']
-                more = resp['IsTruncated']
-                if more:
-                    start = {
-                        'StartRecordName': resp['NextRecordName'],
-                        'StartRecordType': resp['NextRecordType'],
-                    }
-                    try:
-                        start['StartRecordIdentifier'] = resp[
-                            'NextRecordIdentifier'
-                        ]
-                    except KeyError:
-                        pass
+    def _iter_record_pages(self, zone_id):
+        more = True
+        start = {}
+        while more:
+            resp = self._conn.list_resource_record_sets(
+                HostedZoneId=zone_id, **start
+            )
+            yield resp['ResourceRecordSets']
+            more = resp['IsTruncated']
+            if more:
+                start = {
+                    'StartRecordName': resp['NextRecordName'],
+                    'StartRecordType': resp['NextRecordType'],
+                }
+                try:
+                    start['StartRecordIdentifier'] = resp[
+                        'NextRecordIdentifier'
+                    ]
+                except KeyError:
+                    pass
+
+    def _fetch_records(self, zone_id):
+        rrsets = []
+        for page in self._iter_record_pages(zone_id):
+            rrsets += page
+        return rrsets
+
+    def _zone_record_count(self, zone_id):
+        try:
+            count = self._r53_zone_record_counts[zone_id]
+        except KeyError:
+            count = None
+        if count is None:
+            resp = self._conn.get_hosted_zone(Id=zone_id)
+            count = resp['HostedZone']['ResourceRecordSetCount']
+            self._r53_zone_record_counts[zone_id] = count
+        return count
 
+    def _cached_records(self, zone_id):
+        if self._cache is None:
+            return None
+        rrsets = self._cache.get(
+            f'{self.id}:rrsets:{zone_id}', self._zone_record_count(zone_id)
+        )
+        if rrsets is not None:
+            self.log.debug('_cached_records: zone_id=%s cache hit', zone_id)
             self._r53_rrsets[zone_id] = rrsets
+        return rrsets
+
+    def _store_records(self, zone_id, rrsets):
+        self._r53_rrsets[zone_id] = rrsets
+        if self._cache is not None:
+            self._cache.put(
+                f'{self.id}:rrsets:{zone_id}',
+                rrsets,
+                self._zone_record_count(zone_id),
+            )
+
+    def _load_records(self, zone_id):
+        with self._locks(f'rrsets:{zone_id}'):
+            if (
+                zone_id not in self._r53_rrsets
+                and self._cached_records(zone_id) is None
+            ):
+                self.log.debug('_load_records: zone_id=%s loading', zone_id)
+                self._store_records(zone_id, self._fetch_records(zone_id))
+
+            return self._r53_rrsets[zone_id]
+
+    def _iter_records(self, zone_id, keep=True):
+        '''
+        Yields the rrsets of `zone_id`. If they haven't already been loaded
+        they're yielded a page at a time as they're listed and, when `keep` is
+        set or there's a persistent cache, stored once they've all been seen.
+        Otherwise each page is dropped as soon as it's been consumed.
+
+        The zone's lock is only held while checking for and storing the
+        rrsets, never across a yield, so a consumer that stops part way
+        through doesn't leave the zone locked.
+        '''
+        with self._locks(f'rrsets:{zone_id}'):
+            rrsets = self._r53_rrsets.get(zone_id)
+            if rrsets is None:
+                rrsets = self._cached_records(zone_id)
+        if rrsets is not None:
+            yield from rrsets
+            return
 
-        return self._r53_rrsets[zone_id]
+        self.log.debug('_iter_records: zone_id=%s streaming', zone_id)
+        keep = keep or self._cache is not None
+        rrsets = []
+        for page in self._iter_record_pages(zone_id):
+            if keep:
+                rrsets += page
+            yield from page
+        if keep:
+            with self._locks(f'rrsets:{zone_id}'):
+                if zone_id not in self._r53_rrsets:
+                    self._store_records(zone_id, rrsets)
+
+    def _rrset_index(self, zone_id, rrsets=None):
+        if rrsets is None:
+            rrsets = self._load_records(zone_id)
+        index = self._r53_rrset_indexes.get(zone_id)
+        if index is None or index.source is not rrsets:
+            self.log.debug('_rrset_index: zone_id=%s building', zone_id)
+            index = self._r53_rrset_indexes[zone_id] = _ZoneRRSetIndex(rrsets)
+        return index
+
+    def _prefetch_records(self):
+        zone_ids = [
+            zone_id
+            for zone_id in self._r53_zones.values()
+            if zone_id not in self._r53_rrsets
+        ]
+        self.log.info(
+            '_prefetch_records: loading %d zones, workers=%d',
+            len(zone_ids),
+            self.prefetch_workers,
+        )
+        # _load_records checks the cache, which may need to look up the zone's
+        # record count, and fetches under the zone's lock, in the workers
+        with ThreadPoolExecutor(max_workers=self.prefetch_workers) as pool:
+            list(pool.map(self._load_records, zone_ids))
 
     _CIDR_COLLECTION_NAME = 'octodns'
 
@@ -1235,17 +2177,28 @@ class Route53Provider(_AuthMixin, BaseProvider):
 
     def _get_cidr_collection(self):
         name = self._CIDR_COLLECTION_NAME
-        more = True
-        params = {}
-        while more:
-            resp = self._conn.list_cidr_collections(**params)
-            for collection in resp['CidrCollections']:
-                if collection['Name'] == name:
-                    return collection['Id']
-            more = 'NextToken' in resp
-            if more:
-                params['NextToken'] = resp['NextToken']
-        return None
+        with self._locks('cidr-collection'):
+            try:
+                return self._cidr_collection_ids[name]
+            except KeyError:
+                pass
+            collection_id = None
+            more = True
+            params = {}
+            while more:
+                resp = self._conn.list_cidr_collections(**params)
+                for collection in resp['CidrCollections']:
+                    self._cidr_collection_versions[collection['Id']] = (
+                        collection['Version']
+                    )
+                    if collection['Name'] == name:
+                        collection_id = collection['Id']
+                        break
+                more = collection_id is None and 'NextToken' in resp
+                if more:
+                    params['NextToken'] = resp['NextToken']
+            self._cidr_collection_ids[name] = collection_id
+            return collection_id
 
     def _create_cidr_collection(self):
         name = self._CIDR_COLLECTION_NAME
@@ -1255,55 +2208,152 @@ class Route53Provider(_AuthMixin, BaseProvider):
         return resp['Collection']['Id']
 
     def _get_or_create_cidr_collection(self):
-        collection_id = self._get_cidr_collection()
-        if collection_id is None:
-            collection_id = self._create_cidr_collection()
-        return collection_id
+        with self._locks('cidr-collection'):
+            collection_id = self._get_cidr_collection()
+            if collection_id is None:
+                collection_id = self._create_cidr_collection()
+                self._cidr_collection_ids[self._CIDR_COLLECTION_NAME] = (
+                    collection_id
+                )
+                # it's empty
+                self._cidr_collections[collection_id] = {}
+                self._cidr_collection_versions[collection_id] = 1
+            return collection_id
 
     def _load_cidr_blocks(self, collection_id):
-        if collection_id in self._cidr_collections:
-            return self._cidr_collections[collection_id]
+        with self._locks(f'cidr-blocks:{collection_id}'):
+            if collection_id in self._cidr_collections:
+                return self._cidr_collections[collection_id]
+
+            cache_key = f'{self.id}:cidr-blocks:{collection_id}'
+            version = None
+            if self._cache is not None:
+                # the collection's version changes whenever its blocks do
+                self._get_cidr_collection()
+                version = self._cidr_collection_versions.get(collection_id)
+            if version is not None:
+                result = self._cache.get(cache_key, version)
+                if result is not None:
+                    self._cidr_collections[collection_id] = result
+                    return result
+
+            blocks = defaultdict(list)
+            more = True
+            params = {'CollectionId': collection_id}
+            while more:
+                resp = self._conn.list_cidr_blocks(**params)
+                for item in resp['CidrBlocks']:
+                    blocks[item['LocationName']].append(item['CidrBlock'])
+                more = 'NextToken' in resp
+                if more:
+                    params['NextToken'] = resp['NextToken']
 
-        blocks = defaultdict(list)
-        more = True
-        params = {'CollectionId': collection_id}
-        while more:
-            resp = self._conn.list_cidr_blocks(**params)
-            for item in resp['CidrBlocks']:
-                blocks[item['LocationName']].append(item['CidrBlock'])
-            more = 'NextToken' in resp
-            if more:
-                params['NextToken'] = resp['NextToken']
+            result = dict(blocks)
+            self._cidr_collections[collection_id] = result
+            if version is not None:
+                self._cache.put(cache_key, result, version)
+            return result
 
-        result = dict(blocks)
-        self._cidr_collections[collection_id] = result
-        return result
+    def _desired_cidr_locations(self, desired):
+        locations = {}
+        for record in desired.records:
+            if not getattr(record, 'dynamic', False):
+                continue
+            for rule in record.dynamic.rules:
+                subnets = rule.data.get('subnets', [])
+                if subnets:
+                    loc = self._cidr_location_name(subnets)
+                    locations[loc] = sorted(subnets)
+        return locations
+
+    def plan(self, desired, *args, **kwargs):
+        plan = super().plan(desired, *args, **kwargs)
+        if plan is not None:
+            # the locations of every zone that'll be applied are created
+            # together by the first apply rather than a zone at a time
+            locations = self._desired_cidr_locations(plan.desired)
+            with self._locks('planned-cidr-locations'):
+                self._planned_cidr_locations.update(locations)
+        return plan
+
+    def _cidr_change_batches(self, changes):
+        batch = []
+        blocks = 0
+        for change in changes:
+            size = len(change['CidrList'])
+            if batch and (
+                len(batch) == self.MAX_CIDR_CHANGES
+                or blocks + size > self.MAX_CIDR_BLOCKS
+            ):
+                yield batch
+                batch = []
+                blocks = 0
+            batch.append(change)
+            blocks += size
+        # there's always at least one change
+        yield batch
 
     def _sync_cidr_locations(self, collection_id, desired_locations):
-        existing = self._load_cidr_blocks(collection_id)
-        changes = []
-
-        # Add/update desired locations
-        for loc_name, cidrs in desired_locations.items():
-            desired_set = set(cidrs)
-            existing_set = set(existing.get(loc_name, []))
-            # we don't/can't delete CIRD locations since they may be in use by
-            # other records or zones
-            to_add = sorted(desired_set - existing_set)
-            # PUT blocks that need to be added
-            if to_add:
-                changes.append(
-                    {
-                        'LocationName': loc_name,
-                        'Action': 'PUT',
-                        'CidrList': to_add,
-                    }
-                )
+        with self._locks(f'cidr-blocks:{collection_id}'):
+            existing = self._load_cidr_blocks(collection_id)
+
+            # along with those of any other zones that have been planned
+            with self._locks('planned-cidr-locations'):
+                locations = self._planned_cidr_locations
+                self._planned_cidr_locations = {}
+            locations.update(desired_locations)
+
+            changes = []
+            # Add/update desired locations
+            for loc_name, cidrs in locations.items():
+                desired_set = set(cidrs)
+                existing_set = set(existing.get(loc_name, []))
+                # we don't/can't delete CIRD locations since they may be in use
+                # by other records or zones
+                to_add = sorted(desired_set - existing_set)
+                # PUT blocks that need to be added, PUTs add to what's there
+                # so large locations can be split up
+                for i in range(0, len(to_add), self.MAX_CIDR_BLOCKS):
+                    changes.append(
+                        {
+                            'LocationName': loc_name,
+                            'Action': 'PUT',
+                            'CidrList': to_add[i : i + self.MAX_CIDR_BLOCKS],
+                        }
+                    )
 
-        if changes:
-            self._conn.change_cidr_collection(Id=collection_id, Changes=changes)
-            # Invalidate cache
-            self._cidr_collections.pop(collection_id, None)
+            if not changes:
+                return
+
+            self.log.debug(
+                '_sync_cidr_locations: collection_id=%s, changes=%d',
+                collection_id,
+                len(changes),
+            )
+            try:
+                for batch in self._cidr_change_batches(changes):
+                    self._conn.change_cidr_collection(
+                        Id=collection_id, Changes=batch
+                    )
+                    # Write through to the cache, each change bumps the
+                    # collection's version
+                    for change in batch:
+                        existing.setdefault(change['LocationName'], []).extend(
+                            change['CidrList']
+                        )
+                    version = self._cidr_collection_versions.get(collection_id)
+                    if version is not None:
+                        self._cidr_collection_versions[collection_id] = (
+                            version + 1
+                        )
+            finally:
+                version = self._cidr_collection_versions.get(collection_id)
+                if self._cache is not None and version is not None:
+                    self._cache.put(
+                        f'{self.id}:cidr-blocks:{collection_id}',
+                        existing,
+                        version,
+                    )
 
     def _data_for_dynamic(self, name, _type, rrsets):
         # This converts a bunch of RRSets into their corresponding dynamic
@@ -1372,7 +2422,7 @@ class Route53Provider(_AuthMixin, BaseProvider):
                 value = rrset['ResourceRecords'][0]['Value']
                 try:
                     health_check_id = rrset.get('HealthCheckId', None)
-                    health_check = self.health_checks[health_check_id]
+                    health_check = self._health_check(health_check_id)
                     health_check_config = health_check['HealthCheckConfig']
                     if (
                         health_check_config['Disabled']
@@ -1490,33 +2540,7 @@ class Route53Provider(_AuthMixin, BaseProvider):
 
     def list_zones(self):
         self.log.debug('list_zones:')
-
-        # When vpc_id is specified, use list_hosted_zones_by_vpc
-        if self.vpc_id is not None:
-            zones = self._get_zones_by_vpc()
-            return sorted(zones.keys())
-
-        hosted_zones = []
-        params = {}
-        if self.delegation_set_id:
-            params['DelegationSetId'] = self.delegation_set_id
-        more = True
-        while more:
-            resp = self._conn.list_hosted_zones(**params)
-            for h in resp['HostedZones']:
-                private_zone = h.get('Config', {}).get('PrivateZone', False)
-                if self.private is not None and self.private != private_zone:
-                    continue
-                if h['Name'] in hosted_zones:
-                    raise Route53ProviderException(
-                        f'Multiple zones named "{h["Name"]}" were found.'
-                    )
-                hosted_zones.append(h['Name'])
-            params['Marker'] = resp.get('NextMarker', None)
-            more = resp['IsTruncated']
-
-        hosted_zones.sort()
-        return hosted_zones
+        return sorted(self._list_hosted_zones(delegated=True))
 
     def populate(self, zone, target=False, lenient=False):
         self.log.debug(
@@ -1532,11 +2556,18 @@ class Route53Provider(_AuthMixin, BaseProvider):
         zone_id = self._get_zone_id(zone.name)
         if zone_id:
             exists = True
-            records = defaultdict(lambda: defaultdict(list))
-            dynamic = defaultdict(lambda: defaultdict(list))
-            aliases = defaultdict(list)
-
-            for rrset in self._load_records(zone_id):
+            # (name, type) -> data, only the first rrset of a basic record is
+            # used so the rest are never converted
+            records = {}
+            # (name, type) -> [rrset, ...]
+            dynamic = {}
+            # name -> [rrset, ...]
+            aliases = {}
+
+            # the rrsets are grouped as they're listed, a source doesn't keep
+            # them so only those of dynamic records and aliases outlive their
+            # page
+            for rrset in self._iter_records(zone_id, keep=target):
                 record_name = _octal_replace(rrset['Name'])
                 record_name = zone.hostname_from_fqdn(record_name)
                 record_type = rrset['Type']
@@ -1549,14 +2580,18 @@ class Route53Provider(_AuthMixin, BaseProvider):
                         record_name = record_name.split('.', 1)[1]
                     except IndexError:
                         record_name = ''
-                    dynamic[record_name][record_type].append(rrset)
+                    dynamic.setdefault((record_name, record_type), []).append(
+                        rrset
+                    )
                     continue
                 elif 'AliasTarget' in rrset:
                     if rrset['AliasTarget']['DNSName'].startswith('_octodns-'):
                         # Part of a dynamic record
-                        dynamic[record_name][record_type].append(rrset)
+                        dynamic.setdefault(
+                            (record_name, record_type), []
+                        ).append(rrset)
                     else:
-                        aliases[record_name].append(rrset)
+                        aliases.setdefault(record_name, []).append(rrset)
                     continue
                 elif 'TrafficPolicyInstanceId' in rrset:
                     self.log.warning(
@@ -1565,26 +2600,29 @@ class Route53Provider(_AuthMixin, BaseProvider):
                     )
                     continue
                 # A basic record (potentially including geo)
-                data = getattr(self, f'_data_for_{record_type}')(rrset)
-                records[record_name][record_type].append(data)
+                key = (record_name, record_type)
+                if key not in records:
+                    records[key] = getattr(self, f'_data_for_{record_type}')(
+                        rrset
+                    )
+
+            # only the value rrsets of dynamic records have health checks
+            self._prefetch_health_checks(chain.from_iterable(dynamic.values()))
 
             # Convert the dynamic rrsets to Records
-            for name, types in dynamic.items():
-                for _type, rrsets in types.items():
-                    data = self._data_for_dynamic(name, _type, rrsets)
-                    record = Record.new(
-                        zone, name, data, source=self, lenient=lenient
-                    )
-                    zone.add_record(record, lenient=lenient)
+            for (name, _type), rrsets in dynamic.items():
+                data = self._data_for_dynamic(name, _type, rrsets)
+                record = Record.new(
+                    zone, name, data, source=self, lenient=lenient
+                )
+                zone.add_record(record, lenient=lenient)
 
             # Convert the basic rrsets to records
-            for name, types in records.items():
-                for _type, data in types.items():
-                    data = data[0]
-                    record = Record.new(
-                        zone, name, data, source=self, lenient=lenient
-                    )
-                    zone.add_record(record, lenient=lenient)
+            for (name, _type), data in records.items():
+                record = Record.new(
+                    zone, name, data, source=self, lenient=lenient
+                )
+                zone.add_record(record, lenient=lenient)
 
             # Route53 Aliases don't have TTLs so we're setting a dummy value
             # here and will ignore any ttl-only changes down below in
@@ -1601,11 +2639,20 @@ class Route53Provider(_AuthMixin, BaseProvider):
                 )
                 zone.add_record(record, lenient=lenient)
 
+            if not target:
+                # the rrsets are only needed again when planning and applying
+                # changes, i.e. by a target, so a source doesn't hold on to
+                # them. the persistent cache, if any, still has them
+                with self._locks(f'rrsets:{zone_id}'):
+                    self._r53_rrsets.pop(zone_id, None)
+                    self._r53_rrset_indexes.pop(zone_id, None)
+
         self.log.info(
             'populate:   found %s records, exists=%s',
             len(zone.records) - before,
             exists,
         )
+        self._log_rate_limit_stats('populate')
         return exists
 
     def _gen_mods(self, action, records, existing_rrsets):
@@ -1614,31 +2661,124 @@ class Route53Provider(_AuthMixin, BaseProvider):
         '''
         return [r.mod(action, existing_rrsets) for r in records]
 
+    def _get_health_check_count(self):
+        if self._health_check_count is None:
+            resp = self._conn.get_health_check_count()
+            self._health_check_count = resp['HealthCheckCount']
+        return self._health_check_count
+
+    def _cached_health_checks(self):
+        if self._health_checks is None and self._cache is not None:
+            self._health_checks = self._cache.get(
+                f'{self.id}:health-checks', self._get_health_check_count()
+            )
+        return self._health_checks
+
+    @staticmethod
+    def _is_our_health_check(health_check):
+        # our format for CallerReference is dddd:hex-uuid
+        ref = health_check.get('CallerReference', 'xxxxx')
+        return len(ref) <= 4 or ref[4] == ':'
+
+    def _fetch_health_check(self, id):
+        try:
+            resp = self._conn.get_health_check(HealthCheckId=id)
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'NoSuchHealthCheck':
+                raise
+            return None
+        health_check = resp['HealthCheck']
+        if not self._is_our_health_check(health_check):
+            return None
+        return health_check
+
+    def _prefetch_health_checks(self, rrsets):
+        '''
+        Concurrently fetches the health checks referenced by `rrsets` so that
+        looking them up doesn't require loading all of the account's health
+        checks.
+        '''
+        ids = sorted(
+            set(
+                rrset['HealthCheckId']
+                for rrset in rrsets
+                if 'HealthCheckId' in rrset
+            )
+            - set(self._health_checks_by_id)
+        )
+        if not ids or self._cached_health_checks() is not None:
+            # nothing to fetch or we already have all of them
+            return
+        self.log.debug('_prefetch_health_checks: fetching %d', len(ids))
+        with ThreadPoolExecutor(max_workers=self.HEALTH_CHECK_WORKERS) as pool:
+            for id, health_check in zip(
+                ids, pool.map(self._fetch_health_check, ids)
+            ):
+                self._health_checks_by_id[id] = health_check
+
+    def _health_check(self, id):
+        '''
+        Returns our health check with `id`, raising KeyError if there isn't
+        one. Uses the full list of health checks if it's been loaded and
+        otherwise fetches just this one.
+        '''
+        health_checks = self._cached_health_checks()
+        if health_checks is not None:
+            return health_checks[id]
+        if id is None:
+            raise KeyError(id)
+        if id not in self._health_checks_by_id:
+            # only those that weren't prefetched need, and hold on to, a lock
+            with self._locks(f'health-check:{id}'):
+                if id not in self._health_checks_by_id:
+                    self._health_checks_by_id[id] = self._fetch_health_check(id)
+        health_check = self._health_checks_by_id[id]
+        if health_check is None:
+            raise KeyError(id)
+        return health_check
+
     @property
     def health_checks(self):
-        if self._health_checks is None:
-            # need to do the first load
-            self.log.debug('health_checks: loading')
-            checks = {}
-            more = True
-            start = {}
-            while more:
-                resp = self._conn.list_health_checks(**start)
-                for health_check in resp['HealthChecks']:
-                    # our format for CallerReference is dddd:hex-uuid
-                    ref = health_check.get('CallerReference', 'xxxxx')
-                    if len(ref) > 4 and ref[4] != ':':
-                        # ignore anything else
-                        continue
-                    checks[health_check['Id']] = health_check
+        with self._locks('health-checks'):
+            if self._cached_health_checks() is None:
+                # need to do the first load
+                self.log.debug('health_checks: loading')
+                checks = {}
+                more = True
+                start = {}
+                while more:
+                    resp = self._conn.list_health_checks(**start)
+                    for health_check in resp['HealthChecks']:
+                        if not self._is_our_health_check(health_check):
+                            # ignore anything else
+                            continue
+                        checks[health_check['Id']] = health_check
 
-                more = resp['IsTruncated']
-                start['Marker'] = resp.get('NextMarker', None)
+                    more = resp['IsTruncated']
+                    start['Marker'] = resp.get('NextMarker', None)
 
-            self._health_checks = checks
+                self._health_checks = checks
+                self._store_health_checks()
 
-        # We've got a cached version use it
-        return self._health_checks
+            # We've got a cached version use it
+            return self._health_checks
+
+    @property
+    def health_check_index(self):
+        health_checks = self.health_checks
+        index = self._health_check_index
+        if index is None or index.source is not health_checks:
+            self.log.debug('health_check_index: building')
+            index = self._health_check_index = _HealthCheckIndex(health_checks)
+        return index
+
+    def _store_health_checks(self):
+        if self._cache is not None:
+            self._cache.put(
+                f'{self.id}:health-checks',
+                self._health_checks,
+                self._get_health_check_count(),
+            )
 
     def _healthcheck_measure_latency(self, record):
         return (
@@ -1686,24 +2826,8 @@ class Route53Provider(_AuthMixin, BaseProvider):
         request_interval,
         failure_threshold,
         health_check,
-        value=None,
-        disabled=None,
-        inverted=None,
     ):
         config = health_check['HealthCheckConfig']
-
-        # So interestingly Route53 normalizes IPv6 addresses to a funky, but
-        # valid, form which will cause us to fail to find see things as
-        # equivalent. To work around this we'll ip_address's returned objects
-        # for equivalence.
-        # E.g 2001:4860:4860:0:0:0:0:8842 -> 2001:4860:4860::8842
-        if value:
-            value = ip_address(str(value))
-            config_ip_address = ip_address(str(config['IPAddress']))
-        else:
-            # No value so give this a None to match value's
-            config_ip_address = None
-
         fully_qualified_domain_name = config.get(
             'FullyQualifiedDomainName', None
         )
@@ -1716,9 +2840,6 @@ class Route53Provider(_AuthMixin, BaseProvider):
             and measure_latency == config['MeasureLatency']
             and request_interval == config['RequestInterval']
             and failure_threshold == config['FailureThreshold']
-            and (disabled is None or disabled == config['Disabled'])
-            and (inverted is None or inverted == config['Inverted'])
-            and value == config_ip_address
         )
 
     def get_health_check_id(self, record, value, status, create):
@@ -1767,11 +2888,9 @@ class Route53Provider(_AuthMixin, BaseProvider):
         expected_ref = _healthcheck_ref_prefix(
             self.HEALTH_CHECK_VERSION, record._type, record.fqdn
         )
-        for id, health_check in self.health_checks.items():
-            if not health_check['CallerReference'].startswith(expected_ref):
-                # not match, ignore
-                continue
-            if self._health_check_equivalent(
+        id = self.health_check_index.find(
+            expected_ref,
+            _HealthCheckIndex.config_key(
                 healthcheck_host,
                 healthcheck_path,
                 healthcheck_protocol,
@@ -1779,14 +2898,15 @@ class Route53Provider(_AuthMixin, BaseProvider):
                 healthcheck_latency,
                 healthcheck_interval,
                 healthcheck_threshold,
-                health_check,
-                value=value,
-                disabled=healthcheck_disabled,
-                inverted=healthcheck_inverted,
-            ):
-                # this is the health check we're looking for
-                self.log.debug('get_health_check_id:   found match id=%s', id)
-                return id
+                healthcheck_disabled,
+                healthcheck_inverted,
+            ),
+            value,
+        )
+        if id is not None:
+            # this is the health check we're looking for
+            self.log.debug('get_health_check_id:   found match id=%s', id)
+            return id
 
         if not create:
             # no existing matches and not allowed to create, return none
@@ -1814,47 +2934,113 @@ class Route53Provider(_AuthMixin, BaseProvider):
         else:
             config['FullyQualifiedDomainName'] = healthcheck_host
 
-        expected_ref = _healthcheck_ref_prefix(
-            self.HEALTH_CHECK_VERSION, record._type, record.fqdn
-        )
-        ref = f'{expected_ref}:' + uuid4().hex[:12]
-        resp = self._conn.create_health_check(
-            CallerReference=ref, HealthCheckConfig=config
-        )
-        health_check = resp['HealthCheck']
-        id = health_check['Id']
-
         # Set a Name for the benefit of the UI
         value_or_host = value or healthcheck_host
         # Sanitize for Route53 tag compliance (e.g., wildcard * not allowed)
         name = _sanitize_route53_tag_value(
             f'{record.fqdn}:{record._type} - {value_or_host}'
         )
-        self._conn.change_tags_for_resource(
-            ResourceType='healthcheck',
-            ResourceId=id,
-            AddTags=[{'Key': 'Name', 'Value': name}],
+
+        if self._health_check_queue is not None:
+            # we're looking ahead for the health checks that need creating,
+            # they'll all be created together
+            self.log.debug('get_health_check_id:   queuing create')
+            key = (expected_ref, value, tuple(sorted(config.items())))
+            self._health_check_queue[key] = (expected_ref, config, name)
+            return None
+
+        return self._create_health_checks([(expected_ref, config, name)])[0]
+
+    def _queue_health_checks(self, changes, zone_id, collection_id):
+        '''
+        Works out which health checks the `changes` will need created and
+        creates all of them up front.
+        '''
+        self._health_check_queue = {}
+        try:
+            for c in changes:
+                new = getattr(c, 'new', None)
+                if new is not None and getattr(new, 'dynamic', False):
+                    # generating the records looks up, and here queues, the
+                    # health checks they use
+                    self._gen_records(
+                        new, zone_id, creating=True, collection_id=collection_id
+                    )
+            queued = list(self._health_check_queue.values())
+        finally:
+            self._health_check_queue = None
+
+        if queued:
+            self._create_health_checks(queued)
+
+    def _create_health_checks(self, specs):
+        '''
+        Concurrently creates a health check for each (expected_ref, config,
+        name) in `specs` and then names them.
+
+        Returns the ids of the new health checks in the same order.
+        '''
+        total = len(specs)
+        self.log.info(
+            '_create_health_checks: creating %d, workers=%d',
+            total,
+            self.HEALTH_CHECK_WORKERS,
         )
-        # Manually add it to our cache
-        health_check['Tags'] = {'Name': name}
 
-        # store the new health check so that we'll be able to find it in the
-        # future
-        self._health_checks[id] = health_check
+        def create(spec):
+            expected_ref, config, _ = spec
+            ref = f'{expected_ref}:' + uuid4().hex[:12]
+            resp = self._conn.create_health_check(
+                CallerReference=ref, HealthCheckConfig=config
+            )
+            return resp['HealthCheck']
+
+        def tag(args):
+            id, name = args
+            self._conn.change_tags_for_resource(
+                ResourceType='healthcheck',
+                ResourceId=id,
+                AddTags=[{'Key': 'Name', 'Value': name}],
+            )
+
+        start = monotonic()
+        health_checks = []
+        with ThreadPoolExecutor(max_workers=self.HEALTH_CHECK_WORKERS) as pool:
+            for i, health_check in enumerate(pool.map(create, specs), 1):
+                self.log.info(
+                    '_create_health_checks:   created %d/%d id=%s, config=%s',
+                    i,
+                    total,
+                    health_check['Id'],
+                    health_check['HealthCheckConfig'],
+                )
+                health_checks.append(health_check)
+            created = monotonic()
+
+            # tags can only be added once the health checks exist, these are
+            # all independent of one another though
+            ids = [hc['Id'] for hc in health_checks]
+            list(pool.map(tag, zip(ids, (spec[2] for spec in specs))))
         self.log.info(
-            'get_health_check_id: created id=%s, host=%s, '
-            'path=%s, protocol=%s, port=%d, measure_latency=%r, '
-            'request_interval=%d, value=%s',
-            id,
-            healthcheck_host,
-            healthcheck_path,
-            healthcheck_protocol,
-            healthcheck_port,
-            healthcheck_latency,
-            healthcheck_interval,
-            value,
+            '_create_health_checks:   created %d in %.3fs, tagged in %.3fs',
+            total,
+            created - start,
+            monotonic() - created,
         )
-        return id
+
+        with self._locks('health-checks'):
+            if self._health_check_count is not None:
+                self._health_check_count += len(health_checks)
+            for health_check, (_, _, name) in zip(health_checks, specs):
+                # Manually add it to our cache
+                health_check['Tags'] = {'Name': name}
+                # store the new health check so that we'll be able to find it
+                # in the future
+                self._health_checks[health_check['Id']] = health_check
+                self.health_check_index.add(health_check['Id'], health_check)
+            self._store_health_checks()
+
+        return ids
 
     def _gc_health_checks(self, record, new):
         if record._type not in ('A', 'AAAA', 'CNAME'):
@@ -1867,28 +3053,63 @@ class Route53Provider(_AuthMixin, BaseProvider):
             if hc_id:
                 in_use.add(hc_id)
         self.log.debug('_gc_health_checks:   in_use=%s', in_use)
-        # Now we need to run through ALL the health checks looking for those
-        # that apply to this record, deleting any that do and are no longer in
-        # use
-        expected_re = re.compile(fr'^\d\d\d\d:{record._type}:{record.fqdn}:')
+        # Now we need to run through the health checks that apply to this
+        # record, queuing up any that are no longer in use to be deleted once
+        # the rrsets that reference them have been changed
         # UNITL 1.0: we'll clean out the previous version of Route53 health
         # checks as best as we can.
         expected_legacy_host = record.fqdn[:-1]
-        expected_legacy = f'0000:{record._type}:'
-        for id, health_check in self.health_checks.items():
-            ref = health_check['CallerReference']
-            if expected_re.match(ref) and id not in in_use:
+        for id, current, legacy in self.health_check_index.for_record(
+            record._type, record.fqdn, expected_legacy_host
+        ):
+            if current and id not in in_use:
                 # this is a health check for this record, but not one we're
                 # planning to use going forward
-                self.log.info('_gc_health_checks:   deleting id=%s', id)
-                self._conn.delete_health_check(HealthCheckId=id)
-            elif ref.startswith(expected_legacy):
-                config = health_check['HealthCheckConfig']
-                if expected_legacy_host == config['FullyQualifiedDomainName']:
-                    self.log.info(
-                        '_gc_health_checks:   deleting legacy id=%s', id
-                    )
-                    self._conn.delete_health_check(HealthCheckId=id)
+                self.log.info('_gc_health_checks:   queuing id=%s', id)
+                self._health_check_gc.add(id)
+            elif legacy:
+                self.log.info('_gc_health_checks:   queuing legacy id=%s', id)
+                self._health_check_gc.add(id)
+
+    def _delete_health_checks(self):
+        '''
+        Concurrently deletes the health checks queued up by
+        `_gc_health_checks`.
+        '''
+        ids = sorted(self._health_check_gc)
+        self._health_check_gc.clear()
+        if not ids:
+            return
+        self.log.info(
+            '_delete_health_checks: deleting %d, workers=%d',
+            len(ids),
+            self.HEALTH_CHECK_WORKERS,
+        )
+
+        deleted = []
+
+        def delete(id):
+            self.log.debug('_delete_health_checks:   deleting id=%s', id)
+            self._conn.delete_health_check(HealthCheckId=id)
+            deleted.append(id)
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.HEALTH_CHECK_WORKERS
+            ) as pool:
+                list(pool.map(delete, ids))
+        finally:
+            with self._locks('health-checks'):
+                # _gc_health_checks has loaded, and indexed, them all
+                index = self._health_check_index
+                for id in deleted:
+                    self._health_checks.pop(id, None)
+                    index.remove(id)
+                if self._health_check_count is not None:
+                    self._health_check_count -= len(deleted)
+            if self._cache is not None:
+                # our persisted list of health checks is no longer accurate
+                self._cache.delete(f'{self.id}:health-checks')
 
     def _gen_records(self, record, zone_id, creating=False, collection_id=None):
         '''
@@ -1903,8 +3124,8 @@ class Route53Provider(_AuthMixin, BaseProvider):
         new_records = self._gen_records(
             change.new, zone_id, creating=True, collection_id=collection_id
         )
-        # Now is a good time to clear out any unused health checks since we
-        # know what we'll be using going forward
+        # Now is a good time to queue up any unused health checks for GC
+        # since we know what we'll be using going forward
         self._gc_health_checks(change.new, new_records)
         return self._gen_mods('CREATE', new_records, existing_rrsets)
 
@@ -1920,27 +3141,44 @@ class Route53Provider(_AuthMixin, BaseProvider):
         new_records = self._gen_records(
             change.new, zone_id, creating=True, collection_id=collection_id
         )
-        # Now is a good time to clear out any unused health checks since we
-        # know what we'll be using going forward
+        # Now is a good time to queue up any unused health checks for GC
+        # since we know what we'll be using going forward
         self._gc_health_checks(change.new, new_records)
         # Things in existing, but not new are deletes
         deletes = existing_records - new_records
         # Things in new, but not existing are the creates
         creates = new_records - existing_records
-        # Things in both need updating, we could optimize this and filter out
-        # things that haven't actually changed, but that's for another day.
-        # We can't use set math here b/c we won't be able to control which of
-        # the two objects will be in the result and we need to ensure it's the
-        # new one.
+        # Things in both may need updating. We can't use set math here b/c we
+        # won't be able to control which of the two objects will be in the
+        # result and we need to ensure it's the new one.
         upserts = set()
         for new_record in new_records:
             if new_record in existing_records:
                 upserts.add(new_record)
+        upserts = self._gen_mods('UPSERT', upserts, existing_rrsets)
+
+        if existing_rrsets:
+            # Skip anything that's identical to what's already in Route53
+            current = self._rrset_index(zone_id, existing_rrsets).rrsets
+            upserts = [
+                mod
+                for mod in upserts
+                if current.get(_rrset_key(mod['ResourceRecordSet']))
+                != _normalize_rrset(mod['ResourceRecordSet'])
+            ]
+            skipped = len(new_records) - len(creates) - len(upserts)
+            if skipped:
+                self.log.debug(
+                    '_mod_Update: %s %s, skipping %d unchanged rrsets',
+                    change.new.fqdn,
+                    change.new._type,
+                    skipped,
+                )
 
         return (
             self._gen_mods('DELETE', deletes, existing_rrsets)
             + self._gen_mods('CREATE', creates, existing_rrsets)
-            + self._gen_mods('UPSERT', upserts, existing_rrsets)
+            + upserts
         )
 
     def _mod_Delete(self, change, zone_id, existing_rrsets, collection_id=None):
@@ -1951,8 +3189,8 @@ class Route53Provider(_AuthMixin, BaseProvider):
             creating=False,
             collection_id=collection_id,
         )
-        # Now is a good time to clear out all the health checks since we know
-        # we're done with them
+        # Now is a good time to queue up all the health checks for GC since we
+        # know we're done with them
         self._gc_health_checks(change.existing, [])
         return self._gen_mods('DELETE', existing_records, existing_rrsets)
 
@@ -1987,7 +3225,7 @@ class Route53Provider(_AuthMixin, BaseProvider):
 
         try:
             health_check_id = rrset['HealthCheckId']
-            health_check = self.health_checks[health_check_id]
+            health_check = self._health_check(health_check_id)
             caller_ref = health_check['CallerReference']
             if caller_ref.startswith(self.HEALTH_CHECK_VERSION):
                 if self._health_check_equivalent(
@@ -2025,40 +3263,31 @@ class Route53Provider(_AuthMixin, BaseProvider):
             record._type,
         )
 
-        fqdn = record.fqdn
-        _type = record._type
-
-        # Check for CIDR location drift
-        for rrset in self._load_records(zone_id):
-            if 'CidrRoutingConfig' in rrset and rrset.get(
-                'AliasTarget', {}
-            ).get('DNSName', '').startswith('_octodns-'):
-                # Found an existing CIDR rule, check if it belongs to this
-                # record by seeing if the alias target ends with our fqdn
-                target = rrset['AliasTarget']['DNSName']
-                if not target.endswith(f'.{fqdn}'):
-                    continue
-                if _type != rrset['Type']:
-                    continue
-                existing_loc = rrset['CidrRoutingConfig']['LocationName']
-                if existing_loc == '*':
-                    # Default/catchall rule, no CIDR blocks to check
-                    continue
-                # Find the matching rule by index from SetIdentifier
-                _id = rrset['SetIdentifier']
-                i = int(_id.split('-', 1)[0])
-                rules = record.dynamic.rules
-                if i < len(rules):
-                    desired_cidrs = rules[i].data.get('subnets', [])
-                    desired_loc = self._cidr_location_name(desired_cidrs)
-                    if existing_loc != desired_loc:
-                        self.log.info(
-                            '_extra_changes_dynamic_needs_update: '
-                            'cidr-location caused update of %s:%s',
-                            record.fqdn,
-                            record._type,
-                        )
-                        return True
+        key = (record.fqdn, record._type)
+        index = self._rrset_index(zone_id)
+
+        # Check for CIDR location drift in the existing CIDR rules that belong
+        # to this record
+        for rrset in index.cidr_rules.get(key, ()):
+            existing_loc = rrset['CidrRoutingConfig']['LocationName']
+            if existing_loc == '*':
+                # Default/catchall rule, no CIDR blocks to check
+                continue
+            # Find the matching rule by index from SetIdentifier
+            _id = rrset['SetIdentifier']
+            i = int(_id.split('-', 1)[0])
+            rules = record.dynamic.rules
+            if i < len(rules):
+                desired_cidrs = rules[i].data.get('subnets', [])
+                desired_loc = self._cidr_location_name(desired_cidrs)
+                if existing_loc != desired_loc:
+                    self.log.info(
+                        '_extra_changes_dynamic_needs_update: '
+                        'cidr-location caused update of %s:%s',
+                        record.fqdn,
+                        record._type,
+                    )
+                    return True
 
         # map values to statuses
         statuses = {}
@@ -2066,26 +3295,8 @@ class Route53Provider(_AuthMixin, BaseProvider):
             for value in pool.data['values']:
                 statuses[value['value']] = value.get('status', 'obey')
 
-        # loop through all the r53 rrsets
-        for rrset in self._load_records(zone_id):
-            name = rrset['Name']
-            # Break off the first piece of the name, it'll let us figure out if
-            # this is an rrset we're interested in.
-            maybe_meta, rest = name.split('.', 1)
-
-            if (
-                not maybe_meta.startswith('_octodns-')
-                or not maybe_meta.endswith('-value')
-                or '-default-' in name
-            ):
-                # We're only interested in non-default dynamic value records,
-                # as that's where healthchecks live
-                continue
-
-            if rest != fqdn or _type != rrset['Type']:
-                # rrset isn't for the current record
-                continue
-
+        # loop through the record's value rrsets
+        for rrset in index.values.get(key, ()):
             if self._extra_changes_update_needed(record, rrset, statuses):
                 # no good, doesn't have the right health check, needs an update
                 self.log.info(
@@ -2160,15 +3371,7 @@ class Route53Provider(_AuthMixin, BaseProvider):
 
         # Ensure CIDR collection exists if any desired records use subnets
         collection_id = None
-        desired_locations = {}
-        for record in desired.records:
-            if not getattr(record, 'dynamic', False):
-                continue
-            for rule in record.dynamic.rules:
-                subnets = rule.data.get('subnets', [])
-                if subnets:
-                    loc = self._cidr_location_name(subnets)
-                    desired_locations[loc] = sorted(subnets)
+        desired_locations = self._desired_cidr_locations(desired)
         if desired_locations:
             collection_id = self._get_or_create_cidr_collection()
 
@@ -2188,66 +3391,56 @@ class Route53Provider(_AuthMixin, BaseProvider):
         if collection_id is not None and desired_locations:
             self._sync_cidr_locations(collection_id, desired_locations)
 
-        batch = []
-        batch_rs_count = 0
         zone_id = self._get_zone_id(desired.name, True)
         existing_rrsets = self._load_records(zone_id)
-        for c in changes:
-            # Generate the mods for this change
-            if isinstance(c, Create):
-                new = c.new
-                if new._type == 'NS' and new.name == '':
-                    # Root NS records are never created, they come w/the zone,
-                    # convert the create into an Update
-                    c = Update(new, new)
-            klass = c.__class__.__name__
-            mod_type = getattr(self, f'_mod_{klass}')
-            mods = mod_type(c, zone_id, existing_rrsets, collection_id)
-
-            # Order our mods to make sure targets exist before alises point to
-            # them and we CRUD in the desired order
-            mods.sort(key=_mod_keyer)
-
-            mods_rs_count = sum(
-                [
-                    len(m['ResourceRecordSet'].get('ResourceRecords', ''))
-                    for m in mods
-                ]
+        # anything left over from a previous apply that failed is still
+        # referenced
+        self._health_check_gc.clear()
+        # create any new health checks all together rather than one at a time
+        # as the mods that use them are generated
+        self._queue_health_checks(changes, zone_id, collection_id)
+
+        def mod_groups():
+            for c in changes:
+                # Generate the mods for this change
+                if isinstance(c, Create):
+                    new = c.new
+                    if new._type == 'NS' and new.name == '':
+                        # Root NS records are never created, they come w/the
+                        # zone, convert the create into an Update
+                        c = Update(new, new)
+                klass = c.__class__.__name__
+                mod_type = getattr(self, f'_mod_{klass}')
+                mods = mod_type(c, zone_id, existing_rrsets, collection_id)
+
+                # Order our mods to make sure targets exist before alises
+                # point to them and we CRUD in the desired order
+                mods.sort(key=_mod_keyer)
+                yield mods
+
+        submitted = []
+        for batch, batch_rrs, batch_chars in _batch_mods(
+            mod_groups(), self.max_changes, self.MAX_CHANGE_CHARS
+        ):
+            self.log.info(
+                '_apply:   sending change request for batch of %d mods, '
+                '%d ResourceRecords, %d characters',
+                len(batch),
+                batch_rrs,
+                batch_chars,
             )
+            # send the batch, we don't need to wait for it to be INSYNC before
+            # sending the next one, Route53 applies them in order
+            submitted.append((self._really_apply(batch, zone_id), monotonic()))
 
-            if mods_rs_count > self.max_changes:
-                # a single mod resulted in too many ResourceRecords changes
-                raise Exception(f'Too many modifications: {mods_rs_count}')
+        # all of the changes have been accepted so nothing references the
+        # health checks we've queued up any longer
+        self._delete_health_checks()
 
-            # r53 limits changesets to 1000 entries
-            if (batch_rs_count + mods_rs_count) < self.max_changes:
-                # append to the batch
-                batch += mods
-                batch_rs_count += mods_rs_count
-            else:
-                self.log.info(
-                    '_apply:   sending change request for batch of '
-                    '%d mods, %d ResourceRecords',
-                    len(batch),
-                    batch_rs_count,
-                )
-                # send the batch
-                self._really_apply(batch, zone_id)
-                # start a new batch with the leftovers
-                batch = mods
-                batch_rs_count = mods_rs_count
-
-        # the way the above process works there will always be something left
-        # over in batch to process. In the case that we submit a batch up there
-        # it was always the case that there was something pushing us over
-        # max_changes and thus left over to submit.
-        self.log.info(
-            '_apply:   sending change request for batch of %d mods,'
-            ' %d ResourceRecords',
-            len(batch),
-            batch_rs_count,
-        )
-        self._really_apply(batch, zone_id)
+        if self.wait_for_insync:
+            self._wait_for_insync(submitted)
+
+        self._log_rate_limit_stats('_apply', logging.INFO)
 
     def _really_apply(self, batch, zone_id):
         # Ensure this batch is ordered (deletes before creates etc.)
@@ -2258,7 +3451,65 @@ class Route53Provider(_AuthMixin, BaseProvider):
             '_really_apply:   sending change request, comment=%s',
             batch['Comment'],
         )
+        start = monotonic()
         resp = self._conn.change_resource_record_sets(
             HostedZoneId=zone_id, ChangeBatch=batch
         )
-        self.log.debug('_really_apply:   change info=%s', resp['ChangeInfo'])
+        change_info = resp['ChangeInfo']
+        self.log.debug('_really_apply:   change info=%s', change_info)
+        self.log.info(
+            '_really_apply:   submitted change id=%s, status=%s, '
+            'latency=%.3fs',
+            change_info['Id'],
+            change_info['Status'],
+            monotonic() - start,
+        )
+        if self._cache is not None:
+            # we've changed the zone so any snapshot we have is now stale
+            self._r53_zone_record_counts.pop(zone_id, None)
+            self._cache.delete(f'{self.id}:rrsets:{zone_id}')
+        return change_info
+
+    def _wait_for_change(self, change_info, submitted):
+        change_id = change_info['Id']
+        status = change_info['Status']
+        delay = self.INSYNC_POLL_MIN
+        while status != 'INSYNC':
+            if monotonic() - submitted > self.insync_timeout:
+                raise Route53ProviderException(
+                    f'Timed out waiting for change {change_id} to be INSYNC, '
+                    f'status={status}'
+                )
+            # back off exponentially, with jitter so that concurrent pollers
+            # spread out their requests
+            sleep(delay / 2 + uniform(0, delay / 2))
+            delay = min(delay * 2, self.INSYNC_POLL_MAX)
+            resp = self._conn.get_change(Id=change_id)
+            status = resp['ChangeInfo']['Status']
+
+        propagation = monotonic() - submitted
+        self.log.info(
+            '_wait_for_change:   change id=%s INSYNC, propagation=%.3fs',
+            change_id,
+            propagation,
+        )
+        return propagation
+
+    def _wait_for_insync(self, submitted):
+        if not submitted:
+            # there were no changes to the zone, e.g. they were all no-ops
+            self.log.info('_wait_for_insync: no changes to wait for')
+            return
+        self.log.info(
+            '_wait_for_insync: waiting for %d changes, workers=%d',
+            len(submitted),
+            self.insync_workers,
+        )
+        with ThreadPoolExecutor(max_workers=self.insync_workers) as pool:
+            propagations = list(
+                pool.map(lambda s: self._wait_for_change(*s), submitted)
+            )
+        self.log.info(
+            '_wait_for_insync:   all changes INSYNC, max propagation=%.3fs',
+            max(propagations),
+        )
@@ -2,24 +2,101 @@
 #
 #
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from ipaddress import IPv4Address, IPv6Address
 from logging import getLogger
+from operator import itemgetter
 
 from octodns.idna import idna_encode
 from octodns.record import Record
 from octodns.source.base import BaseSource
 
 from .auth import _AuthMixin
+from .limiter import _TokenBucket
+
+
+class _FqdnIndex:
+    '''
+    Index of items by fqdn. Fqdns are stored in a trie keyed on their labels
+    in reverse order so that everything at or below a zone can be found
+    without looking at anything outside of it.
+    '''
+
+    def __init__(self):
+        self._root = {}
+        self._count = 0
+
+    @staticmethod
+    def _labels(name):
+        return reversed(name.rstrip('.').split('.'))
+
+    def add(self, fqdn, item):
+        node = self._root
+        for label in self._labels(fqdn):
+            node = node.setdefault(label, {})
+        # None can't collide with a label so it holds the node's entries,
+        # numbered so that they can be returned in the order they were added
+        node.setdefault(None, []).append((self._count, fqdn, item))
+        self._count += 1
+
+    def find(self, name):
+        '''
+        Returns (fqdn, item) for everything at or below `name`, in the order
+        they were added.
+        '''
+        node = self._root
+        for label in self._labels(name):
+            node = node.get(label)
+            if node is None:
+                return []
+
+        found = []
+        nodes = [node]
+        while nodes:
+            node = nodes.pop()
+            for label, child in node.items():
+                if label is None:
+                    found.extend(child)
+                else:
+                    nodes.append(child)
+        found.sort(key=itemgetter(0))
+        return [(fqdn, item) for _, fqdn, item in found]
+
+
+def _source_regions(region, regions):
+    '''
+    Combines the `region` and `regions` options into a list without
+    duplicates, `region` first.
+    '''
+    ret = []
+    for r in [region] + list(regions or []):
+        if r and r not in ret:
+            ret.append(r)
+    if not ret:
+        raise ValueError('region or regions is required')
+    return ret
 
 
 class Ec2Source(_AuthMixin, BaseSource):
     SUPPORTS_GEO = False
     SUPPORTS = ('A', 'AAAA', 'PTR')
 
+    # Terminated instances no longer have addresses, we want everything else
+    INSTANCE_STATES = (
+        'pending',
+        'running',
+        'shutting-down',
+        'stopping',
+        'stopped',
+    )
+
+    # The largest page describe_instances supports
+    PAGE_SIZE = 1000
+
     def __init__(
         self,
         id,
-        region,
+        region=None,
         access_key_id=None,
         secret_access_key=None,
         session_token=None,
@@ -29,44 +106,64 @@ class Ec2Source(_AuthMixin, BaseSource):
         ttl=3600,
         tag_prefix='octodns',
         append_to_names="",
+        regions=None,
+        role_session_name=None,
         *args,
         **kwargs,
     ):
         self.log = getLogger(f'Ec2Source[{id}]')
         self.log.info(
-            '__init__: id=%s, region=%s, access_key_id=%s, ttl=%d, tag_prefix=%s, append_to_names=%s',
+            '__init__: id=%s, region=%s, access_key_id=%s, ttl=%d, tag_prefix=%s, append_to_names=%s, regions=%s',
             id,
             region,
             access_key_id,
             ttl,
             tag_prefix,
             append_to_names,
+            regions,
         )
         self.ttl = ttl
         self.tag_prefix = tag_prefix
         self.append_to_names = append_to_names
+        self.regions = _source_regions(region, regions)
 
         super().__init__(id, *args, **kwargs)
 
-        self._conn = self.client(
-            service_name='ec2',
-            access_key_id=access_key_id,
-            secret_access_key=secret_access_key,
-            session_token=session_token,
-            role_arn=role_arn,
-            profile=profile,
-            client_max_attempts=client_max_attempts,
-            region_name=region,
-        )
+        self._conns = {
+            r: self.client(
+                service_name='ec2',
+                access_key_id=access_key_id,
+                secret_access_key=secret_access_key,
+                session_token=session_token,
+                role_arn=role_arn,
+                profile=profile,
+                client_max_attempts=client_max_attempts,
+                region_name=r,
+                role_session_name=role_session_name,
+            )
+            for r in self.regions
+        }
+        self._conn = self._conns[self.regions[0]]
 
         self._instances = None
-
-    @property
-    def instances(self):
-        if self._instances is None:
-            resp = self._conn.describe_instances()
-            instances = {}
-            for reservation in resp['Reservations']:
+        self._indexes = None
+
+    def _iter_instances(self, conn):
+        # only instances tagged with a Name or something matching our prefix
+        # can result in records so have EC2 filter out everything else
+        filters = [
+            {'Name': 'tag-key', 'Values': ['Name', f'{self.tag_prefix}*']},
+            {
+                'Name': 'instance-state-name',
+                'Values': list(self.INSTANCE_STATES),
+            },
+        ]
+        paginator = conn.get_paginator('describe_instances')
+        pages = paginator.paginate(
+            Filters=filters, PaginationConfig={'PageSize': self.PAGE_SIZE}
+        )
+        for page in pages:
+            for reservation in page['Reservations']:
                 for instance in reservation['Instances']:
                     # process tags
                     fqdns = []
@@ -82,92 +179,91 @@ class Ec2Source(_AuthMixin, BaseSource):
                             )
 
                     fqdns = [f'{i}.' if i[-1] != '.' else i for i in fqdns]
-                    instances[instance['InstanceId']] = {
+                    # only hold on to the bits we use, not the full response
+                    yield instance['InstanceId'], {
                         'private_v4': instance.get('PrivateIpAddress'),
                         'v6': instance.get('Ipv6Address'),
                         'fqdns': fqdns,
                     }
 
+    @property
+    def instances(self):
+        if self._instances is None:
+            # discover instances in all of the regions concurrently
+            instances = {}
+            with ThreadPoolExecutor(max_workers=len(self.regions)) as pool:
+                for region_instances in pool.map(
+                    lambda conn: list(self._iter_instances(conn)),
+                    self._conns.values(),
+                ):
+                    instances.update(region_instances)
+            self.log.debug(
+                'instances: len(regions)=%d, len(instances)=%d',
+                len(self.regions),
+                len(instances),
+            )
             # so to get a determinate order, then discard the key
             instances = [i[1] for i in sorted(instances.items())]
             self._instances = instances
 
         return self._instances
 
-    def _populate(self, zone):
-        for instance in self.instances:
-            for fqdn in instance['fqdns']:
-                if not fqdn.endswith(zone.name):
+    @property
+    def indexes(self):
+        '''
+        Returns (forward, in_addr_arpa, ip6_arpa) `_FqdnIndex`s of instances.
+        '''
+        if self._indexes is None:
+            forward = _FqdnIndex()
+            in_addr_arpa = _FqdnIndex()
+            ip6_arpa = _FqdnIndex()
+            for instance in self.instances:
+                if not instance['fqdns']:
                     # not interested in this one
                     continue
 
-                name = zone.hostname_from_fqdn(fqdn)
-                if instance['private_v4']:
-                    a = Record.new(
-                        zone,
-                        name,
-                        {
-                            'type': 'A',
-                            'ttl': self.ttl,
-                            'value': instance['private_v4'],
-                        },
-                    )
-                    zone.add_record(a)
-
-                if instance['v6']:
-                    aaaa = Record.new(
-                        zone,
-                        name,
-                        {
-                            'type': 'AAAA',
-                            'ttl': self.ttl,
-                            'value': instance['v6'],
-                        },
-                    )
-                    zone.add_record(aaaa)
+                for fqdn in instance['fqdns']:
+                    forward.add(fqdn, instance)
 
-    def _populate_in_addr_arpa(self, zone):
-        for instance in self.instances:
-            if not instance['fqdns']:
-                # not interested in this one
-                continue
-
-            private_v4 = instance['private_v4']
-            if not private_v4:
-                # not interested in this one
-                continue
-
-            rev = IPv4Address(private_v4).reverse_pointer
-            rev = f'{rev}.'
-            if not rev.endswith(zone.name):
-                # not interested in this one
-                continue
+                private_v4 = instance['private_v4']
+                if private_v4:
+                    rev = IPv4Address(private_v4).reverse_pointer
+                    in_addr_arpa.add(f'{rev}.', instance)
 
-            rev = zone.hostname_from_fqdn(rev)
-            ptr = Record.new(
-                zone,
-                rev,
-                {'type': 'PTR', 'ttl': self.ttl, 'values': instance['fqdns']},
-            )
-            zone.add_record(ptr)
+                v6 = instance['v6']
+                if v6:
+                    rev = IPv6Address(v6).reverse_pointer
+                    ip6_arpa.add(f'{rev}.', instance)
 
-    def _populate_ip6_arpa(self, zone):
-        for instance in self.instances:
-            if not instance['fqdns']:
-                # not interested in this one
-                continue
-
-            v6 = instance['v6']
-            if not v6:
-                # not interested in this one
-                continue
-
-            rev = IPv6Address(v6).reverse_pointer
-            rev = f'{rev}.'
-            if not rev.endswith(zone.name):
-                # not interested in this one
-                continue
+            self._indexes = (forward, in_addr_arpa, ip6_arpa)
+
+        return self._indexes
 
+    def _populate(self, zone):
+        for fqdn, instance in self.indexes[0].find(zone.name):
+            name = zone.hostname_from_fqdn(fqdn)
+            if instance['private_v4']:
+                a = Record.new(
+                    zone,
+                    name,
+                    {
+                        'type': 'A',
+                        'ttl': self.ttl,
+                        'value': instance['private_v4'],
+                    },
+                )
+                zone.add_record(a)
+
+            if instance['v6']:
+                aaaa = Record.new(
+                    zone,
+                    name,
+                    {'type': 'AAAA', 'ttl': self.ttl, 'value': instance['v6']},
+                )
+                zone.add_record(aaaa)
+
+    def _populate_ptrs(self, zone, index):
+        for rev, instance in index.find(zone.name):
             rev = zone.hostname_from_fqdn(rev)
             ptr = Record.new(
                 zone,
@@ -176,6 +272,12 @@ class Ec2Source(_AuthMixin, BaseSource):
             )
             zone.add_record(ptr)
 
+    def _populate_in_addr_arpa(self, zone):
+        self._populate_ptrs(zone, self.indexes[1])
+
+    def _populate_ip6_arpa(self, zone):
+        self._populate_ptrs(zone, self.indexes[2])
+
     def populate(self, zone, target=False, lenient=False):
         self.log.debug('populate: zone=%s', zone.name)
         before = len(zone.records)
@@ -196,10 +298,17 @@ class ElbSource(_AuthMixin, BaseSource):
     SUPPORTS_GEO = False
     SUPPORTS = ('ALIAS', 'CNAME')
 
+    # describe_tags accepts at most 20 ARNs per request
+    # https://docs.aws.amazon.com/elasticloadbalancing/latest/APIReference/API_DescribeTags.html
+    TAGS_BATCH_SIZE = 20
+
+    # Conservative limit, requests per second, on ELB describe API calls
+    API_RATE_LIMIT = 10
+
     def __init__(
         self,
         id,
-        region,
+        region=None,
         access_key_id=None,
         secret_access_key=None,
         session_token=None,
@@ -209,58 +318,96 @@ class ElbSource(_AuthMixin, BaseSource):
         ttl=3600,
         tag_prefix='octodns',
         append_to_names="",
+        tag_workers=4,
+        rate_limit=None,
+        regions=None,
+        role_session_name=None,
         *args,
         **kwargs,
     ):
         self.log = getLogger(f'ElbSource[{id}]')
         self.log.info(
-            '__init__: id=%s, region=%s, access_key_id=%s, ttl=%d, tag_prefix=%s, append_to_names=%s',
+            '__init__: id=%s, region=%s, access_key_id=%s, ttl=%d, tag_prefix=%s, append_to_names=%s, tag_workers=%s, rate_limit=%s, regions=%s',
             id,
             region,
             access_key_id,
             ttl,
             tag_prefix,
             append_to_names,
+            tag_workers,
+            rate_limit,
+            regions,
         )
         self.ttl = ttl
         self.tag_prefix = tag_prefix
         self.append_to_names = append_to_names
+        self.regions = _source_regions(region, regions)
+
+        if not isinstance(tag_workers, int) or tag_workers < 1:
+            raise ValueError('tag_workers must be a positive integer')
+        self.tag_workers = tag_workers
 
         super().__init__(id, *args, **kwargs)
 
-        self._conn = self.client(
-            service_name='elbv2',
-            access_key_id=access_key_id,
-            secret_access_key=secret_access_key,
-            session_token=session_token,
-            role_arn=role_arn,
-            profile=profile,
-            client_max_attempts=client_max_attempts,
-            region_name=region,
-        )
+        # API limits are per-region so each region gets its own limiter
+        self._rate_limiters = {
+            r: _TokenBucket(rate_limit or self.API_RATE_LIMIT, name=f'{id}:{r}')
+            for r in self.regions
+        }
+        self._conns = {
+            r: self.client(
+                service_name='elbv2',
+                access_key_id=access_key_id,
+                secret_access_key=secret_access_key,
+                session_token=session_token,
+                role_arn=role_arn,
+                profile=profile,
+                client_max_attempts=client_max_attempts,
+                region_name=r,
+                rate_limiter=self._rate_limiters[r],
+                role_session_name=role_session_name,
+            )
+            for r in self.regions
+        }
+        self._conn = self._conns[self.regions[0]]
 
         self._lbs = None
-
-    @property
-    def lbs(self):
-        if self._lbs is None:
-            # build the list of load balancers
-            resp = self._conn.describe_load_balancers()
-            lbs = {}
-            for lb in resp['LoadBalancers']:
-                arn = lb['LoadBalancerArn']
-                lbs[arn] = {
-                    'dns_name': f'{lb["DNSName"]}.',
-                    'fqdns': [lb['LoadBalancerName'] + self.append_to_names],
-                }
-
-            # request tags and look through them for fqdns
-            arns = list(lbs.keys())
+        self._index = None
+
+    def _describe_tags(self, conn, arns):
+        self.log.debug('_describe_tags: len(arns)=%d', len(arns))
+        return conn.describe_tags(ResourceArns=arns)['TagDescriptions']
+
+    def _region_lbs(self, conn):
+        lbs = {}
+        with ThreadPoolExecutor(max_workers=self.tag_workers) as pool:
+            # build the list of load balancers, requesting tags for them in
+            # batches as we go
+            futures = []
+            arns = []
+            paginator = conn.get_paginator('describe_load_balancers')
+            for page in paginator.paginate():
+                for lb in page['LoadBalancers']:
+                    arn = lb['LoadBalancerArn']
+                    lbs[arn] = {
+                        'dns_name': f'{lb["DNSName"]}.',
+                        'fqdns': [
+                            lb['LoadBalancerName'] + self.append_to_names
+                        ],
+                    }
+                    arns.append(arn)
+                    if len(arns) == self.TAGS_BATCH_SIZE:
+                        futures.append(
+                            pool.submit(self._describe_tags, conn, arns)
+                        )
+                        arns = []
             if arns:
-                resp = self._conn.describe_tags(ResourceArns=arns)
-                for td in resp['TagDescriptions']:
-                    arn = td['ResourceArn']
-                    lb = lbs[arn]
+                futures.append(pool.submit(self._describe_tags, conn, arns))
+
+            # look through the tags for fqdns as they come in
+            for future in as_completed(futures):
+                for td in future.result():
+                    lb = lbs[td['ResourceArn']]
                     for tag in td.get('Tags', []):
                         key = tag['Key']
                         val = tag['Value']
@@ -270,46 +417,70 @@ class ElbSource(_AuthMixin, BaseSource):
                                 for fqdn in val.split('/')
                             )
 
+        return lbs
+
+    @property
+    def lbs(self):
+        if self._lbs is None:
+            # discover load balancers in all of the regions concurrently,
+            # merging them in region order
+            lbs = {}
+            with ThreadPoolExecutor(max_workers=len(self.regions)) as pool:
+                for region_lbs in pool.map(
+                    self._region_lbs, self._conns.values()
+                ):
+                    lbs.update(region_lbs)
+
+            # add .'s to fqdns that don't have them
             for lb in lbs.values():
                 fqdns = lb['fqdns']
                 fqdns = [f'{i}.' if i[-1] != '.' else i for i in fqdns]
                 lb['fqdns'] = fqdns
 
-            # add .'s to fqdns that don't have them
+            self.log.debug(
+                'lbs: len(regions)=%d, len(lbs)=%d, requests=%d',
+                len(self.regions),
+                len(lbs),
+                sum(rl.requests for rl in self._rate_limiters.values()),
+            )
             self._lbs = lbs.values()
 
         return self._lbs
 
+    @property
+    def index(self):
+        '''
+        Returns an `_FqdnIndex` of load balancers by their idna encoded fqdns.
+        '''
+        if self._index is None:
+            index = _FqdnIndex()
+            for lb in self.lbs:
+                for fqdn in lb['fqdns']:
+                    index.add(idna_encode(fqdn), lb)
+            self._index = index
+
+        return self._index
+
     def populate(self, zone, target=False, lenient=False):
         self.log.debug('populate: zone=%s', zone.name)
         before = len(zone.records)
 
-        for lb in self.lbs:
-            for fqdn in lb['fqdns']:
-                fqdn = idna_encode(fqdn)
-                if fqdn == zone.name:
-                    alias = Record.new(
-                        zone,
-                        '',
-                        {
-                            'type': 'ALIAS',
-                            'ttl': self.ttl,
-                            'value': lb['dns_name'],
-                        },
-                    )
-                    zone.add_record(alias)
-                elif fqdn.endswith(zone.name):
-                    hostname = zone.hostname_from_fqdn(fqdn)
-                    cname = Record.new(
-                        zone,
-                        hostname,
-                        {
-                            'type': 'CNAME',
-                            'ttl': self.ttl,
-                            'value': lb['dns_name'],
-                        },
-                    )
-                    zone.add_record(cname)
+        for fqdn, lb in self.index.find(zone.name):
+            if fqdn == zone.name:
+                alias = Record.new(
+                    zone,
+                    '',
+                    {'type': 'ALIAS', 'ttl': self.ttl, 'value': lb['dns_name']},
+                )
+                zone.add_record(alias)
+            else:
+                hostname = zone.hostname_from_fqdn(fqdn)
+                cname = Record.new(
+                    zone,
+                    hostname,
+                    {'type': 'CNAME', 'ttl': self.ttl, 'value': lb['dns_name']},
+                )
+                zone.add_record(cname)
 
         self.log.info(
             'populate:   found %s records', len(zone.records) - before
@@ -0,0 +1,16 @@
+#
+#
+#
+
+from pytest import fixture
+
+from octodns_route53.auth import _clear_caches
+
+
+@fixture(autouse=True)
+def clear_auth_caches():
+    # sessions and clients are shared process-wide, each test needs its own
+    # so that stubbers and mocks don't leak between them
+    _clear_caches()
+    yield
+    _clear_caches()
@@ -1,6 +1,12 @@
 #
 #
 #
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from os.path import join
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from time import monotonic
 from unittest import TestCase
 from unittest.mock import Mock, call, patch
 
@@ -8,19 +14,25 @@ from botocore.exceptions import ClientError
 from botocore.stub import ANY, Stubber
 
 from octodns.provider import SupportsException
+from octodns.provider.plan import Plan
 from octodns.record import Create, Delete, Record, Update
 from octodns.zone import Zone
 
 from octodns_route53 import Route53Provider, Route53ProviderException
+from octodns_route53.auth import _clear_caches
 from octodns_route53.processor import AwsAcmMangingProcessor
 from octodns_route53.provider import (
+    _batch_mods,
     _healthcheck_ref_prefix,
+    _HealthCheckIndex,
+    _mod_cost,
     _mod_keyer,
     _octal_replace,
     _Route53Alias,
     _Route53DynamicSubnetRule,
     _Route53DynamicValue,
     _Route53Record,
+    _ZoneRRSetIndex,
 )
 from octodns_route53.record import Route53AliasRecord, _Route53AliasValue
 
@@ -859,6 +871,181 @@ class TestRoute53Provider(TestCase):
         provider.update_r53_zones("unit.tests.")
         self.assertEqual(provider._r53_zones, {'unit.tests.': 'z41'})
 
+    def test_update_r53_zones_prefetch(self):
+        provider = Route53Provider(
+            'test', 'abc', '123', strict_supports=False, prefetch_workers=1
+        )
+        self.assertTrue(provider._rate_limiter)
+        stubber = Stubber(provider._conn)
+        stubber.activate()
+
+        list_hosted_zones = {
+            'HostedZones': [
+                {
+                    'Id': 'z40',
+                    'Name': 'unit.tests.',
+                    'CallerReference': 'abc',
+                    'Config': {'Comment': 'string', 'PrivateZone': False},
+                    'ResourceRecordSetCount': 2,
+                },
+                {
+                    'Id': 'z41',
+                    'Name': 'other.tests.',
+                    'CallerReference': 'abc',
+                    'Config': {'Comment': 'string', 'PrivateZone': False},
+                    'ResourceRecordSetCount': 1,
+                },
+            ],
+            'Marker': 'm',
+            'IsTruncated': False,
+            'MaxItems': '100',
+        }
+        stubber.add_response('list_hosted_zones', list_hosted_zones)
+
+        unit_rrsets = [
+            {
+                'Name': 'a.unit.tests.',
+                'Type': 'A',
+                'TTL': 60,
+                'ResourceRecords': [{'Value': '1.2.3.4'}],
+            }
+        ]
+        other_rrsets = [
+            {
+                'Name': 'a.other.tests.',
+                'Type': 'A',
+                'TTL': 60,
+                'ResourceRecords': [{'Value': '2.3.4.5'}],
+            }
+        ]
+        # with a single worker the zones load in order
+        stubber.add_response(
+            'list_resource_record_sets',
+            {
+                'ResourceRecordSets': unit_rrsets,
+                'IsTruncated': False,
+                'MaxItems': '100',
+            },
+            {'HostedZoneId': 'z40'},
+        )
+        stubber.add_response(
+            'list_resource_record_sets',
+            {
+                'ResourceRecordSets': other_rrsets,
+                'IsTruncated': False,
+                'MaxItems': '100',
+            },
+            {'HostedZoneId': 'z41'},
+        )
+
+        provider.update_r53_zones('unit.tests.')
+        stubber.assert_no_pending_responses()
+        self.assertEqual(
+            {'z40': unit_rrsets, 'z41': other_rrsets}, provider._r53_rrsets
+        )
+        # already loaded, no further calls
+        self.assertEqual(unit_rrsets, provider._load_records('z40'))
+
+    def test_prefetch_records_concurrent(self):
+        provider = Route53Provider(
+            'test', 'abc', '123', strict_supports=False, prefetch_workers=4
+        )
+        provider._r53_zones = {
+            f'z{i}.tests.': f'/hostedzone/Z{i}' for i in range(10)
+        }
+        # one of them has already been loaded and won't be refetched
+        provider._r53_rrsets['/hostedzone/Z3'] = ['cached']
+
+        with patch.object(
+            provider, '_fetch_records', side_effect=lambda zid: [zid]
+        ) as fetch_mock:
+            provider._prefetch_records()
+
+        self.assertEqual(9, fetch_mock.call_count)
+        self.assertEqual(10, len(provider._r53_rrsets))
+        self.assertEqual(['cached'], provider._r53_rrsets['/hostedzone/Z3'])
+        self.assertEqual(
+            ['/hostedzone/Z7'], provider._r53_rrsets['/hostedzone/Z7']
+        )
+
+    def test_prefetch_workers_invalid(self):
+        for bad in (0, -1, 'many'):
+            with self.assertRaises(Route53ProviderException) as ctx:
+                Route53Provider('test', 'abc', '123', prefetch_workers=bad)
+            self.assertEqual(
+                'prefetch_workers must be a positive integer',
+                str(ctx.exception),
+            )
+
+    def test_rate_limit(self):
+        # requests are always made concurrently so there's always a limiter,
+        # by default the API's shared by everyone with the same credentials
+        one = Route53Provider('one', 'abc', '123')
+        self.assertEqual(Route53Provider.API_RATE_LIMIT, one._rate_limiter.rate)
+        self.assertEqual('route53:None:abc:None', one._rate_limiter.name)
+        two = Route53Provider('two', 'abc', '123')
+        self.assertIs(one._rate_limiter, two._rate_limiter)
+        other = Route53Provider('other', 'def', '456')
+        self.assertIsNot(one._rate_limiter, other._rate_limiter)
+
+        provider = Route53Provider('test', 'abc', '123', rate_limit=2)
+        limiter = provider._rate_limiter
+        self.assertEqual(2, limiter.rate)
+        self.assertEqual(2, limiter.burst)
+        self.assertEqual('test', limiter.name)
+
+        provider = Route53Provider(
+            'test', 'abc', '123', rate_limit=2, rate_limit_burst=8
+        )
+        self.assertEqual(8, provider._rate_limiter.burst)
+
+        # prefetching defaults to the API's limit
+        provider = Route53Provider('test', 'abc', '123', prefetch_workers=2)
+        self.assertEqual(
+            Route53Provider.API_RATE_LIMIT, provider._rate_limiter.rate
+        )
+
+        with self.assertRaises(Route53ProviderException) as ctx:
+            Route53Provider('test', 'abc', '123', rate_limit=0)
+        self.assertEqual('rate must be positive', str(ctx.exception))
+
+    def test_rate_limit_group(self):
+        one = Route53Provider(
+            'one', 'abc', '123', rate_limit_group='test-rate-limit-group'
+        )
+        two = Route53Provider(
+            'two', 'abc', '123', rate_limit_group='test-rate-limit-group'
+        )
+        self.assertIs(one._rate_limiter, two._rate_limiter)
+        self.assertEqual(Route53Provider.API_RATE_LIMIT, one._rate_limiter.rate)
+
+        with self.assertRaises(Route53ProviderException) as ctx:
+            Route53Provider(
+                'three',
+                'abc',
+                '123',
+                rate_limit=1,
+                rate_limit_group='test-rate-limit-group',
+            )
+        self.assertTrue('already configured' in str(ctx.exception))
+
+    def test_log_rate_limit_stats(self):
+        provider = Route53Provider('test', 'abc', '123', rate_limit=10)
+        provider._rate_limiter.acquire()
+        provider._rate_limiter.throttled()
+        with patch.object(provider.log, 'log') as log_mock:
+            provider._log_rate_limit_stats('ctx')
+        log_mock.assert_called_once_with(
+            10,
+            '%s:   rate limit requests=%d, waits=%d, wait_time=%.3fs, '
+            'throttles=%d',
+            'ctx',
+            1,
+            0,
+            0,
+            1,
+        )
+
     def test_vpc_id_with_private_false_raises(self):
         with self.assertRaises(Route53ProviderException) as ctx:
             Route53Provider(
@@ -1014,6 +1201,159 @@ class TestRoute53Provider(TestCase):
         with self.assertRaises(Route53ProviderException):
             provider.update_r53_zones("unit.tests.")
 
+    def test_vpcs(self):
+        for vpcs in ([], 'vpc-1', [{'id': 'vpc-1'}], ['vpc-1']):
+            with self.assertRaises(Route53ProviderException) as ctx:
+                Route53Provider('test', 'abc', '123', vpcs=vpcs)
+            self.assertEqual(
+                'vpcs must be a list of VPCs, each with an id and region',
+                str(ctx.exception),
+            )
+        with self.assertRaises(Route53ProviderException) as ctx:
+            Route53Provider(
+                'test',
+                'abc',
+                '123',
+                vpc_id='vpc-1',
+                vpc_region='us-east-1',
+                vpcs=[{'id': 'vpc-2', 'region': 'us-east-1'}],
+            )
+        self.assertEqual('vpcs cannot be used with vpc_id', str(ctx.exception))
+
+        # vpc_id is a single vpc
+        provider = Route53Provider(
+            'test', 'abc', '123', vpc_id='vpc-1', vpc_region='us-east-1'
+        )
+        self.assertEqual(
+            [{'id': 'vpc-1', 'region': 'us-east-1'}], provider.vpcs
+        )
+
+        provider = Route53Provider(
+            'test',
+            'abc',
+            '123',
+            strict_supports=False,
+            vpcs=[
+                {'id': 'vpc-1', 'region': 'us-east-1'},
+                {'id': 'vpc-2', 'region': 'eu-west-1'},
+            ],
+        )
+        # the first is the one zones are created in
+        self.assertEqual('vpc-1', provider.vpc_id)
+        self.assertEqual('us-east-1', provider.vpc_region)
+        self.assertTrue(provider.private)
+        self.assertEqual(
+            'test:hosted-zones:vpc-1,vpc-2', provider._zone_catalog_key
+        )
+
+        # one at a time to keep the order of the stubbed responses
+        provider.VPC_WORKERS = 1
+        stubber = Stubber(provider._conn)
+        stubber.activate()
+        stubber.add_response(
+            'list_hosted_zones_by_vpc',
+            {
+                'HostedZoneSummaries': [
+                    {
+                        'HostedZoneId': 'z42',
+                        'Name': 'unit.tests.',
+                        'Owner': {'OwningAccount': '123456789012'},
+                    },
+                    {
+                        'HostedZoneId': 'z43',
+                        'Name': 'alpha.com.',
+                        'Owner': {'OwningAccount': '123456789012'},
+                    },
+                ],
+                'MaxItems': '100',
+            },
+            {'VPCId': 'vpc-1', 'VPCRegion': 'us-east-1'},
+        )
+        stubber.add_response(
+            'list_hosted_zones_by_vpc',
+            {
+                'HostedZoneSummaries': [
+                    {
+                        'HostedZoneId': 'z42',
+                        'Name': 'unit.tests.',
+                        'Owner': {'OwningAccount': '123456789012'},
+                    },
+                    {
+                        'HostedZoneId': 'z44',
+                        'Name': 'beta.com.',
+                        'Owner': {'OwningAccount': '123456789012'},
+                    },
+                ],
+                'MaxItems': '100',
+            },
+            {'VPCId': 'vpc-2', 'VPCRegion': 'eu-west-1'},
+        )
+        self.assertEqual(
+            ['alpha.com.', 'beta.com.', 'unit.tests.'], provider.list_zones()
+        )
+        stubber.assert_no_pending_responses()
+        self.assertEqual(
+            {
+                '/hostedzone/z42': ['vpc-1', 'vpc-2'],
+                '/hostedzone/z43': ['vpc-1'],
+                '/hostedzone/z44': ['vpc-2'],
+            },
+            {z['id']: z['vpcs'] for z in provider._zone_catalog['zones']},
+        )
+
+        # a zone shared by our vpcs is known to be without asking
+        self.assertEqual(
+            ['vpc-1', 'vpc-2'], provider._get_zone_vpcs('/hostedzone/z42')
+        )
+        # one in a single one of ours may be in others
+        stubber.add_response(
+            'get_hosted_zone',
+            {
+                'HostedZone': {
+                    'Id': '/hostedzone/z43',
+                    'Name': 'alpha.com.',
+                    'CallerReference': 'abc',
+                },
+                'VPCs': [
+                    {'VPCId': 'vpc-1', 'VPCRegion': 'us-east-1'},
+                    {'VPCId': 'vpc-3', 'VPCRegion': 'us-east-1'},
+                ],
+            },
+            {'Id': '/hostedzone/z43'},
+        )
+        self.assertEqual(
+            ['vpc-1', 'vpc-3'], provider._get_zone_vpcs('/hostedzone/z43')
+        )
+        stubber.assert_no_pending_responses()
+
+        # zones are created in the first of our vpcs
+        stubber.add_response(
+            'create_hosted_zone',
+            {
+                'HostedZone': {
+                    'Name': 'new.tests.',
+                    'Id': '/hostedzone/z45',
+                    'CallerReference': 'abe',
+                },
+                'ChangeInfo': {
+                    'Id': 'a12',
+                    'Status': 'PENDING',
+                    'SubmittedAt': '2017-01-29T01:02:03Z',
+                },
+                'DelegationSet': {'NameServers': ['n12.unit.tests.']},
+                'Location': 'us-east-1',
+            },
+            {
+                'Name': 'new.tests.',
+                'CallerReference': ANY,
+                'VPC': {'VPCId': 'vpc-1', 'VPCRegion': 'us-east-1'},
+            },
+        )
+        self.assertEqual(
+            '/hostedzone/z45', provider._get_zone_id('new.tests.', True)
+        )
+        self.assertEqual(['vpc-1'], provider._zone_catalog['zones'][-1]['vpcs'])
+
     def test_vpc_id_missing_region_raises(self):
         # vpc_region is required when vpc_id is specified
         with self.assertRaises(Route53ProviderException) as ctx:
@@ -1098,6 +1438,35 @@ class TestRoute53Provider(TestCase):
             {'/hostedzone/z42': ['vpc-12345678', 'vpc-other']},
         )
 
+    def test_get_zone_vpcs_concurrent(self):
+        provider, _ = self._get_stubbed_vpc_provider()
+        fetching = Event()
+        release = Event()
+
+        def get_hosted_zone(Id):
+            if Id == 'za':
+                fetching.set()
+                release.wait(5)
+            return {'VPCs': [{'VPCId': f'vpc-{Id}'}]}
+
+        with patch.object(
+            provider._conn, 'get_hosted_zone', side_effect=get_hosted_zone
+        ) as get_mock:
+            lookup = Thread(target=provider._get_zone_vpcs, args=('za',))
+            lookup.start()
+            self.assertTrue(fetching.wait(5))
+            # another zone isn't held up by the one in flight
+            self.assertEqual(['vpc-zb'], provider._get_zone_vpcs('zb'))
+            self.assertFalse(release.is_set())
+            release.set()
+            lookup.join(5)
+            # and each is only fetched once
+            self.assertEqual(['vpc-za'], provider._get_zone_vpcs('za'))
+        self.assertEqual(2, get_mock.call_count)
+        self.assertEqual(
+            {'za': ['vpc-za'], 'zb': ['vpc-zb']}, provider._multi_vpc_zones
+        )
+
     def test_vpc_multi_action_error_raises_for_multi_vpc_zone(self):
         # Test that _apply() raises exception for multi-VPC zone with error mode
         provider = Route53Provider(
@@ -1459,60 +1828,287 @@ class TestRoute53Provider(TestCase):
             provider._r53_zones, {'0/25.2.0.192.in-addr.arpa.': 'z41'}
         )
 
-    # with fallback boto makes an unstubbed call to the 169. metadata api, this
-    # stubs that bit out
-    @patch('botocore.credentials.CredentialResolver.load_credentials')
-    def test_process_desired_zone(self, fetch_metadata_token_mock):
-        provider, stubber = self._get_stubbed_fallback_auth_provider()
-        fetch_metadata_token_mock.side_effect = [None]
+    def test_get_zones_by_name_auto(self):
+        with self.assertRaises(Route53ProviderException) as ctx:
+            Route53Provider('test', 'abc', '123', get_zones_by_name='yes')
+        self.assertEqual(
+            "get_zones_by_name must be true, false, or 'auto'",
+            str(ctx.exception),
+        )
 
-        # No records, essentially a no-op
-        desired = Zone('unit.tests.', [])
-        ns_record = Record.new(
-            desired,
-            '',
-            data={
-                'type': 'NS',
-                'ttl': 1800,
-                'values': ('ns1.unit.tests.', 'ns2.unit.tests.'),
-            },
+        provider = Route53Provider(
+            'test',
+            'abc',
+            '123',
+            get_zones_by_name='auto',
+            strict_supports=False,
         )
-        desired.add_record(ns_record)
-        got = provider._process_desired_zone(desired)
-        self.assertEqual(desired.records, got.records)
+        stubber = Stubber(provider._conn)
+        stubber.activate()
 
-        # Record without any geos
-        desired = Zone('unit.tests.', [])
-        desired.add_record(ns_record)
-        record = Record.new(
-            desired,
-            'a',
-            {
-                'ttl': 30,
-                'type': 'A',
-                'value': '1.2.3.4',
-                'dynamic': {
-                    'pools': {'one': {'values': [{'value': '2.2.3.4'}]}},
-                    'rules': [{'pool': 'one'}],
+        def by_name(name, id=None):
+            zones = []
+            if id:
+                zones.append({'Id': id, 'Name': name, 'CallerReference': 'abc'})
+            stubber.add_response(
+                'list_hosted_zones_by_name',
+                {
+                    'HostedZones': zones,
+                    'DNSName': name,
+                    'IsTruncated': False,
+                    'MaxItems': '100',
                 },
-            },
-        )
-        desired.add_record(record)
-        got = provider._process_desired_zone(desired)
-        self.assertEqual(desired.records, got.records)
-        dynamic = [r for r in got.records if r._type == 'A'][0]
-        self.assertEqual(1, len(dynamic.dynamic.rules))
-        self.assertFalse('geos' in dynamic.dynamic.rules[0].data)
+                {'DNSName': name, 'MaxItems': '100'},
+            )
 
-        # Record where all geos are supported
-        desired = Zone('unit.tests.', [])
-        desired.add_record(ns_record)
-        record = Record.new(
-            desired,
-            'a',
+        # 201 zones take 3 requests to list, so the first 3 zones are looked
+        # up by name
+        stubber.add_response(
+            'get_hosted_zone_count', {'HostedZoneCount': 201}, {}
+        )
+        by_name('a.tests.', 'za')
+        by_name('b.tests.')
+        by_name('c.tests.', 'zc')
+        self.assertEqual('za', provider._get_zone_id('a.tests.'))
+        self.assertIsNone(provider._get_zone_id('b.tests.'))
+        self.assertEqual('zc', provider._get_zone_id('c.tests.'))
+        # zones we already know about cost nothing
+        self.assertEqual('za', provider._get_zone_id('a.tests.'))
+        stubber.assert_no_pending_responses()
+        self.assertEqual(3, provider._zones_by_name_requests)
+
+        # after which they're listed
+        stubber.add_response(
+            'list_hosted_zones',
             {
-                'ttl': 30,
-                'type': 'A',
+                'HostedZones': [
+                    {'Id': 'za', 'Name': 'a.tests.', 'CallerReference': 'a'},
+                    {'Id': 'zd', 'Name': 'd.tests.', 'CallerReference': 'd'},
+                ],
+                'Marker': '',
+                'IsTruncated': False,
+                'MaxItems': '100',
+            },
+            {},
+        )
+        self.assertEqual('zd', provider._get_zone_id('d.tests.'))
+        # and there's no need to look up any more
+        self.assertIsNone(provider._get_zone_id('e.tests.'))
+        stubber.assert_no_pending_responses()
+        # what we'd found by name is kept
+        self.assertEqual(
+            {'a.tests.': 'za', 'c.tests.': 'zc', 'd.tests.': 'zd'},
+            provider._r53_zones,
+        )
+
+    def test_get_zones_by_name_auto_with_catalog(self):
+        provider = Route53Provider(
+            'test',
+            'abc',
+            '123',
+            get_zones_by_name='auto',
+            strict_supports=False,
+        )
+        stubber = Stubber(provider._conn)
+        stubber.activate()
+
+        # the catalog was already loaded by list_zones so it's used directly
+        stubber.add_response(
+            'list_hosted_zones',
+            {
+                'HostedZones': [
+                    {'Id': 'za', 'Name': 'a.tests.', 'CallerReference': 'a'}
+                ],
+                'Marker': '',
+                'IsTruncated': False,
+                'MaxItems': '100',
+            },
+            {},
+        )
+        self.assertEqual(['a.tests.'], provider.list_zones())
+        self.assertEqual('za', provider._get_zone_id('a.tests.'))
+        stubber.assert_no_pending_responses()
+
+        # as is a persisted one
+        with TemporaryDirectory() as tmpdir:
+            path = join(tmpdir, 'cache.db')
+            provider = Route53Provider(
+                'test',
+                'abc',
+                '123',
+                get_zones_by_name='auto',
+                cache_path=path,
+                zone_cache_ttl=60,
+            )
+            provider._zone_cache.put(
+                provider._zone_catalog_key,
+                {
+                    'delegated': False,
+                    'zones': [
+                        {
+                            'id': 'zb',
+                            'name': 'b.tests.',
+                            'private': False,
+                            'delegation_set_id': None,
+                            'record_count': None,
+                        }
+                    ],
+                },
+            )
+            self.assertEqual('zb', provider._get_zone_id('b.tests.'))
+
+        # with a vpc we need its catalog regardless
+        provider = Route53Provider(
+            'test',
+            'abc',
+            '123',
+            get_zones_by_name='auto',
+            vpc_id='vpc-1',
+            vpc_region='us-east-1',
+        )
+        self.assertFalse(provider._use_zones_by_name())
+
+    def test_get_zones_by_name_auto_switches_during_lookup(self):
+        provider = Route53Provider(
+            'test',
+            'abc',
+            '123',
+            get_zones_by_name='auto',
+            strict_supports=False,
+        )
+        # listing takes a single request so after one lookup we list
+        provider._zone_catalog_requests = 1
+        looking_up = Event()
+        release = Event()
+
+        def get_zone_id_by_name(name):
+            looking_up.set()
+            release.wait(5)
+            return 'za'
+
+        def list_hosted_zones():
+            # the listing happens while the lookup is in flight
+            self.assertFalse(release.is_set())
+            return {'b.tests.': 'zb'}
+
+        with patch.object(
+            provider, '_get_zone_id_by_name', side_effect=get_zone_id_by_name
+        ), patch.object(
+            provider, '_list_hosted_zones', side_effect=list_hosted_zones
+        ):
+            lookup = Thread(
+                target=provider.update_r53_zones, args=('a.tests.',)
+            )
+            lookup.start()
+            self.assertTrue(looking_up.wait(5))
+            provider.update_r53_zones('b.tests.')
+            self.assertTrue(provider._r53_zones_listed)
+            release.set()
+            lookup.join(5)
+            self.assertFalse(lookup.is_alive())
+
+        # the lookup's result made it into the listed zones
+        self.assertEqual(
+            {'a.tests.': 'za', 'b.tests.': 'zb'}, provider._r53_zones
+        )
+
+    def test_get_zones_by_name_looked_up_once(self):
+        provider, stubber = (
+            self._get_stubbed_get_zones_by_name_enabled_provider()
+        )
+        provider._r53_zones = {}
+
+        # another thread looks the zone up while we wait for its lock
+        locks = provider._locks
+
+        @contextmanager
+        def racing_locks(key):
+            with locks(key):
+                if key == 'zone:unit.tests.':
+                    provider._r53_zones['unit.tests.'] = 'z42'
+                yield
+
+        provider._locks = racing_locks
+        provider.update_r53_zones('unit.tests.')
+        self.assertEqual({'unit.tests.': 'z42'}, provider._r53_zones)
+
+        # or lists all of the zones
+        provider = Route53Provider(
+            'test',
+            'abc',
+            '123',
+            get_zones_by_name='auto',
+            strict_supports=False,
+        )
+        provider._r53_zones = {}
+        provider._zone_catalog = {'delegated': False, 'zones': []}
+        locks = provider._locks
+
+        @contextmanager
+        def listing_locks(key):
+            with locks(key):
+                if key == 'zone:unit.tests.':
+                    provider._r53_zones_listed = True
+                yield
+
+        provider._locks = listing_locks
+        provider.update_r53_zones('unit.tests.')
+        self.assertEqual({}, provider._r53_zones)
+
+    # with fallback boto makes an unstubbed call to the 169. metadata api, this
+    # stubs that bit out
+    @patch('botocore.credentials.CredentialResolver.load_credentials')
+    def test_process_desired_zone(self, fetch_metadata_token_mock):
+        provider, stubber = self._get_stubbed_fallback_auth_provider()
+        fetch_metadata_token_mock.side_effect = [None]
+
+        # No records, essentially a no-op
+        desired = Zone('unit.tests.', [])
+        ns_record = Record.new(
+            desired,
+            '',
+            data={
+                'type': 'NS',
+                'ttl': 1800,
+                'values': ('ns1.unit.tests.', 'ns2.unit.tests.'),
+            },
+        )
+        desired.add_record(ns_record)
+        got = provider._process_desired_zone(desired)
+        self.assertEqual(desired.records, got.records)
+
+        # Record without any geos
+        desired = Zone('unit.tests.', [])
+        desired.add_record(ns_record)
+        record = Record.new(
+            desired,
+            'a',
+            {
+                'ttl': 30,
+                'type': 'A',
+                'value': '1.2.3.4',
+                'dynamic': {
+                    'pools': {'one': {'values': [{'value': '2.2.3.4'}]}},
+                    'rules': [{'pool': 'one'}],
+                },
+            },
+        )
+        desired.add_record(record)
+        got = provider._process_desired_zone(desired)
+        self.assertEqual(desired.records, got.records)
+        dynamic = [r for r in got.records if r._type == 'A'][0]
+        self.assertEqual(1, len(dynamic.dynamic.rules))
+        self.assertFalse('geos' in dynamic.dynamic.rules[0].data)
+
+        # Record where all geos are supported
+        desired = Zone('unit.tests.', [])
+        desired.add_record(ns_record)
+        record = Record.new(
+            desired,
+            'a',
+            {
+                'ttl': 30,
+                'type': 'A',
                 'value': '1.2.3.4',
                 'dynamic': {
                     'pools': {
@@ -1682,17 +2278,27 @@ class TestRoute53Provider(TestCase):
     @patch('octodns_route53.auth.Session')
     def test_populate_with_role_acquisition(self, session_cls_mock):
         # a mock so that when `assume_role` is called on it we get back new
-        # assumed credentials
+        # assumed credentials, the first set expires soon enough that they'll
+        # need to be refreshed before use
+        now = datetime.now(timezone.utc)
         assume_role_mock = Mock()
         assume_role_mock.assume_role.side_effect = [
             {
                 'Credentials': {
-                    'AccessKeyId': 42,
-                    'SecretAccessKey': 43,
-                    'Expiration': 44,
-                    'SessionToken': 45,
+                    'AccessKeyId': '42',
+                    'SecretAccessKey': '43',
+                    'Expiration': now + timedelta(minutes=1),
+                    'SessionToken': '45',
                 }
-            }
+            },
+            {
+                'Credentials': {
+                    'AccessKeyId': '52',
+                    'SecretAccessKey': '53',
+                    'Expiration': now + timedelta(hours=1),
+                    'SessionToken': '55',
+                }
+            },
         ]
         # first call will be for the STS client which needs to assume role,
         # the second call will be for the route53 client, it won't be used
@@ -1710,23 +2316,16 @@ class TestRoute53Provider(TestCase):
             role_arn=role_arn,
         )
         # make sure assume role was called with the exepected role_arn
-        session_cls_mock.assert_has_calls(
-            [
-                call(
-                    aws_access_key_id='abc',
-                    aws_secret_access_key='123',
-                    aws_session_token=None,
-                ),
-                call(
-                    aws_access_key_id=42,
-                    aws_secret_access_key=43,
-                    aws_session_token=45,
-                ),
-            ]
-        )
-        assume_role_mock.assume_role.assert_called_once_with(
-            RoleArn=role_arn, RoleSessionName='octodns-route53-test'
+        self.assertEqual(
+            call(
+                aws_access_key_id='abc',
+                aws_secret_access_key='123',
+                aws_session_token=None,
+            ),
+            session_cls_mock.call_args_list[0],
         )
+        # the role isn't assumed until its credentials are used
+        assume_role_mock.assume_role.assert_not_called()
         session_mock1.client.assert_called_once_with(
             service_name='sts', config=None
         )
@@ -1734,6 +2333,122 @@ class TestRoute53Provider(TestCase):
             service_name='route53', config=None
         )
 
+        # the role session uses refreshable credentials from the assumption
+        botocore_session = session_cls_mock.call_args_list[1].kwargs[
+            'botocore_session'
+        ]
+        credentials = botocore_session.get_credentials()
+        self.assertEqual('sts-assume-role', credentials.method)
+        assume_role_mock.assume_role.assert_not_called()
+        # using them assumes the role
+        frozen = credentials.get_frozen_credentials()
+        self.assertEqual(
+            ('42', '43', '45'),
+            (frozen.access_key, frozen.secret_key, frozen.token),
+        )
+        # they're about to expire so using them again assumes it again
+        frozen = credentials.get_frozen_credentials()
+        self.assertEqual(
+            ('52', '53', '55'),
+            (frozen.access_key, frozen.secret_key, frozen.token),
+        )
+        self.assertEqual(2, assume_role_mock.assume_role.call_count)
+        # the session's named after the provider
+        assume_role_mock.assume_role.assert_called_with(
+            RoleArn=role_arn, RoleSessionName='octodns-route53-test'
+        )
+
+    @patch('octodns_route53.auth.Session')
+    def test_role_acquisition_shared(self, session_cls_mock):
+        assume_role_mock = Mock()
+        assume_role_mock.assume_role.side_effect = [
+            {
+                'Credentials': {
+                    'AccessKeyId': '42',
+                    'SecretAccessKey': '43',
+                    'Expiration': datetime.now(timezone.utc)
+                    + timedelta(hours=1),
+                    'SessionToken': '45',
+                }
+            }
+        ]
+        session_mock1 = Mock()
+        session_mock1.client.side_effect = [assume_role_mock]
+        session_mock2 = Mock()
+        session_mock2.client.side_effect = [Mock(), Mock()]
+        session_cls_mock.side_effect = [session_mock1, session_mock2]
+
+        role_arn = 'arn:aws:iam:12345:role/foo'
+        # providers sharing the role's session have to agree on its name
+        one = Route53Provider(
+            id='one',
+            access_key_id='abc',
+            secret_access_key='123',
+            role_arn=role_arn,
+            role_session_name='octodns',
+        )
+        two = Route53Provider(
+            id='two',
+            access_key_id='abc',
+            secret_access_key='123',
+            role_arn=role_arn,
+            role_session_name='octodns',
+        )
+        # the session and client are shared
+        self.assertEqual(2, session_cls_mock.call_count)
+        self.assertIs(one._conn, two._conn)
+        # and the role's only assumed once, when it's first used
+        credentials = (
+            session_cls_mock.call_args_list[1]
+            .kwargs['botocore_session']
+            .get_credentials()
+        )
+        assume_role_mock.assume_role.assert_not_called()
+        self.assertEqual('42', credentials.access_key)
+        self.assertEqual('42', credentials.access_key)
+        assume_role_mock.assume_role.assert_called_once_with(
+            RoleArn=role_arn, RoleSessionName='octodns'
+        )
+
+        # a provider with its own rate limiter gets its own client from the
+        # same session
+        three = Route53Provider(
+            id='three',
+            access_key_id='abc',
+            secret_access_key='123',
+            role_arn=role_arn,
+            role_session_name='octodns',
+            rate_limit=2,
+        )
+        self.assertIsNot(one._conn, three._conn)
+        assume_role_mock.assume_role.assert_called_once()
+        self.assertEqual(2, session_cls_mock.call_count)
+
+        # while the default, per-provider, session name means a session of
+        # its own, the STS client is still shared
+        session_mock3 = Mock()
+        session_mock3.client.side_effect = [Mock()]
+        session_cls_mock.side_effect = [session_mock3]
+        four = Route53Provider(
+            id='four',
+            access_key_id='abc',
+            secret_access_key='123',
+            role_arn=role_arn,
+        )
+        self.assertIsNot(one._conn, four._conn)
+        self.assertEqual(3, session_cls_mock.call_count)
+
+    def test_client_reuse(self):
+        one = Route53Provider('one', 'abc', '123')
+        two = Route53Provider('two', 'abc', '123')
+        self.assertIs(one._conn, two._conn)
+
+        # different credentials or config means a different client
+        other = Route53Provider('other', 'abc', '456')
+        self.assertIsNot(one._conn, other._conn)
+        attempts = Route53Provider('attempts', 'abc', '123', 10, 3)
+        self.assertIsNot(one._conn, attempts._conn)
+
     def test_list_zones(self):
         provider, stubber = self._get_stubbed_provider()
 
@@ -1921,6 +2636,7 @@ class TestRoute53Provider(TestCase):
     def test_delegated_list_zones(self):
         provider, stubber = self._get_stubbed_delegation_set_provider()
 
+        # only our delegation set is listed
         list_hosted_zones_resp = {
             'HostedZones': [
                 {'Name': 'unit.tests.', 'Id': 'z42', 'CallerReference': 'abc'},
@@ -1938,7 +2654,7 @@ class TestRoute53Provider(TestCase):
         )
         list_hosted_zones_resp = {
             'HostedZones': [
-                {'Name': 'other.tests.', 'Id': 'z43', 'CallerReference': 'abe'},
+                {'Name': 'other.tests.', 'Id': 'z44', 'CallerReference': 'abe'},
                 {'Name': 'beta.com.', 'Id': 'z45', 'CallerReference': 'abf'},
             ],
             'Marker': 'm',
@@ -1954,17 +2670,72 @@ class TestRoute53Provider(TestCase):
             ['alpha.com.', 'beta.com.', 'other.tests.', 'unit.tests.'],
             provider.list_zones(),
         )
+        stubber.assert_no_pending_responses()
+        # the catalog of all of the zones isn't needed for that
+        self.assertIsNone(provider._zone_catalog)
 
-    def test_populate(self):
-        provider, stubber = self._get_stubbed_provider()
-
-        got = Zone('unit.tests.', [])
-        with self.assertRaises(ClientError):
-            stubber.add_client_error('list_hosted_zones')
-            provider.populate(got)
+        # looking zones up lists the catalog, which isn't limited to our
+        # delegation set
+        stubber.add_response(
+            'list_hosted_zones',
+            {
+                'HostedZones': [
+                    {
+                        'Name': 'unit.tests.',
+                        'Id': 'z42',
+                        'CallerReference': 'abc',
+                    },
+                    {
+                        'Name': 'alpha.com.',
+                        'Id': 'z43',
+                        'CallerReference': 'abd',
+                    },
+                    {
+                        'Name': 'other.tests.',
+                        'Id': 'z44',
+                        'CallerReference': 'abe',
+                    },
+                    {
+                        'Name': 'beta.com.',
+                        'Id': 'z45',
+                        'CallerReference': 'abf',
+                    },
+                    # not in our delegation set
+                    {
+                        'Name': 'gamma.com.',
+                        'Id': 'z46',
+                        'CallerReference': 'abg',
+                    },
+                ],
+                'Marker': '',
+                'IsTruncated': False,
+                'MaxItems': '100',
+            },
+            {},
+        )
+        self.assertEqual('z46', provider._get_zone_id('gamma.com.'))
+        stubber.assert_no_pending_responses()
+        # and knows which zones are in the delegation set
+        catalog = provider._zone_catalog
+        self.assertTrue(catalog['delegated'])
+        self.assertEqual(
+            ['ABCDEFG123456'] * 4 + [None],
+            [z['delegation_set_id'] for z in catalog['zones']],
+        )
+        self.assertEqual(
+            ['alpha.com.', 'beta.com.', 'other.tests.', 'unit.tests.'],
+            provider.list_zones(),
+        )
 
-        with self.assertRaises(ClientError):
-            list_hosted_zones_resp = {
+        # with the catalog already loaded, only the delegation set is listed
+        # and then the catalog's marked
+        provider._delegated_zones = None
+        catalog['delegated'] = False
+        for zone in catalog['zones']:
+            zone['delegation_set_id'] = None
+        stubber.add_response(
+            'list_hosted_zones',
+            {
                 'HostedZones': [
                     {
                         'Name': 'unit.tests.',
@@ -1972,22 +2743,146 @@ class TestRoute53Provider(TestCase):
                         'CallerReference': 'abc',
                     }
                 ],
-                'Marker': 'm',
+                'Marker': '',
                 'IsTruncated': False,
                 'MaxItems': '100',
-            }
-            stubber.add_response(
-                'list_hosted_zones', list_hosted_zones_resp, {}
-            )
-            stubber.add_client_error(
-                'list_resource_record_sets',
-                expected_params={'HostedZoneId': u'z42'},
-            )
-            provider.populate(got)
-            stubber.assert_no_pending_responses()
+            },
+            {'DelegationSetId': provider.delegation_set_id},
+        )
+        self.assertEqual(['unit.tests.'], provider.list_zones())
+        stubber.assert_no_pending_responses()
+        self.assertTrue(catalog['delegated'])
+        # and once it's been marked it's used without listing
+        provider._delegated_zones = None
+        self.assertEqual(['unit.tests.'], provider.list_zones())
 
-        # list_hosted_zones has been cached from now on so we don't have to
-        # worry about stubbing it
+        # zones we create are in our delegation set
+        stubber.add_response(
+            'create_hosted_zone',
+            {
+                'HostedZone': {
+                    'Name': 'new.tests.',
+                    'Id': 'z47',
+                    'CallerReference': 'abh',
+                },
+                'ChangeInfo': {
+                    'Id': 'a12',
+                    'Status': 'PENDING',
+                    'SubmittedAt': '2017-01-29T01:02:03Z',
+                },
+                'DelegationSet': {'NameServers': ['n12.unit.tests.']},
+                'Location': 'us-east-1',
+            },
+        )
+        self.assertEqual('z47', provider._get_zone_id('new.tests.', True))
+        self.assertEqual(['new.tests.', 'unit.tests.'], provider.list_zones())
+
+    def test_zone_catalog(self):
+        provider, stubber = self._get_stubbed_provider()
+
+        stubber.add_response(
+            'list_hosted_zones',
+            {
+                'HostedZones': [
+                    {
+                        'Name': 'unit.tests.',
+                        'Id': 'z42',
+                        'CallerReference': 'abc',
+                        'ResourceRecordSetCount': 3,
+                    },
+                    {
+                        'Name': '\\052.wild.tests.',
+                        'Id': 'z43',
+                        'CallerReference': 'abd',
+                    },
+                ],
+                'Marker': '',
+                'IsTruncated': False,
+                'MaxItems': '100',
+            },
+            {},
+        )
+
+        # list_zones and zone lookups share a single listing
+        self.assertEqual(
+            ['*.wild.tests.', 'unit.tests.'], provider.list_zones()
+        )
+        self.assertEqual('z42', provider._get_zone_id('unit.tests.'))
+        self.assertEqual('z43', provider._get_zone_id('*.wild.tests.'))
+        stubber.assert_no_pending_responses()
+        self.assertEqual(
+            {'z42': 3, 'z43': None}, provider._r53_zone_record_counts
+        )
+        self.assertEqual(
+            {
+                'id': 'z42',
+                'name': 'unit.tests.',
+                'private': False,
+                'delegation_set_id': None,
+                'record_count': 3,
+                'vpcs': None,
+            },
+            provider._zone_catalog['zones'][0],
+        )
+
+        # a zone we create is added to the catalog
+        stubber.add_response(
+            'create_hosted_zone',
+            {
+                'HostedZone': {
+                    'Name': 'new.tests.',
+                    'Id': 'z44',
+                    'CallerReference': 'abe',
+                },
+                'ChangeInfo': {
+                    'Id': 'a12',
+                    'Status': 'PENDING',
+                    'SubmittedAt': '2017-01-29T01:02:03Z',
+                },
+                'DelegationSet': {'NameServers': ['n12.unit.tests.']},
+                'Location': 'us-east-1',
+            },
+            {'Name': 'new.tests.', 'CallerReference': ANY},
+        )
+        self.assertEqual('z44', provider._get_zone_id('new.tests.', True))
+        self.assertEqual(
+            ['*.wild.tests.', 'new.tests.', 'unit.tests.'],
+            provider.list_zones(),
+        )
+
+    def test_populate(self):
+        provider, stubber = self._get_stubbed_provider()
+
+        got = Zone('unit.tests.', [])
+        with self.assertRaises(ClientError):
+            stubber.add_client_error('list_hosted_zones')
+            provider.populate(got)
+
+        with self.assertRaises(ClientError):
+            list_hosted_zones_resp = {
+                'HostedZones': [
+                    {
+                        'Name': 'unit.tests.',
+                        'Id': 'z42',
+                        'CallerReference': 'abc',
+                    }
+                ],
+                'Marker': 'm',
+                'IsTruncated': False,
+                'MaxItems': '100',
+            }
+            stubber.add_response(
+                'list_hosted_zones', list_hosted_zones_resp, {}
+            )
+            stubber.add_client_error(
+                'list_resource_record_sets',
+                expected_params={'HostedZoneId': u'z42'},
+            )
+            provider.populate(got)
+            stubber.assert_no_pending_responses()
+
+        # list_hosted_zones has been cached from now on so we don't have to
+        # worry about stubbing it
 
         list_resource_record_sets_resp_p1 = {
             'ResourceRecordSets': [
@@ -2218,6 +3113,130 @@ class TestRoute53Provider(TestCase):
         self.assertEqual(0, len(changes))
         stubber.assert_no_pending_responses()
 
+    def test_populate_streams_pages(self):
+        provider, stubber = self._get_stubbed_provider()
+
+        stubber.add_response(
+            'list_hosted_zones',
+            {
+                'HostedZones': [
+                    {
+                        'Name': 'unit.tests.',
+                        'Id': 'z42',
+                        'CallerReference': 'abc',
+                    }
+                ],
+                'Marker': 'm',
+                'IsTruncated': False,
+                'MaxItems': '100',
+            },
+            {},
+        )
+        first = {
+            'Name': 'a.unit.tests.',
+            'Type': 'A',
+            'ResourceRecords': [{'Value': '1.2.3.4'}],
+            'TTL': 30,
+        }
+        # a second rrset for the same name & type, only the first is used
+        second = {
+            'Name': 'a.unit.tests.',
+            'Type': 'A',
+            'ResourceRecords': [{'Value': '2.3.4.5'}],
+            'TTL': 60,
+        }
+        stubber.add_response(
+            'list_resource_record_sets',
+            {
+                'ResourceRecordSets': [first],
+                'IsTruncated': True,
+                'NextRecordName': 'a.unit.tests.',
+                'NextRecordType': 'A',
+                'MaxItems': '1',
+            },
+            {'HostedZoneId': 'z42'},
+        )
+        stubber.add_response(
+            'list_resource_record_sets',
+            {
+                'ResourceRecordSets': [second],
+                'IsTruncated': False,
+                'MaxItems': '1',
+            },
+            {
+                'HostedZoneId': 'z42',
+                'StartRecordName': 'a.unit.tests.',
+                'StartRecordType': 'A',
+            },
+        )
+
+        got = Zone('unit.tests.', [])
+        provider.populate(got, target=True)
+        stubber.assert_no_pending_responses()
+        self.assertEqual(1, len(got.records))
+        record = list(got.records)[0]
+        self.assertEqual(30, record.ttl)
+        self.assertEqual(['1.2.3.4'], record.values)
+        # the streamed rrsets were kept for everything else that needs them
+        self.assertEqual([first, second], provider._load_records('z42'))
+        provider._rrset_index('z42')
+
+        # and the second time around they're reused
+        got = Zone('unit.tests.', [])
+        provider.populate(got)
+        self.assertEqual(1, len(got.records))
+        # but as a source they're not held on to
+        self.assertEqual({}, provider._r53_rrsets)
+        self.assertEqual({}, provider._r53_rrset_indexes)
+
+    def test_iter_records(self):
+        provider = Route53Provider('test', 'abc', '123')
+        pages = [['a', 'b'], ['c']]
+
+        # a consumer that doesn't keep them gets them all, but they're not
+        # stored
+        with patch.object(
+            provider, '_iter_record_pages', return_value=iter(pages)
+        ):
+            self.assertEqual(
+                ['a', 'b', 'c'], list(provider._iter_records('z42', False))
+            )
+        self.assertEqual({}, provider._r53_rrsets)
+
+        # one that stops part way through doesn't leave the zone locked
+        with patch.object(
+            provider, '_iter_record_pages', return_value=iter(pages)
+        ):
+            records = provider._iter_records('z42')
+            self.assertEqual('a', next(records))
+            acquired = []
+
+            def acquire():
+                lock = provider._locks('rrsets:z42')
+                acquired.append(lock.acquire(timeout=5))
+                lock.release()
+
+            thread = Thread(target=acquire)
+            thread.start()
+            thread.join()
+            self.assertEqual([True], acquired)
+            records.close()
+        self.assertEqual({}, provider._r53_rrsets)
+
+        # another thread loads them while we're streaming, theirs are kept
+        def raced_pages(zone_id):
+            yield ['a']
+            provider._r53_rrsets[zone_id] = ['raced']
+
+        with patch.object(
+            provider, '_iter_record_pages', side_effect=raced_pages
+        ):
+            self.assertEqual(['a'], list(provider._iter_records('z42')))
+        self.assertEqual({'z42': ['raced']}, provider._r53_rrsets)
+
+        # and once loaded they're used as is
+        self.assertEqual(['raced'], list(provider._iter_records('z42')))
+
     def test_sync(self):
         provider, stubber = self._get_stubbed_provider()
 
@@ -3366,13 +4385,183 @@ class TestRoute53Provider(TestCase):
         self.assertFalse(ml)
         self.assertEqual(30, ri)
 
-    def test_health_check_gc(self):
+    def test_concurrent_loads(self):
+        provider = Route53Provider('test', 'abc', '123')
+
+        def single_flight(fn, method, ret):
+            calls = []
+            started = Event()
+            release = Event()
+
+            def load(*args, **kwargs):
+                calls.append(args)
+                started.set()
+                release.wait(5)
+                return ret
+
+            results = []
+            with patch.object(provider, method, side_effect=load):
+                threads = [
+                    Thread(target=lambda: results.append(fn()))
+                    for _ in range(4)
+                ]
+                for thread in threads:
+                    thread.start()
+                # hold the first one up so that the others have to wait on it
+                started.wait(5)
+                release.set()
+                for thread in threads:
+                    thread.join()
+            return calls, results
+
+        # a zone's records are only fetched once
+        rrsets = [{'Name': 'a.unit.tests.', 'Type': 'A'}]
+        calls, results = single_flight(
+            lambda: provider._load_records('z42'), '_fetch_records', rrsets
+        )
+        self.assertEqual([('z42',)], calls)
+        self.assertEqual([rrsets] * 4, results)
+
+        # as is the list of zones
+        calls, results = single_flight(
+            lambda: provider._get_zone_id('unit.tests.'),
+            '_list_hosted_zones',
+            {'unit.tests.': 'z42'},
+        )
+        self.assertEqual([()], calls)
+        self.assertEqual(['z42'] * 4, results)
+
+        # and the health checks
+        with patch.object(provider._conn, 'list_health_checks') as list_mock:
+            list_mock.return_value = {'HealthChecks': [], 'IsTruncated': False}
+            threads = [
+                Thread(target=lambda: provider.health_checks) for _ in range(4)
+            ]
+            with provider._locks('health-checks'):
+                # they all queue up behind us
+                for thread in threads:
+                    thread.start()
+            for thread in threads:
+                thread.join()
+            list_mock.assert_called_once()
+
+    def test_apply_state_is_per_thread(self):
+        provider = Route53Provider('test', 'abc', '123')
+        provider._health_check_gc.add('42')
+        provider._health_check_queue = {}
+
+        seen = []
+
+        def other():
+            seen.append(provider._health_check_gc)
+            seen.append(provider._health_check_queue)
+
+        thread = Thread(target=other)
+        thread.start()
+        thread.join()
+        self.assertEqual([set(), None], seen)
+        self.assertEqual({'42'}, provider._health_check_gc)
+        self.assertEqual({}, provider._health_check_queue)
+
+    def test_lazy_health_checks(self):
+        provider, stubber = self._get_stubbed_provider()
+        # one at a time so that the stubbed responses line up
+        provider.HEALTH_CHECK_WORKERS = 1
+
+        ours = {
+            'Id': '42',
+            'CallerReference': self.caller_ref,
+            'HealthCheckConfig': {'Type': 'TCP'},
+            'HealthCheckVersion': 1,
+        }
+        stubber.add_response(
+            'get_health_check', {'HealthCheck': ours}, {'HealthCheckId': '42'}
+        )
+        stubber.add_response(
+            'get_health_check',
+            {
+                'HealthCheck': {
+                    'Id': '43',
+                    'CallerReference': 'someone-elses',
+                    'HealthCheckConfig': {'Type': 'TCP'},
+                    'HealthCheckVersion': 1,
+                }
+            },
+            {'HealthCheckId': '43'},
+        )
+        stubber.add_client_error(
+            'get_health_check',
+            'NoSuchHealthCheck',
+            expected_params={'HealthCheckId': '44'},
+        )
+        rrsets = [
+            {'Name': 'a.unit.tests.', 'HealthCheckId': '43'},
+            {'Name': 'b.unit.tests.', 'HealthCheckId': '42'},
+            {'Name': 'c.unit.tests.'},
+            {'Name': 'd.unit.tests.', 'HealthCheckId': '44'},
+            {'Name': 'e.unit.tests.', 'HealthCheckId': '42'},
+        ]
+        provider._prefetch_health_checks(rrsets)
+        stubber.assert_no_pending_responses()
+        # each id is only fetched once
+        provider._prefetch_health_checks(rrsets)
+        provider._prefetch_health_checks([{'Name': 'c.unit.tests.'}])
+
+        self.assertEqual(ours, provider._health_check('42'))
+        # not ours
+        with self.assertRaises(KeyError):
+            provider._health_check('43')
+        # doesn't exist
+        with self.assertRaises(KeyError):
+            provider._health_check('44')
+        with self.assertRaises(KeyError):
+            provider._health_check(None)
+        # everything but our's wasn't loaded
+        self.assertIsNone(provider._health_checks)
+
+        # other errors are passed along
+        stubber.add_client_error(
+            'get_health_check',
+            'AccessDenied',
+            expected_params={'HealthCheckId': '45'},
+        )
+        with self.assertRaises(ClientError):
+            provider._health_check('45')
+
+        # prefetched health checks don't need a lock
+        self.assertFalse('health-check:42' in provider._locks._locks)
+
+        # another thread fetches it while we wait for its lock
+        locks = provider._locks
+
+        @contextmanager
+        def racing_locks(key):
+            with locks(key):
+                if key == 'health-check:48':
+                    provider._health_checks_by_id['48'] = ours
+                yield
+
+        provider._locks = racing_locks
+        self.assertEqual(ours, provider._health_check('48'))
+        stubber.assert_no_pending_responses()
+
+        # once the full list is loaded it's used instead
+        provider._health_checks = {'46': ours}
+        provider._prefetch_health_checks([{'HealthCheckId': '47'}])
+        stubber.assert_no_pending_responses()
+        self.assertEqual(ours, provider._health_check('46'))
+        with self.assertRaises(KeyError):
+            provider._health_check('42')
+
+    def test_queue_health_checks(self):
         provider, stubber = self._get_stubbed_provider()
+        # one at a time so that the stubbed responses line up
+        provider.HEALTH_CHECK_WORKERS = 1
 
         stubber.add_response(
             'list_health_checks',
             {
-                'HealthChecks': self.health_checks,
+                'HealthChecks': [],
                 'IsTruncated': False,
                 'MaxItems': '100',
                 'Marker': '',
@@ -3388,65 +4577,205 @@ class TestRoute53Provider(TestCase):
                 'values': ['2.2.3.4', '3.2.3.4'],
                 'dynamic': {
                     'pools': {
-                        'AF': {'values': [{'value': '4.2.3.4'}]},
-                        'NA-US': {
+                        'AF': {
                             'values': [
-                                {'value': '5.2.3.4'},
-                                {'value': '6.2.3.4'},
+                                {'value': '4.2.3.4'},
+                                {'value': '5.2.3.4', 'status': 'up'},
                             ]
                         },
+                        # the same value in another pool shares the check
+                        'EU': {'values': [{'value': '4.2.3.4'}]},
+                        'NA': {'values': [{'value': '6.2.3.4'}]},
                     },
                     'rules': [
                         {'pool': 'AF', 'geos': ['AF']},
-                        {'pool': 'NA-US'},
+                        {'pool': 'EU', 'geos': ['EU']},
+                        {'pool': 'NA'},
                     ],
                 },
+                'octodns': {
+                    'healthcheck': {
+                        'host': 'foo.bar.com',
+                        'path': '/_status',
+                        'port': 8080,
+                        'protocol': 'HTTP',
+                    }
+                },
             },
         )
-
-        # gc no longer in_use records (directly)
-        stubber.add_response('delete_health_check', {}, {'HealthCheckId': '93'})
-        stubber.add_response('delete_health_check', {}, {'HealthCheckId': '44'})
-        provider._gc_health_checks(
-            record, [DummyR53Record('42'), DummyR53Record('43')]
+        static = Record.new(
+            self.expected,
+            'static',
+            {'ttl': 61, 'type': 'A', 'value': '2.2.3.4'},
         )
-        stubber.assert_no_pending_responses()
 
-        # gc through _mod_Create
-        stubber.add_response('delete_health_check', {}, {'HealthCheckId': '44'})
-        change = Create(record)
-        provider._mod_Create(change, 'z43', [])
-        stubber.assert_no_pending_responses()
+        def config(ip):
+            return {
+                'Disabled': False,
+                'EnableSNI': False,
+                'Inverted': False,
+                'FailureThreshold': 6,
+                'FullyQualifiedDomainName': 'foo.bar.com',
+                'IPAddress': ip,
+                'MeasureLatency': True,
+                'Port': 8080,
+                'RequestInterval': 10,
+                'ResourcePath': '/_status',
+                'Type': 'HTTP',
+            }
 
-        # gc through _mod_Update
-        stubber.add_response('delete_health_check', {}, {'HealthCheckId': '44'})
-        # first record is ignored for our purposes, we have to pass something
-        change = Update(record, record)
-        provider._mod_Create(change, 'z43', [])
-        stubber.assert_no_pending_responses()
+        # all of the checks are created and then all of them are tagged
+        for id, ip in (('50', '4.2.3.4'), ('51', '6.2.3.4')):
+            stubber.add_response(
+                'create_health_check',
+                {
+                    'HealthCheck': {
+                        'Id': id,
+                        'CallerReference': self.caller_ref,
+                        'HealthCheckConfig': config(ip),
+                        'HealthCheckVersion': 1,
+                    },
+                    'Location': 'http://url',
+                },
+                {'CallerReference': ANY, 'HealthCheckConfig': config(ip)},
+            )
+        for id, ip in (('50', '4.2.3.4'), ('51', '6.2.3.4')):
+            stubber.add_response(
+                'change_tags_for_resource',
+                {},
+                {
+                    'ResourceType': 'healthcheck',
+                    'ResourceId': id,
+                    'AddTags': [
+                        {'Key': 'Name', 'Value': f'unit.tests.:A - {ip}'}
+                    ],
+                },
+            )
 
-        # gc through _mod_Delete, expect 4 to go away, can't check order
-        # b/c it's not deterministic
-        stubber.add_response('delete_health_check', {}, {'HealthCheckId': ANY})
-        stubber.add_response('delete_health_check', {}, {'HealthCheckId': ANY})
-        stubber.add_response('delete_health_check', {}, {'HealthCheckId': ANY})
-        stubber.add_response('delete_health_check', {}, {'HealthCheckId': ANY})
-        change = Delete(record)
-        provider._mod_Delete(change, 'z43', [])
+        changes = [Create(record), Create(static), Delete(static)]
+        provider._queue_health_checks(changes, 'z42', None)
         stubber.assert_no_pending_responses()
+        self.assertIsNone(provider._health_check_queue)
+        self.assertEqual(
+            {'Name': 'unit.tests.:A - 6.2.3.4'},
+            provider.health_checks['51']['Tags'],
+        )
 
-        # gc only AAAA, leave the A's alone
-        stubber.add_response('delete_health_check', {}, {'HealthCheckId': '45'})
-        record = Record.new(
-            self.expected,
-            '',
-            {
-                'ttl': 61,
-                'type': 'AAAA',
-                'value': '2001:0db8:3c4d:0015:0000:0000:1a2f:1a4b',
-            },
+        # generating the records now finds the checks, nothing more to create
+        records = provider._gen_records(record, 'z42', creating=True)
+        self.assertEqual(
+            {None, '50', '51'},
+            set(getattr(r, 'health_check_id', None) for r in records),
+        )
+        # nothing needed the second time around
+        provider._queue_health_checks(changes, 'z42', None)
+        stubber.assert_no_pending_responses()
+
+    def test_health_check_gc(self):
+        provider, stubber = self._get_stubbed_provider()
+
+        stubber.add_response(
+            'list_health_checks',
+            {
+                'HealthChecks': self.health_checks,
+                'IsTruncated': False,
+                'MaxItems': '100',
+                'Marker': '',
+            },
+        )
+
+        record = Record.new(
+            self.expected,
+            '',
+            {
+                'ttl': 61,
+                'type': 'A',
+                'values': ['2.2.3.4', '3.2.3.4'],
+                'dynamic': {
+                    'pools': {
+                        'AF': {'values': [{'value': '4.2.3.4'}]},
+                        'NA-US': {
+                            'values': [
+                                {'value': '5.2.3.4'},
+                                {'value': '6.2.3.4'},
+                            ]
+                        },
+                    },
+                    'rules': [
+                        {'pool': 'AF', 'geos': ['AF']},
+                        {'pool': 'NA-US'},
+                    ],
+                },
+            },
+        )
+
+        # one at a time so that deletes happen in a predictable order
+        provider.HEALTH_CHECK_WORKERS = 1
+
+        # gc no longer in_use records (directly), they're only queued up
+        provider._gc_health_checks(
+            record, [DummyR53Record('42'), DummyR53Record('43')]
+        )
+        self.assertEqual({'44', '93'}, provider._health_check_gc)
+        stubber.add_response('delete_health_check', {}, {'HealthCheckId': '44'})
+        stubber.add_response('delete_health_check', {}, {'HealthCheckId': '93'})
+        provider._delete_health_checks()
+        stubber.assert_no_pending_responses()
+        self.assertEqual(set(), provider._health_check_gc)
+        # they're gone, including from the index
+        self.assertFalse('44' in provider.health_checks)
+        index = provider.health_check_index
+        self.assertEqual(
+            ['42', '43'],
+            [id for id, _, _ in index.for_record('A', 'unit.tests.', None)],
+        )
+        self.assertFalse('44' in index.order)
+        # nothing queued, nothing to do
+        provider._delete_health_checks()
+
+        # start over with all of them
+        provider._health_checks = None
+        stubber.add_response(
+            'list_health_checks',
+            {
+                'HealthChecks': self.health_checks,
+                'IsTruncated': False,
+                'MaxItems': '100',
+                'Marker': '',
+            },
+        )
+
+        # gc through _mod_Create
+        change = Create(record)
+        provider._mod_Create(change, 'z43', [])
+        self.assertEqual({'44'}, provider._health_check_gc)
+        provider._health_check_gc.clear()
+
+        # gc through _mod_Update
+        # first record is ignored for our purposes, we have to pass something
+        change = Update(record, record)
+        provider._mod_Update(change, 'z43', [])
+        self.assertEqual({'44'}, provider._health_check_gc)
+        provider._health_check_gc.clear()
+
+        # gc through _mod_Delete, expect 4 to go away
+        change = Delete(record)
+        provider._mod_Delete(change, 'z43', [])
+        self.assertEqual({'42', '43', '44', '93'}, provider._health_check_gc)
+        provider._health_check_gc.clear()
+
+        # gc only AAAA, leave the A's alone
+        record = Record.new(
+            self.expected,
+            '',
+            {
+                'ttl': 61,
+                'type': 'AAAA',
+                'value': '2001:0db8:3c4d:0015:0000:0000:1a2f:1a4b',
+            },
         )
         provider._gc_health_checks(record, [])
+        self.assertEqual({'45'}, provider._health_check_gc)
         stubber.assert_no_pending_responses()
 
     def test_legacy_health_check_gc(self):
@@ -3535,6 +4864,7 @@ class TestRoute53Provider(TestCase):
         stubber.add_response('delete_health_check', {}, {'HealthCheckId': '43'})
 
         provider._gc_health_checks(record, [DummyR53Record('42')])
+        provider._delete_health_checks()
         stubber.assert_no_pending_responses()
 
     def test_no_extra_changes(self):
@@ -4042,34 +5372,31 @@ class TestRoute53Provider(TestCase):
             list_resource_record_sets_resp,
             {'HostedZoneId': 'z42'},
         )
+        # only the referenced health check is fetched
         stubber.add_response(
-            'list_health_checks',
+            'get_health_check',
             {
-                'HealthChecks': [
-                    {
-                        'Id': '42',
-                        'CallerReference': 'foo',
-                        'HealthCheckConfig': {
-                            'Disabled': False,
-                            'EnableSNI': True,
-                            'Inverted': False,
-                            'Type': 'HTTPS',
-                            'FullyQualifiedDomainName': 'a.unit.tests',
-                            'IPAddress': '2.2.3.4',
-                            'ResourcePath': '/_dns',
-                            'Type': 'HTTPS',
-                            'Port': 443,
-                            'MeasureLatency': True,
-                            'RequestInterval': 10,
-                            'FailureThreshold': 6,
-                        },
-                        'HealthCheckVersion': 2,
-                    }
-                ],
-                'IsTruncated': False,
-                'MaxItems': '100',
-                'Marker': '',
+                'HealthCheck': {
+                    'Id': '42',
+                    'CallerReference': 'foo',
+                    'HealthCheckConfig': {
+                        'Disabled': False,
+                        'EnableSNI': True,
+                        'Inverted': False,
+                        'Type': 'HTTPS',
+                        'FullyQualifiedDomainName': 'a.unit.tests',
+                        'IPAddress': '2.2.3.4',
+                        'ResourcePath': '/_dns',
+                        'Type': 'HTTPS',
+                        'Port': 443,
+                        'MeasureLatency': True,
+                        'RequestInterval': 10,
+                        'FailureThreshold': 6,
+                    },
+                    'HealthCheckVersion': 2,
+                }
             },
+            {'HealthCheckId': '42'},
         )
         extra = provider._extra_changes(desired=desired, changes=[])
         self.assertEqual(1, len(extra))
@@ -4155,34 +5482,31 @@ class TestRoute53Provider(TestCase):
             list_resource_record_sets_resp,
             {'HostedZoneId': 'z42'},
         )
+        # only the referenced health check is fetched
         stubber.add_response(
-            'list_health_checks',
+            'get_health_check',
             {
-                'HealthChecks': [
-                    {
-                        'Id': '42',
-                        'CallerReference': self.caller_ref,
-                        'HealthCheckConfig': {
-                            'Disabled': False,
-                            'EnableSNI': True,
-                            'Inverted': False,
-                            'Type': 'HTTPS',
-                            'FullyQualifiedDomainName': 'a.unit.tests',
-                            'IPAddress': '2.2.3.4',
-                            'ResourcePath': '/_dns',
-                            'Type': 'HTTPS',
-                            'Port': 443,
-                            'MeasureLatency': True,
-                            'RequestInterval': 10,
-                            'FailureThreshold': 6,
-                        },
-                        'HealthCheckVersion': 2,
-                    }
-                ],
-                'IsTruncated': False,
-                'MaxItems': '100',
-                'Marker': '',
+                'HealthCheck': {
+                    'Id': '42',
+                    'CallerReference': self.caller_ref,
+                    'HealthCheckConfig': {
+                        'Disabled': False,
+                        'EnableSNI': True,
+                        'Inverted': False,
+                        'Type': 'HTTPS',
+                        'FullyQualifiedDomainName': 'a.unit.tests',
+                        'IPAddress': '2.2.3.4',
+                        'ResourcePath': '/_dns',
+                        'Type': 'HTTPS',
+                        'Port': 443,
+                        'MeasureLatency': True,
+                        'RequestInterval': 10,
+                        'FailureThreshold': 6,
+                    },
+                    'HealthCheckVersion': 2,
+                }
             },
+            {'HealthCheckId': '42'},
         )
         extra = provider._extra_changes(desired=desired, changes=[])
         self.assertEqual(0, len(extra))
@@ -4299,34 +5623,31 @@ class TestRoute53Provider(TestCase):
             list_resource_record_sets_resp,
             {'HostedZoneId': 'z42'},
         )
+        # only the referenced health check is fetched
         stubber.add_response(
-            'list_health_checks',
+            'get_health_check',
             {
-                'HealthChecks': [
-                    {
-                        'Id': '42',
-                        'CallerReference': self.caller_ref,
-                        'HealthCheckConfig': {
-                            'Disabled': False,
-                            'EnableSNI': True,
-                            'Inverted': False,
-                            'Type': 'HTTPS',
-                            'FullyQualifiedDomainName': 'a.unit.tests',
-                            'IPAddress': '2.2.3.4',
-                            'ResourcePath': '/_dns',
-                            'Type': 'HTTPS',
-                            'Port': 443,
-                            'MeasureLatency': True,
-                            'RequestInterval': 10,
-                            'FailureThreshold': 6,
-                        },
-                        'HealthCheckVersion': 2,
-                    }
-                ],
-                'IsTruncated': False,
-                'MaxItems': '100',
-                'Marker': '',
+                'HealthCheck': {
+                    'Id': '42',
+                    'CallerReference': self.caller_ref,
+                    'HealthCheckConfig': {
+                        'Disabled': False,
+                        'EnableSNI': True,
+                        'Inverted': False,
+                        'Type': 'HTTPS',
+                        'FullyQualifiedDomainName': 'a.unit.tests',
+                        'IPAddress': '2.2.3.4',
+                        'ResourcePath': '/_dns',
+                        'Type': 'HTTPS',
+                        'Port': 443,
+                        'MeasureLatency': True,
+                        'RequestInterval': 10,
+                        'FailureThreshold': 6,
+                    },
+                    'HealthCheckVersion': 2,
+                }
             },
+            {'HealthCheckId': '42'},
         )
         extra = provider._extra_changes(desired=desired, changes=[])
         self.assertEqual(0, len(extra))
@@ -4491,33 +5812,30 @@ class TestRoute53Provider(TestCase):
             {'HostedZoneId': 'z42'},
         )
 
+        # only the referenced health check is fetched
         stubber.add_response(
-            'list_health_checks',
+            'get_health_check',
             {
-                'HealthChecks': [
-                    {
-                        'Id': '42',
-                        'CallerReference': self.caller_ref,
-                        'HealthCheckConfig': {
-                            'Disabled': False,
-                            'EnableSNI': True,
-                            'Inverted': False,
-                            'Type': 'HTTPS',
-                            'FullyQualifiedDomainName': 'one.cname.unit.tests.',
-                            'ResourcePath': '/_dns',
-                            'Type': 'HTTPS',
-                            'Port': 443,
-                            'MeasureLatency': True,
-                            'RequestInterval': 10,
-                            'FailureThreshold': 6,
-                        },
-                        'HealthCheckVersion': 2,
-                    }
-                ],
-                'IsTruncated': False,
-                'MaxItems': '100',
-                'Marker': '',
+                'HealthCheck': {
+                    'Id': '42',
+                    'CallerReference': self.caller_ref,
+                    'HealthCheckConfig': {
+                        'Disabled': False,
+                        'EnableSNI': True,
+                        'Inverted': False,
+                        'Type': 'HTTPS',
+                        'FullyQualifiedDomainName': 'one.cname.unit.tests.',
+                        'ResourcePath': '/_dns',
+                        'Type': 'HTTPS',
+                        'Port': 443,
+                        'MeasureLatency': True,
+                        'RequestInterval': 10,
+                        'FailureThreshold': 6,
+                    },
+                    'HealthCheckVersion': 2,
+                }
             },
+            {'HealthCheckId': '42'},
         )
         extra = provider._extra_changes(desired=desired, changes=[])
         self.assertEqual(0, len(extra))
@@ -4610,37 +5928,44 @@ class TestRoute53Provider(TestCase):
 
         return provider, plan
 
-    # _get_test_plan() returns a plan with 11 modifications, 17 RRs
+    # _get_test_plan() returns a plan with 12 changes, 32 RRs, the first of
+    # which is a dynamic record with 16
 
     @patch('octodns_route53.Route53Provider._load_records')
     @patch('octodns_route53.Route53Provider._really_apply')
     def test_apply_1(self, really_apply_mock, _):
-        # 18 RRs with max of 19 should only get applied in one call
-        provider, plan = self._get_test_plan(20)
+        # 32 RRs with max of 32 should only get applied in one call
+        provider, plan = self._get_test_plan(32)
         provider.apply(plan)
         really_apply_mock.assert_called_once()
 
     @patch('octodns_route53.Route53Provider._load_records')
     @patch('octodns_route53.Route53Provider._really_apply')
     def test_apply_2(self, really_apply_mock, _):
-        # 18 RRs with max of 17 should only get applied in two calls
-        provider, plan = self._get_test_plan(18)
+        # 32 RRs with max of 31 should get applied in two calls
+        provider, plan = self._get_test_plan(31)
         provider.apply(plan)
         self.assertEqual(2, really_apply_mock.call_count)
 
     @patch('octodns_route53.Route53Provider._load_records')
     @patch('octodns_route53.Route53Provider._really_apply')
     def test_apply_3(self, really_apply_mock, _):
-        # with a max of seven modifications, three calls
-        provider, plan = self._get_test_plan(7)
+        # with a max of 10 the dynamic record has to be split up, four calls
+        provider, plan = self._get_test_plan(10)
         provider.apply(plan)
         self.assertEqual(4, really_apply_mock.call_count)
+        batches = [c[0][0] for c in really_apply_mock.call_args_list]
+        self.assertEqual([9, 9, 8, 1], [len(b) for b in batches])
+        # each batch is full, and nothing was lost or duplicated
+        self.assertEqual(
+            [10, 10, 10, 2], [sum(_mod_cost(m)[0] for m in b) for b in batches]
+        )
 
     @patch('octodns_route53.Route53Provider._load_records')
     @patch('octodns_route53.Route53Provider._really_apply')
     def test_apply_4(self, really_apply_mock, _):
-        # with a max of 11 modifications, two calls
-        provider, plan = self._get_test_plan(11)
+        # with a max of 20 the dynamic record fits with a few others, two calls
+        provider, plan = self._get_test_plan(20)
         provider.apply(plan)
         self.assertEqual(2, really_apply_mock.call_count)
 
@@ -4649,9 +5974,168 @@ class TestRoute53Provider(TestCase):
     def test_apply_bad(self, really_apply_mock, _):
         # with a max of 1 modifications, fail
         provider, plan = self._get_test_plan(1)
-        with self.assertRaises(Exception) as ctx:
+        with self.assertRaises(Route53ProviderException) as ctx:
+            provider.apply(plan)
+        self.assertEqual(
+            'Too many modifications for _octodns-default-pool.unit.tests. A: '
+            '2 ResourceRecords, 14 characters',
+            str(ctx.exception),
+        )
+        really_apply_mock.assert_not_called()
+
+    @patch('octodns_route53.Route53Provider._delete_health_checks')
+    @patch('octodns_route53.Route53Provider._load_records')
+    @patch('octodns_route53.Route53Provider._really_apply')
+    def test_apply_deletes_health_checks_last(
+        self, really_apply_mock, _, delete_health_checks_mock
+    ):
+        provider, plan = self._get_test_plan(20)
+        manager = Mock()
+        manager.attach_mock(really_apply_mock, 'really_apply')
+        manager.attach_mock(delete_health_checks_mock, 'delete_health_checks')
+        # left over from an earlier apply that failed
+        provider._health_check_gc.add('stale')
+        provider.apply(plan)
+        self.assertNotIn('stale', provider._health_check_gc)
+        # health checks are only deleted once all of the batches are in
+        self.assertEqual(
+            ['really_apply', 'really_apply', 'delete_health_checks'],
+            [c[0] for c in manager.mock_calls],
+        )
+
+        # and not at all if a batch fails
+        _clear_caches()
+        provider, plan = self._get_test_plan(20)
+        really_apply_mock.reset_mock()
+        really_apply_mock.side_effect = [{'Id': 'c1'}, Exception('boom')]
+        delete_health_checks_mock.reset_mock()
+        with self.assertRaises(Exception):
             provider.apply(plan)
-        self.assertTrue('modifications' in str(ctx.exception))
+        self.assertEqual(2, really_apply_mock.call_count)
+        delete_health_checks_mock.assert_not_called()
+
+    @patch('octodns_route53.Route53Provider._wait_for_insync')
+    @patch('octodns_route53.Route53Provider._load_records')
+    @patch('octodns_route53.Route53Provider._really_apply')
+    def test_apply_wait_for_insync(
+        self, really_apply_mock, _, wait_for_insync_mock
+    ):
+        provider, plan = self._get_test_plan(20)
+        really_apply_mock.side_effect = [{'Id': 'c1'}, {'Id': 'c2'}]
+        provider.wait_for_insync = True
+        provider.apply(plan)
+        wait_for_insync_mock.assert_called_once()
+        submitted = wait_for_insync_mock.call_args[0][0]
+        self.assertEqual(
+            [{'Id': 'c1'}, {'Id': 'c2'}], [ci for ci, _ in submitted]
+        )
+
+    @patch('octodns_route53.provider.sleep')
+    def test_wait_for_insync(self, sleep_mock):
+        provider = Route53Provider(
+            'test', 'abc', '123', wait_for_insync=True, insync_workers=1
+        )
+        stubber = Stubber(provider._conn)
+        stubber.activate()
+
+        def change_info(id, status):
+            return {
+                'ChangeInfo': {
+                    'Id': id,
+                    'Status': status,
+                    'SubmittedAt': '2017-01-29T01:02:03Z',
+                }
+            }
+
+        stubber.add_response(
+            'change_resource_record_sets',
+            change_info('c1', 'PENDING'),
+            {'HostedZoneId': 'z42', 'ChangeBatch': ANY},
+        )
+        change = {
+            'Action': 'UPSERT',
+            'ResourceRecordSet': {
+                'Name': 'a.unit.tests.',
+                'ResourceRecords': [{'Value': '1.2.3.4'}],
+                'TTL': 60,
+                'Type': 'A',
+            },
+        }
+        first = provider._really_apply([change], 'z42')
+        self.assertEqual('c1', first['Id'])
+        self.assertEqual('PENDING', first['Status'])
+
+        # with a single worker things are polled in order, c1 takes a couple
+        # tries, c2 was already in sync
+        stubber.add_response(
+            'get_change', change_info('c1', 'PENDING'), {'Id': 'c1'}
+        )
+        stubber.add_response(
+            'get_change', change_info('c1', 'INSYNC'), {'Id': 'c1'}
+        )
+        provider._wait_for_insync(
+            [
+                (first, monotonic()),
+                (change_info('c2', 'INSYNC')['ChangeInfo'], monotonic()),
+            ]
+        )
+        stubber.assert_no_pending_responses()
+
+        # back-off grows with jitter
+        self.assertEqual(2, sleep_mock.call_count)
+        first_sleep = sleep_mock.call_args_list[0][0][0]
+        self.assertTrue(0.5 <= first_sleep <= 1)
+        second_sleep = sleep_mock.call_args_list[1][0][0]
+        self.assertTrue(1 <= second_sleep <= 2)
+
+    @patch('octodns_route53.provider.sleep')
+    def test_wait_for_insync_timeout(self, sleep_mock):
+        provider = Route53Provider(
+            'test', 'abc', '123', wait_for_insync=True, insync_timeout=10
+        )
+        with self.assertRaises(Route53ProviderException) as ctx:
+            provider._wait_for_insync(
+                [({'Id': 'c1', 'Status': 'PENDING'}, monotonic() - 11)]
+            )
+        self.assertEqual(
+            'Timed out waiting for change c1 to be INSYNC, status=PENDING',
+            str(ctx.exception),
+        )
+        sleep_mock.assert_not_called()
+
+    @patch('octodns_route53.Route53Provider._load_records')
+    def test_apply_wait_for_insync_nothing_submitted(self, load_records_mock):
+        provider, stubber = self._get_stubbed_provider()
+        provider.wait_for_insync = True
+        provider._r53_zones = {'unit.tests.': 'z42'}
+        provider._health_checks = {}
+        record = Record.new(
+            self.expected, 'a', {'ttl': 60, 'type': 'A', 'value': '1.2.3.4'}
+        )
+        load_records_mock.side_effect = [
+            [
+                {
+                    'Name': 'a.unit.tests.',
+                    'ResourceRecords': [{'Value': '1.2.3.4'}],
+                    'TTL': 60,
+                    'Type': 'A',
+                }
+            ]
+        ]
+        # the update's a no-op so nothing's submitted, or waited for
+        plan = Plan(
+            self.expected, self.expected, [Update(record, record)], True
+        )
+        provider.apply(plan)
+        stubber.assert_no_pending_responses()
+
+    def test_insync_workers_invalid(self):
+        for bad in (0, 'many'):
+            with self.assertRaises(Route53ProviderException) as ctx:
+                Route53Provider('test', 'abc', '123', insync_workers=bad)
+            self.assertEqual(
+                'insync_workers must be a positive integer', str(ctx.exception)
+            )
 
     def test_semicolon_fixup(self):
         provider = Route53Provider('test', 'abc', '123')
@@ -4690,13 +6174,13 @@ class TestRoute53Provider(TestCase):
         self.assertEqual(dynamic_record_data, data)
 
     @patch('octodns_route53.Route53Provider._get_zone_id')
-    @patch('octodns_route53.Route53Provider._load_records')
-    def test_dynamic_populate(self, load_records_mock, get_zone_id_mock):
+    @patch('octodns_route53.Route53Provider._iter_records')
+    def test_dynamic_populate(self, iter_records_mock, get_zone_id_mock):
         provider = Route53Provider('test', 'abc', '123')
         provider._health_checks = {}
 
         get_zone_id_mock.side_effect = ['z44']
-        load_records_mock.side_effect = [dynamic_rrsets]
+        iter_records_mock.side_effect = [dynamic_rrsets]
 
         got = Zone('unit.tests.', [])
         provider.populate(got)
@@ -4776,8 +6260,8 @@ class TestRoute53Provider(TestCase):
         self.assertEqual({'pool': 'external'}, rules[1])
 
     @patch('octodns_route53.Route53Provider._get_zone_id')
-    @patch('octodns_route53.Route53Provider._load_records')
-    def test_dynamic_subnet_populate(self, load_records_mock, get_zone_id_mock):
+    @patch('octodns_route53.Route53Provider._iter_records')
+    def test_dynamic_subnet_populate(self, iter_records_mock, get_zone_id_mock):
         provider = Route53Provider('test', 'abc', '123')
         provider._health_checks = {}
         provider._cidr_collections = {
@@ -4785,7 +6269,7 @@ class TestRoute53Provider(TestCase):
         }
 
         get_zone_id_mock.side_effect = ['z44']
-        load_records_mock.side_effect = [dynamic_subnet_rrsets]
+        iter_records_mock.side_effect = [dynamic_subnet_rrsets]
 
         got = Zone('unit.tests.', [])
         provider.populate(got)
@@ -4838,8 +6322,12 @@ class TestRoute53Provider(TestCase):
         )
         result = provider._get_cidr_collection()
         self.assertEqual('col-1234', result)
+        # it's only looked up once
+        self.assertEqual('col-1234', provider._get_cidr_collection())
+        stubber.assert_no_pending_responses()
 
         # Collection doesn't exist
+        provider._cidr_collection_ids.clear()
         stubber.add_response(
             'list_cidr_collections',
             {
@@ -4855,8 +6343,12 @@ class TestRoute53Provider(TestCase):
         )
         result = provider._get_cidr_collection()
         self.assertIsNone(result)
+        # which is remembered too
+        self.assertIsNone(provider._get_cidr_collection())
+        stubber.assert_no_pending_responses()
 
         # Paginated response
+        provider._cidr_collection_ids.clear()
         stubber.add_response(
             'list_cidr_collections',
             {
@@ -4965,8 +6457,14 @@ class TestRoute53Provider(TestCase):
         desired = {loc: ['10.0.0.0/8', '172.16.0.0/12']}
         provider._sync_cidr_locations('col-1234', desired)
 
-        # Cache should be invalidated
-        self.assertNotIn('col-1234', provider._cidr_collections)
+        # Cache should be written through
+        self.assertEqual(
+            {
+                loc: ['10.0.0.0/8', '172.16.0.0/12'],
+                'da3508145559327a': ['192.168.0.0/16'],
+            },
+            provider._cidr_collections['col-1234'],
+        )
         stubber.assert_no_pending_responses()
 
     def test_sync_cidr_locations_add_blocks(self):
@@ -4997,7 +6495,10 @@ class TestRoute53Provider(TestCase):
         desired = {loc: ['40.71.0.0/16', '10.0.0.0/8', '97.120.173.0/24']}
         provider._sync_cidr_locations('col-1234', desired)
 
-        self.assertNotIn('col-1234', provider._cidr_collections)
+        self.assertEqual(
+            {loc: ['40.71.0.0/16', '10.0.0.0/8', '97.120.173.0/24']},
+            provider._cidr_collections['col-1234'],
+        )
         stubber.assert_no_pending_responses()
 
     def test_sync_cidr_locations_existing_subset(self):
@@ -5074,27 +6575,159 @@ class TestRoute53Provider(TestCase):
         result = provider._get_or_create_cidr_collection()
         self.assertEqual('col-new', result)
         stubber.assert_no_pending_responses()
+        # which is remembered, and known to be empty
+        self.assertEqual('col-new', provider._get_cidr_collection())
+        self.assertEqual({}, provider._load_cidr_blocks('col-new'))
 
-    def test_load_cidr_blocks_paginated(self):
+    def test_sync_cidr_locations_planned(self):
         provider, stubber = self._get_stubbed_provider()
+        provider._cidr_collections = {'col-1234': {}}
+
+        def zone(name, subnets):
+            zone = Zone(name, [])
+            zone.add_record(
+                Record.new(
+                    zone,
+                    'a',
+                    {
+                        'type': 'A',
+                        'ttl': 60,
+                        'value': '1.1.1.1',
+                        'dynamic': {
+                            'pools': {
+                                'one': {'values': [{'value': '2.2.2.2'}]},
+                                'two': {'values': [{'value': '3.3.3.3'}]},
+                            },
+                            'rules': [
+                                {'pool': 'one', 'subnets': subnets},
+                                {'pool': 'two'},
+                            ],
+                        },
+                    },
+                )
+            )
+            return zone
+
+        one = zone('one.tests.', ['10.1.0.0/16', '10.2.0.0/16'])
+        two = zone('two.tests.', ['10.3.0.0/16'])
+        three = zone('three.tests.', ['10.4.0.0/16'])
+        loc_one = provider._cidr_location_name(['10.1.0.0/16', '10.2.0.0/16'])
+        loc_two = provider._cidr_location_name(['10.3.0.0/16'])
+        loc_three = provider._cidr_location_name(['10.4.0.0/16'])
+
+        # one and two have changes, three doesn't
+        with patch(
+            'octodns.provider.base.BaseProvider.plan',
+            side_effect=[Mock(desired=one), Mock(desired=two), None],
+        ):
+            self.assertTrue(provider.plan(one))
+            self.assertTrue(provider.plan(two))
+            self.assertIsNone(provider.plan(three))
 
+        # applying one creates the locations of both, chunked to the limits
+        provider.MAX_CIDR_BLOCKS = 2
         stubber.add_response(
-            'list_cidr_blocks',
+            'change_cidr_collection',
+            {'Id': 'change-1'},
             {
-                'CidrBlocks': [
-                    {'CidrBlock': '10.0.0.0/8', 'LocationName': 'r0'}
+                'Id': 'col-1234',
+                'Changes': [
+                    {
+                        'LocationName': loc_one,
+                        'Action': 'PUT',
+                        'CidrList': ['10.1.0.0/16', '10.2.0.0/16'],
+                    }
                 ],
-                'NextToken': 'token1',
             },
-            {'CollectionId': 'col-1234'},
         )
         stubber.add_response(
-            'list_cidr_blocks',
+            'change_cidr_collection',
+            {'Id': 'change-2'},
             {
-                'CidrBlocks': [
-                    {'CidrBlock': '172.16.0.0/12', 'LocationName': 'r0'}
-                ]
-            },
+                'Id': 'col-1234',
+                'Changes': [
+                    {
+                        'LocationName': loc_two,
+                        'Action': 'PUT',
+                        'CidrList': ['10.3.0.0/16'],
+                    }
+                ],
+            },
+        )
+        provider._sync_cidr_locations(
+            'col-1234', provider._desired_cidr_locations(one)
+        )
+        stubber.assert_no_pending_responses()
+
+        # after which two's are already there
+        provider._sync_cidr_locations(
+            'col-1234', provider._desired_cidr_locations(two)
+        )
+        self.assertEqual(
+            {loc_one: ['10.1.0.0/16', '10.2.0.0/16'], loc_two: ['10.3.0.0/16']},
+            provider._cidr_collections['col-1234'],
+        )
+        self.assertNotIn(loc_three, provider._cidr_collections['col-1234'])
+
+        # locations larger than a request are split up
+        provider.MAX_CIDR_BLOCKS = 1
+        stubber.add_response(
+            'change_cidr_collection',
+            {'Id': 'change-3'},
+            {
+                'Id': 'col-1234',
+                'Changes': [
+                    {
+                        'LocationName': 'big',
+                        'Action': 'PUT',
+                        'CidrList': ['10.5.0.0/16'],
+                    }
+                ],
+            },
+        )
+        stubber.add_response(
+            'change_cidr_collection',
+            {'Id': 'change-4'},
+            {
+                'Id': 'col-1234',
+                'Changes': [
+                    {
+                        'LocationName': 'big',
+                        'Action': 'PUT',
+                        'CidrList': ['10.6.0.0/16'],
+                    }
+                ],
+            },
+        )
+        provider._sync_cidr_locations(
+            'col-1234', {'big': ['10.5.0.0/16', '10.6.0.0/16']}
+        )
+        stubber.assert_no_pending_responses()
+        self.assertEqual(
+            ['10.5.0.0/16', '10.6.0.0/16'],
+            provider._cidr_collections['col-1234']['big'],
+        )
+
+    def test_load_cidr_blocks_paginated(self):
+        provider, stubber = self._get_stubbed_provider()
+
+        stubber.add_response(
+            'list_cidr_blocks',
+            {
+                'CidrBlocks': [
+                    {'CidrBlock': '10.0.0.0/8', 'LocationName': 'r0'}
+                ],
+                'NextToken': 'token1',
+            },
+            {'CollectionId': 'col-1234'},
+        )
+        stubber.add_response(
+            'list_cidr_blocks',
+            {
+                'CidrBlocks': [
+                    {'CidrBlock': '172.16.0.0/12', 'LocationName': 'r0'}
+                ]
+            },
             {'CollectionId': 'col-1234', 'NextToken': 'token1'},
         )
 
@@ -5518,113 +7151,674 @@ class TestRoute53Provider(TestCase):
                             {'weight': 1, 'value': '10.0.0.1', 'status': 'up'}
                         ]
                     },
-                    'external': {
-                        'values': [
-                            {'weight': 1, 'value': '2.2.2.2', 'status': 'up'}
-                        ]
+                    'external': {
+                        'values': [
+                            {'weight': 1, 'value': '2.2.2.2', 'status': 'up'}
+                        ]
+                    },
+                },
+                'rules': [
+                    {'pool': 'internal', 'subnets': ['10.0.0.0/8']},
+                    {'pool': 'external'},
+                ],
+            },
+            'ttl': 60,
+            'type': 'A',
+            'values': ['1.1.2.1'],
+        }
+        existing = Record.new(zone, '', subnet_record_data)
+
+        # Also include a dynamic geo record being deleted to exercise
+        # the branch where existing dynamic rules have no subnets
+        geo_record_data = {
+            'dynamic': {
+                'pools': {
+                    'one': {'values': [{'value': '3.3.3.3'}]},
+                    'two': {'values': [{'value': '4.4.4.4'}]},
+                },
+                'rules': [{'geos': ['EU'], 'pool': 'two'}, {'pool': 'one'}],
+            },
+            'ttl': 60,
+            'type': 'A',
+            'values': ['3.3.3.3'],
+        }
+        geo_existing = Record.new(zone, 'geo', geo_record_data)
+
+        plan = Mock()
+        # Desired zone has no subnet records
+        plan.desired = Zone('unit.tests.', [])
+        plan.changes = [Delete(geo_existing), Delete(existing)]
+
+        # Stub: list_cidr_collections (lookup existing collection)
+        stubber.add_response(
+            'list_cidr_collections',
+            {
+                'CidrCollections': [
+                    {
+                        'Id': 'col-1234',
+                        'Name': 'octodns',
+                        'Arn': 'arn:aws:route53:::cidrcollection/col-1234',
+                        'Version': 1,
+                    }
+                ]
+            },
+        )
+        # Stub: load_records (existing rrsets)
+        stubber.add_response(
+            'list_resource_record_sets',
+            {'ResourceRecordSets': [], 'IsTruncated': False, 'MaxItems': '100'},
+            {'HostedZoneId': '/hostedzone/z42'},
+        )
+        # Stub: change_resource_record_sets (apply)
+        stubber.add_response(
+            'change_resource_record_sets',
+            {
+                'ChangeInfo': {
+                    'Id': 'change-1',
+                    'Status': 'PENDING',
+                    'SubmittedAt': '2024-01-01T00:00:00Z',
+                }
+            },
+        )
+
+        provider._apply(plan)
+        stubber.assert_no_pending_responses()
+
+    def test_mod_Update_set_math(self):
+        provider = Route53Provider('test', 'abc', '123')
+
+        def stub(*args, **kwargs):
+            pass
+
+        provider._gc_health_checks = stub
+
+        a = Record.new(
+            self.expected,
+            '',
+            {'ttl': 61, 'type': 'A', 'values': ['2.2.3.4', '3.2.3.4']},
+        )
+        b = Record.new(
+            self.expected,
+            '',
+            {'ttl': 62, 'type': 'TXT', 'values': ['Hello World!']},
+        )
+
+        # same record so won't hit new or delete cases
+        change = Update(a, a)
+        ret = provider._mod_Update(change, 'z42', None)
+        self.assertEqual(1, len(ret))
+        self.assertEqual('UPSERT', ret[0]['Action'])
+
+        # will hit the new and delete cases since they records won't be set
+        # equivilent, we're kinda abusing things here since they're completely
+        # different record types
+        change = Update(a, b)
+        ret = provider._mod_Update(change, 'z42', None)
+        self.assertEqual(2, len(ret))
+        # delete before create
+        self.assertEqual('DELETE', ret[0]['Action'])
+        self.assertEqual('CREATE', ret[1]['Action'])
+
+    def test_mod_Update_skips_unchanged(self):
+        provider = Route53Provider('test', 'abc', '123')
+        provider._gc_health_checks = lambda *args, **kwargs: None
+
+        a = Record.new(
+            self.expected,
+            '*',
+            {'ttl': 61, 'type': 'A', 'values': ['2.2.3.4', '3.2.3.4']},
+        )
+        # Route53 escapes the wildcard and may return values in any order
+        existing_rrsets = [
+            {
+                'Name': '\\052.unit.tests.',
+                'Type': 'A',
+                'TTL': 61,
+                'ResourceRecords': [{'Value': '3.2.3.4'}, {'Value': '2.2.3.4'}],
+            }
+        ]
+
+        # nothing has actually changed so there's nothing to do
+        change = Update(a, a)
+        self.assertEqual(
+            [], provider._mod_Update(change, 'z42', existing_rrsets)
+        )
+
+        # a different ttl is a real change
+        b = Record.new(
+            self.expected,
+            '*',
+            {'ttl': 62, 'type': 'A', 'values': ['2.2.3.4', '3.2.3.4']},
+        )
+        change = Update(a, b)
+        ret = provider._mod_Update(change, 'z42', existing_rrsets)
+        self.assertEqual(1, len(ret))
+        self.assertEqual('UPSERT', ret[0]['Action'])
+        self.assertEqual(62, ret[0]['ResourceRecordSet']['TTL'])
+
+        # and so are different values
+        c = Record.new(
+            self.expected,
+            '*',
+            {'ttl': 61, 'type': 'A', 'values': ['2.2.3.4', '4.2.3.4']},
+        )
+        change = Update(a, c)
+        ret = provider._mod_Update(change, 'z42', existing_rrsets)
+        self.assertEqual(1, len(ret))
+        self.assertEqual('UPSERT', ret[0]['Action'])
+
+    def _get_stubbed_cached_provider(self, path):
+        # each provider stands in for a separate run so they shouldn't share
+        # clients
+        _clear_caches()
+        provider = Route53Provider(
+            'test', 'abc', '123', strict_supports=False, cache_path=path
+        )
+
+        # Use the stubber
+        stubber = Stubber(provider._conn)
+        stubber.activate()
+
+        return (provider, stubber)
+
+    def test_cache_records(self):
+        list_hosted_zones = {
+            'HostedZones': [
+                {
+                    'Id': 'z42',
+                    'Name': 'unit.tests.',
+                    'CallerReference': 'abc',
+                    'ResourceRecordSetCount': 1,
+                }
+            ],
+            'Marker': 'm',
+            'IsTruncated': False,
+            'MaxItems': '100',
+        }
+        rrsets = [
+            {
+                'Name': 'a.unit.tests.',
+                'Type': 'A',
+                'TTL': 60,
+                'ResourceRecords': [{'Value': '1.2.3.4'}],
+            }
+        ]
+        list_resource_record_sets = {
+            'ResourceRecordSets': rrsets,
+            'IsTruncated': False,
+            'MaxItems': '100',
+        }
+
+        with TemporaryDirectory() as tmpdir:
+            path = join(tmpdir, 'cache.db')
+
+            # nothing cached, has to load
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response('list_hosted_zones', list_hosted_zones)
+            stubber.add_response(
+                'list_resource_record_sets',
+                list_resource_record_sets,
+                {'HostedZoneId': 'z42'},
+            )
+            provider.update_r53_zones('unit.tests.')
+            self.assertEqual(rrsets, provider._load_records('z42'))
+            stubber.assert_no_pending_responses()
+
+            # a new provider, the record count matches so we use the cache
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response('list_hosted_zones', list_hosted_zones)
+            zone = Zone('unit.tests.', [])
+            provider.populate(zone)
+            self.assertEqual(1, len(zone.records))
+            stubber.assert_no_pending_responses()
+
+            # the record count changed, the snapshot is no good
+            list_hosted_zones['HostedZones'][0]['ResourceRecordSetCount'] = 2
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response('list_hosted_zones', list_hosted_zones)
+            stubber.add_response(
+                'list_resource_record_sets',
+                list_resource_record_sets,
+                {'HostedZoneId': 'z42'},
+            )
+            zone = Zone('unit.tests.', [])
+            provider.populate(zone)
+            self.assertEqual(1, len(zone.records))
+            stubber.assert_no_pending_responses()
+
+            # we don't know the record count, have to look it up
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response(
+                'get_hosted_zone',
+                {
+                    'HostedZone': {
+                        'Id': 'z42',
+                        'Name': 'unit.tests.',
+                        'CallerReference': 'abc',
+                        'ResourceRecordSetCount': 2,
+                    },
+                    'DelegationSet': {'NameServers': ['ns1.unit.tests.']},
+                },
+                {'Id': 'z42'},
+            )
+            self.assertEqual(rrsets, provider._load_records('z42'))
+            stubber.assert_no_pending_responses()
+
+            # applying changes invalidates the snapshot
+            stubber.add_response(
+                'change_resource_record_sets',
+                {
+                    'ChangeInfo': {
+                        'Id': 'id',
+                        'Status': 'PENDING',
+                        'SubmittedAt': '2017-01-29T01:02:03Z',
+                    }
+                },
+                {'HostedZoneId': 'z42', 'ChangeBatch': ANY},
+            )
+            provider._really_apply(
+                [{'Action': 'DELETE', 'ResourceRecordSet': rrsets[0]}], 'z42'
+            )
+            self.assertFalse('z42' in provider._r53_zone_record_counts)
+            self.assertIsNone(provider._cache.get('test:rrsets:z42'))
+
+    def test_cache_zone_catalog(self):
+        list_hosted_zones = {
+            'HostedZones': [
+                {
+                    'Id': 'z42',
+                    'Name': 'unit.tests.',
+                    'CallerReference': 'abc',
+                    'ResourceRecordSetCount': 1,
+                }
+            ],
+            'Marker': 'm',
+            'IsTruncated': False,
+            'MaxItems': '100',
+        }
+        create_hosted_zone = {
+            'HostedZone': {
+                'Name': 'new.tests.',
+                'Id': 'z43',
+                'CallerReference': 'abd',
+            },
+            'ChangeInfo': {
+                'Id': 'a12',
+                'Status': 'PENDING',
+                'SubmittedAt': '2017-01-29T01:02:03Z',
+            },
+            'DelegationSet': {'NameServers': ['n12.unit.tests.']},
+            'Location': 'us-east-1',
+        }
+
+        with TemporaryDirectory() as tmpdir:
+            path = join(tmpdir, 'cache.db')
+
+            # only cache_path, the catalog isn't persisted
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response('list_hosted_zones', list_hosted_zones)
+            self.assertEqual(['unit.tests.'], provider.list_zones())
+            self.assertIsNone(provider._zone_cache)
+
+            def cached_provider():
+                _clear_caches()
+                provider = Route53Provider(
+                    'test',
+                    'abc',
+                    '123',
+                    strict_supports=False,
+                    cache_path=path,
+                    zone_cache_ttl=60,
+                )
+                stubber = Stubber(provider._conn)
+                stubber.activate()
+                return provider, stubber
+
+            provider, stubber = cached_provider()
+            stubber.add_response('list_hosted_zones', list_hosted_zones)
+            self.assertEqual(['unit.tests.'], provider.list_zones())
+            stubber.assert_no_pending_responses()
+
+            # a new run uses the persisted catalog, without listing
+            provider, stubber = cached_provider()
+            self.assertEqual('z42', provider._get_zone_id('unit.tests.'))
+            self.assertEqual(['unit.tests.'], provider.list_zones())
+            # but doesn't trust its record counts
+            self.assertEqual({}, provider._r53_zone_record_counts)
+
+            # creating a zone updates the persisted catalog
+            stubber.add_response('create_hosted_zone', create_hosted_zone)
+            self.assertEqual('z43', provider._get_zone_id('new.tests.', True))
+            stubber.assert_no_pending_responses()
+            provider, stubber = cached_provider()
+            self.assertEqual(
+                ['new.tests.', 'unit.tests.'], provider.list_zones()
+            )
+
+            # creating a zone without having loaded the catalog drops it
+            provider, stubber = cached_provider()
+            provider._r53_zones = {}
+            stubber.add_response('create_hosted_zone', create_hosted_zone)
+            self.assertEqual('z43', provider._get_zone_id('new.tests.', True))
+            self.assertIsNone(
+                provider._zone_cache.get(provider._zone_catalog_key)
+            )
+            # and without a persisted catalog that's a no-op
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            provider._r53_zones = {}
+            stubber.add_response('create_hosted_zone', create_hosted_zone)
+            self.assertEqual('z43', provider._get_zone_id('new.tests.', True))
+            stubber.assert_no_pending_responses()
+
+            # vpc zones are catalogued separately
+            provider = Route53Provider(
+                'test',
+                'abc',
+                '123',
+                vpc_id='vpc-1',
+                vpc_region='us-east-1',
+                cache_path=path,
+                zone_cache_ttl=60,
+            )
+            self.assertEqual(
+                'test:hosted-zones:vpc-1', provider._zone_catalog_key
+            )
+            # and their VPCs are mapped when the catalog comes from the cache
+            provider._zone_cache.put(
+                provider._zone_catalog_key,
+                {
+                    'delegated': False,
+                    'zones': [
+                        {
+                            'id': 'z42',
+                            'name': 'unit.tests.',
+                            'private': True,
+                            'delegation_set_id': None,
+                            'record_count': None,
+                            'vpcs': ['vpc-1', 'vpc-2'],
+                        }
+                    ],
+                },
+            )
+            self.assertEqual({'z42'}, provider.vpc_zone_ids)
+            self.assertEqual(['vpc-1', 'vpc-2'], provider._get_zone_vpcs('z42'))
+
+    def test_cache_prefetch(self):
+        with TemporaryDirectory() as tmpdir:
+            provider = Route53Provider(
+                'test',
+                'abc',
+                '123',
+                prefetch_workers=2,
+                cache_path=join(tmpdir, 'cache.db'),
+            )
+            provider._r53_zones = {'a.tests.': 'za', 'b.tests.': 'zb'}
+            provider._r53_zone_record_counts = {'za': 1, 'zb': 1}
+            provider._cache.put('test:rrsets:za', ['cached'], 1)
+
+            with patch.object(
+                provider, '_fetch_records', side_effect=lambda zid: [zid]
+            ) as fetch_mock:
+                provider._prefetch_records()
+            fetch_mock.assert_called_once_with('zb')
+            self.assertEqual(
+                {'za': ['cached'], 'zb': ['zb']}, provider._r53_rrsets
+            )
+            # and what we fetched was written to the cache
+            self.assertEqual(['zb'], provider._cache.get('test:rrsets:zb', 1))
+
+            # another thread loads a zone while we wait for its lock
+            provider._r53_zones['c.tests.'] = 'zc'
+            provider._r53_zone_record_counts['zc'] = 1
+            locks = provider._locks
+
+            @contextmanager
+            def racing_locks(key):
+                with locks(key):
+                    if key == 'rrsets:zc':
+                        provider._r53_rrsets['zc'] = ['raced']
+                    yield
+
+            provider._locks = racing_locks
+            with patch.object(provider, '_fetch_records') as fetch_mock:
+                provider._prefetch_records()
+            # it's not loaded again
+            fetch_mock.assert_not_called()
+            self.assertEqual(['raced'], provider._r53_rrsets['zc'])
+
+    def test_cache_health_checks(self):
+        list_health_checks = {
+            'HealthChecks': self.health_checks,
+            'IsTruncated': False,
+            'MaxItems': '100',
+            'Marker': '',
+        }
+
+        with TemporaryDirectory() as tmpdir:
+            path = join(tmpdir, 'cache.db')
+
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response(
+                'get_health_check_count', {'HealthCheckCount': 4}
+            )
+            stubber.add_response('list_health_checks', list_health_checks)
+            health_checks = provider.health_checks
+            self.assertTrue('42' in health_checks)
+            stubber.assert_no_pending_responses()
+
+            # a health check was created or deleted elsewhere, the snapshot
+            # is no good
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response(
+                'get_health_check_count', {'HealthCheckCount': 5}
+            )
+            stubber.add_response('list_health_checks', list_health_checks)
+            self.assertEqual(health_checks, provider.health_checks)
+            stubber.assert_no_pending_responses()
+
+            # a new provider uses the cached version when the count matches
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response(
+                'get_health_check_count', {'HealthCheckCount': 5}
+            )
+            self.assertEqual(health_checks, provider.health_checks)
+            stubber.assert_no_pending_responses()
+
+            # creating a new health check writes through
+            health_check_config = {
+                'EnableSNI': False,
+                'FailureThreshold': 6,
+                'FullyQualifiedDomainName': 'foo.bar.com',
+                'IPAddress': '4.2.3.4',
+                'MeasureLatency': True,
+                'Port': 8080,
+                'RequestInterval': 10,
+                'ResourcePath': '/_status',
+                'Type': 'HTTP',
+            }
+            stubber.add_response(
+                'create_health_check',
+                {
+                    'HealthCheck': {
+                        'Id': '420',
+                        'CallerReference': self.caller_ref,
+                        'HealthCheckConfig': health_check_config,
+                        'HealthCheckVersion': 1,
+                    },
+                    'Location': 'http://url',
+                },
+                {'CallerReference': ANY, 'HealthCheckConfig': ANY},
+            )
+            stubber.add_response('change_tags_for_resource', {})
+            record = Record.new(
+                self.expected,
+                '',
+                {
+                    'ttl': 61,
+                    'type': 'A',
+                    'value': '2.2.3.4',
+                    'dynamic': {
+                        'pools': {'AF': {'values': [{'value': '4.2.3.4'}]}},
+                        'rules': [{'pool': 'AF'}],
+                    },
+                    'octodns': {
+                        'healthcheck': {
+                            'host': 'foo.bar.com',
+                            'path': '/_status',
+                            'port': 8080,
+                            'protocol': 'HTTP',
+                        }
                     },
                 },
-                'rules': [
-                    {'pool': 'internal', 'subnets': ['10.0.0.0/8']},
-                    {'pool': 'external'},
-                ],
-            },
-            'ttl': 60,
-            'type': 'A',
-            'values': ['1.1.2.1'],
-        }
-        existing = Record.new(zone, '', subnet_record_data)
+            )
+            self.assertEqual(
+                '420',
+                provider.get_health_check_id(record, '4.2.3.4', 'obey', True),
+            )
+            stubber.assert_no_pending_responses()
+            # the count's kept up to date rather than looked up again
+            self.assertEqual(6, provider._health_check_count)
+            self.assertTrue(
+                '420' in provider._cache.get('test:health-checks', 6)
+            )
 
-        # Also include a dynamic geo record being deleted to exercise
-        # the branch where existing dynamic rules have no subnets
-        geo_record_data = {
-            'dynamic': {
-                'pools': {
-                    'one': {'values': [{'value': '3.3.3.3'}]},
-                    'two': {'values': [{'value': '4.4.4.4'}]},
-                },
-                'rules': [{'geos': ['EU'], 'pool': 'two'}, {'pool': 'one'}],
-            },
-            'ttl': 60,
-            'type': 'A',
-            'values': ['3.3.3.3'],
+            # deleting drops the persisted copy
+            stubber.add_response(
+                'delete_health_check', {}, {'HealthCheckId': ANY}
+            )
+            stubber.add_response(
+                'delete_health_check', {}, {'HealthCheckId': ANY}
+            )
+            stubber.add_response(
+                'delete_health_check', {}, {'HealthCheckId': ANY}
+            )
+            stubber.add_response(
+                'delete_health_check', {}, {'HealthCheckId': ANY}
+            )
+            provider._gc_health_checks(record, [DummyR53Record('420')])
+            provider._delete_health_checks()
+            stubber.assert_no_pending_responses()
+            self.assertIsNone(provider._cache.get('test:health-checks'))
+            # they're no longer in memory and the count reflects it
+            self.assertEqual(['45', '420'], list(provider._health_checks))
+            self.assertEqual(2, provider._health_check_count)
+
+            # and when nothing's deleted it's left alone
+            provider._store_health_checks()
+            provider._gc_health_checks(
+                Record.new(
+                    self.expected,
+                    'other',
+                    {'ttl': 61, 'type': 'A', 'value': '2.2.3.4'},
+                ),
+                [],
+            )
+            provider._delete_health_checks()
+            self.assertTrue(provider._cache.get('test:health-checks'))
+
+    def test_cache_cidr_blocks(self):
+        list_cidr_blocks = {
+            'CidrBlocks': [
+                {'CidrBlock': '10.0.0.0/8', 'LocationName': 'r0'},
+                {'CidrBlock': '192.168.0.0/16', 'LocationName': 'r1'},
+            ]
         }
-        geo_existing = Record.new(zone, 'geo', geo_record_data)
-
-        plan = Mock()
-        # Desired zone has no subnet records
-        plan.desired = Zone('unit.tests.', [])
-        plan.changes = [Delete(geo_existing), Delete(existing)]
+        expected = {'r0': ['10.0.0.0/8'], 'r1': ['192.168.0.0/16']}
 
-        # Stub: list_cidr_collections (lookup existing collection)
-        stubber.add_response(
-            'list_cidr_collections',
-            {
+        def list_cidr_collections(version):
+            return {
                 'CidrCollections': [
                     {
-                        'Id': 'col-1234',
+                        'Id': 'c-1',
                         'Name': 'octodns',
-                        'Arn': 'arn:aws:route53:::cidrcollection/col-1234',
-                        'Version': 1,
+                        'Arn': 'arn:aws:route53:::cidrcollection/c-1',
+                        'Version': version,
                     }
                 ]
-            },
-        )
-        # Stub: load_records (existing rrsets)
-        stubber.add_response(
-            'list_resource_record_sets',
-            {'ResourceRecordSets': [], 'IsTruncated': False, 'MaxItems': '100'},
-            {'HostedZoneId': '/hostedzone/z42'},
-        )
-        # Stub: change_resource_record_sets (apply)
-        stubber.add_response(
-            'change_resource_record_sets',
-            {
-                'ChangeInfo': {
-                    'Id': 'change-1',
-                    'Status': 'PENDING',
-                    'SubmittedAt': '2024-01-01T00:00:00Z',
-                }
-            },
-        )
+            }
 
-        provider._apply(plan)
-        stubber.assert_no_pending_responses()
+        with TemporaryDirectory() as tmpdir:
+            path = join(tmpdir, 'cache.db')
 
-    def test_mod_Update_set_math(self):
-        provider = Route53Provider('test', 'abc', '123')
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response(
+                'list_cidr_collections', list_cidr_collections(3)
+            )
+            stubber.add_response(
+                'list_cidr_blocks', list_cidr_blocks, {'CollectionId': 'c-1'}
+            )
+            self.assertEqual(expected, provider._load_cidr_blocks('c-1'))
+            stubber.assert_no_pending_responses()
 
-        def stub(*args, **kwargs):
-            pass
+            # the collection was changed elsewhere, the snapshot is no good
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response(
+                'list_cidr_collections', list_cidr_collections(4)
+            )
+            stubber.add_response(
+                'list_cidr_blocks', list_cidr_blocks, {'CollectionId': 'c-1'}
+            )
+            self.assertEqual(expected, provider._load_cidr_blocks('c-1'))
+            stubber.assert_no_pending_responses()
 
-        provider._gc_health_checks = stub
+            # we don't know the collection's version so it's not cached
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response(
+                'list_cidr_collections', {'CidrCollections': []}
+            )
+            stubber.add_response(
+                'list_cidr_blocks', list_cidr_blocks, {'CollectionId': 'c-2'}
+            )
+            self.assertEqual(expected, provider._load_cidr_blocks('c-2'))
+            stubber.assert_no_pending_responses()
+            self.assertIsNone(provider._cache.get('test:cidr-blocks:c-2'))
 
-        a = Record.new(
-            self.expected,
-            '',
-            {'ttl': 61, 'type': 'A', 'values': ['2.2.3.4', '3.2.3.4']},
-        )
-        b = Record.new(
-            self.expected,
-            '',
-            {'ttl': 62, 'type': 'TXT', 'values': ['Hello World!']},
-        )
+            # a new provider uses the cached version when the version matches
+            provider, stubber = self._get_stubbed_cached_provider(path)
+            stubber.add_response(
+                'list_cidr_collections', list_cidr_collections(4)
+            )
+            self.assertEqual(expected, provider._load_cidr_blocks('c-1'))
+            stubber.assert_no_pending_responses()
+            # and remembers it in memory
+            self.assertEqual(expected, provider._cidr_collections['c-1'])
 
-        # same record so won't hit new or delete cases
-        change = Update(a, a)
-        ret = provider._mod_Update(change, 'z42', None)
-        self.assertEqual(1, len(ret))
-        self.assertEqual('UPSERT', ret[0]['Action'])
+            # changes are written through to it
+            stubber.add_response(
+                'change_cidr_collection',
+                {'Id': 'change-1'},
+                {'Id': 'c-1', 'Changes': ANY},
+            )
+            provider._sync_cidr_locations('c-1', {'r2': ['172.16.0.0/12']})
+            stubber.assert_no_pending_responses()
+            expected['r2'] = ['172.16.0.0/12']
+            # with the version the change bumped it to
+            self.assertEqual(
+                expected, provider._cache.get('test:cidr-blocks:c-1', 5)
+            )
 
-        # will hit the new and delete cases since they records won't be set
-        # equivilent, we're kinda abusing things here since they're completely
-        # different record types
-        change = Update(a, b)
-        ret = provider._mod_Update(change, 'z42', None)
-        self.assertEqual(2, len(ret))
-        # delete before create
-        self.assertEqual('DELETE', ret[0]['Action'])
-        self.assertEqual('CREATE', ret[1]['Action'])
+            # including those that made it through before a failure
+            provider._cidr_collections['c-1'] = {}
+            provider.MAX_CIDR_CHANGES = 1
+            stubber.add_response(
+                'change_cidr_collection',
+                {'Id': 'change-2'},
+                {'Id': 'c-1', 'Changes': ANY},
+            )
+            stubber.add_client_error('change_cidr_collection')
+            with self.assertRaises(ClientError):
+                provider._sync_cidr_locations(
+                    'c-1', {'r3': ['10.1.0.0/16'], 'r4': ['10.2.0.0/16']}
+                )
+            self.assertEqual(
+                {'r3': ['10.1.0.0/16']},
+                provider._cache.get('test:cidr-blocks:c-1', 6),
+            )
+
+            # without a known version changes aren't written through
+            provider._cidr_collections['c-2'] = {}
+            provider._sync_cidr_locations('c-2', {})
+            self.assertIsNone(provider._cache.get('test:cidr-blocks:c-2'))
 
 
 class DummyProvider(object):
@@ -5721,6 +7915,37 @@ class TestRoute53Records(TestCase):
         a.__repr__()
         e.__repr__()
 
+    def test_route53_record_compact(self):
+        a = _Route53Record(None, self.record_a, False)
+        # slotted, no per-instance dict
+        self.assertFalse(hasattr(a, '__dict__'))
+        with self.assertRaises(AttributeError):
+            a.something = 42
+        # hashes are the same whether or not the values have been looked at
+        h = hash(a)
+        a.values
+        self.assertEqual(h, hash(a))
+        self.assertEqual(
+            hash(_Route53Record(None, self.record_a, False)), hash(a)
+        )
+
+        # aliases hash on their target so different targets are different
+        alias = Route53AliasRecord(
+            self.existing,
+            '',
+            {
+                'values': [
+                    {'name': 'something', 'type': 'A'},
+                    {'name': 'other', 'type': 'A'},
+                ],
+                'ttl': 99,
+            },
+        )
+        e = _Route53Alias(None, 'z42', alias, alias.values[0], True)
+        f = _Route53Alias(None, 'z42', alias, alias.values[1], True)
+        self.assertFalse(hasattr(e, '__dict__'))
+        self.assertNotEqual(hash(e), hash(f))
+
     def test_route53_record_ordering(self):
         # Matches
         a = _Route53Record(None, self.record_a, False)
@@ -6238,6 +8463,291 @@ class TestRoute53Records(TestCase):
             route53_record.__repr__()
 
 
+class TestHealthCheckIndex(TestCase):
+    def _health_check(self, id, ref, **config):
+        base = {
+            'Disabled': False,
+            'FailureThreshold': 6,
+            'FullyQualifiedDomainName': 'unit.tests',
+            'Inverted': False,
+            'MeasureLatency': True,
+            'Port': 443,
+            'RequestInterval': 10,
+            'ResourcePath': '/_dns',
+            'Type': 'HTTPS',
+        }
+        base.update(config)
+        return {'Id': id, 'CallerReference': ref, 'HealthCheckConfig': base}
+
+    def test_index(self):
+        key = _HealthCheckIndex.config_key(
+            'unit.tests', '/_dns', 'HTTPS', 443, True, 10, 6, False, False
+        )
+        health_checks = {
+            '40': self._health_check(
+                '40', '0001:A:unit.tests.:aaaa', IPAddress='1.2.3.4'
+            ),
+            '41': self._health_check(
+                '41',
+                '0001:AAAA:unit.tests.:bbbb',
+                IPAddress='2001:4860:4860:0:0:0:0:8842',
+            ),
+            '42': self._health_check('42', '0001:CNAME:unit.tests.:cccc'),
+            # legacy, no fqdn in the ref
+            '43': self._health_check(
+                '43', '0000:A:dddd', FullyQualifiedDomainName='unit.tests'
+            ),
+            # hashed fqdn
+            '44': self._health_check('44', '0001:A:1195893dcaf4af70915e'),
+            # not something we understand
+            '45': self._health_check(
+                '45', 'something-else', IPAddress='not-an-ip'
+            ),
+            '46': self._health_check(
+                '46', '0001:A:unit.tests.:eeee', IPAddress='1.2.3.5'
+            ),
+        }
+        index = _HealthCheckIndex(health_checks)
+        self.assertIs(health_checks, index.source)
+
+        self.assertEqual(
+            ['40', '46'], list(index.by_prefix['0001:A:unit.tests.'])
+        )
+        self.assertEqual(['44'], list(index.by_prefix['0001:A']))
+        self.assertEqual(['45'], list(index.by_prefix['something-else']))
+
+        # matches on ip
+        self.assertEqual('40', index.find('0001:A:unit.tests.', key, '1.2.3.4'))
+        self.assertEqual('46', index.find('0001:A:unit.tests.', key, '1.2.3.5'))
+        self.assertIsNone(index.find('0001:A:unit.tests.', key, '1.2.3.6'))
+        # normalized ipv6
+        self.assertEqual(
+            '41',
+            index.find('0001:AAAA:unit.tests.', key, '2001:4860:4860::8842'),
+        )
+        # no value, first one wins
+        self.assertEqual('40', index.find('0001:A:unit.tests.', key, None))
+        self.assertEqual('42', index.find('0001:CNAME:unit.tests.', key, None))
+        # config mismatch
+        other_key = _HealthCheckIndex.config_key(
+            'unit.tests', '/_dns', 'HTTPS', 443, True, 10, 6, True, True
+        )
+        self.assertIsNone(
+            index.find('0001:A:unit.tests.', other_key, '1.2.3.4')
+        )
+        # prefix mismatch
+        self.assertIsNone(index.find('0001:A:other.tests.', key, '1.2.3.4'))
+
+        self.assertEqual(
+            [('40', True, False), ('43', False, True), ('46', True, False)],
+            index.for_record('A', 'unit.tests.', 'unit.tests'),
+        )
+        self.assertEqual([], index.for_record('A', 'other.tests.', 'other'))
+
+        # adding keeps things in order
+        index.add(
+            '47',
+            self._health_check(
+                '47', '0001:A:unit.tests.:ffff', IPAddress='1.2.3.4'
+            ),
+        )
+        self.assertEqual(
+            [
+                ('40', True, False),
+                ('43', False, True),
+                ('46', True, False),
+                ('47', True, False),
+            ],
+            index.for_record('A', 'unit.tests.', 'unit.tests'),
+        )
+        self.assertEqual('40', index.find('0001:A:unit.tests.', key, '1.2.3.4'))
+
+        # removing drops it from everything
+        index.remove('40')
+        index.remove('43')
+        self.assertEqual('47', index.find('0001:A:unit.tests.', key, '1.2.3.4'))
+        self.assertEqual(
+            [('46', True, False), ('47', True, False)],
+            index.for_record('A', 'unit.tests.', 'unit.tests'),
+        )
+        self.assertEqual(
+            ['46', '47'], list(index.by_prefix['0001:A:unit.tests.'])
+        )
+        self.assertFalse('40' in index.order)
+        # including things we didn't understand
+        index.remove('45')
+        self.assertEqual({}, index.by_prefix['something-else'])
+        # unknown ids are ignored
+        index.remove('99')
+        # and adding after removing still keeps things in order
+        index.add(
+            '40',
+            self._health_check(
+                '40', '0001:A:unit.tests.:aaaa', IPAddress='1.2.3.4'
+            ),
+        )
+        self.assertEqual(
+            ['46', '47', '40'],
+            [id for id, _, _ in index.for_record('A', 'unit.tests.', None)],
+        )
+
+    def test_provider_rebuilds(self):
+        provider = Route53Provider('test', 'abc', '123')
+        provider._health_checks = {}
+        index = provider.health_check_index
+        self.assertIs(index, provider.health_check_index)
+        provider._health_checks = {}
+        self.assertIsNot(index, provider.health_check_index)
+
+
+class TestZoneRRSetIndex(TestCase):
+    def test_index(self):
+        def rule(target, _type='A'):
+            return {
+                'AliasTarget': {
+                    'DNSName': target,
+                    'EvaluateTargetHealth': True,
+                    'HostedZoneId': 'Z2',
+                },
+                'CidrRoutingConfig': {
+                    'CollectionId': 'c-1',
+                    'LocationName': 'loc',
+                },
+                'Name': 'unit.tests.',
+                'SetIdentifier': '0-one-subnet',
+                'Type': _type,
+            }
+
+        def value(name, _type='A'):
+            return {
+                'Name': name,
+                'ResourceRecords': [{'Value': '1.2.3.4'}],
+                'SetIdentifier': 'one-000',
+                'TTL': 60,
+                'Type': _type,
+                'Weight': 1,
+            }
+
+        apex_rule = rule('_octodns-one-pool.unit.tests.')
+        apex_rule_aaaa = rule('_octodns-one-pool.unit.tests.', 'AAAA')
+        sub_rule = rule('_octodns-one-pool.sub.unit.tests.')
+        # not one of ours
+        other_rule = rule('somewhere.else.')
+        apex_value = value('_octodns-one-value.unit.tests.')
+        sub_value = value('_octodns-one-value.sub.unit.tests.', 'CNAME')
+        default_value = value('_octodns-default-value.unit.tests.')
+        plain = value('www.unit.tests.')
+
+        rrsets = [
+            apex_rule,
+            apex_rule_aaaa,
+            sub_rule,
+            other_rule,
+            apex_value,
+            sub_value,
+            default_value,
+            plain,
+        ]
+        index = _ZoneRRSetIndex(rrsets)
+        self.assertIs(rrsets, index.source)
+        self.assertEqual(
+            {
+                ('unit.tests.', 'A'): [apex_rule],
+                ('unit.tests.', 'AAAA'): [apex_rule_aaaa],
+                ('sub.unit.tests.', 'A'): [sub_rule],
+            },
+            index.cidr_rules,
+        )
+        self.assertEqual(
+            {
+                ('unit.tests.', 'A'): [apex_value],
+                ('sub.unit.tests.', 'CNAME'): [sub_value],
+            },
+            index.values,
+        )
+
+        # normalized rrsets are only built once they're needed
+        self.assertIsNone(index._rrsets)
+        normalized = index.rrsets
+        self.assertEqual(6, len(normalized))
+        self.assertEqual(
+            ['1.2.3.4'],
+            normalized[('www.unit.tests.', 'A', 'one-000')]['ResourceRecords'],
+        )
+        self.assertIs(normalized, index.rrsets)
+
+    def test_provider_rebuilds(self):
+        provider = Route53Provider('test', 'abc', '123')
+        provider._r53_rrsets['z42'] = []
+        index = provider._rrset_index('z42')
+        self.assertIs(index, provider._rrset_index('z42'))
+        provider._r53_rrsets['z42'] = []
+        self.assertIsNot(index, provider._rrset_index('z42'))
+
+
+class TestBatchMods(TestCase):
+    def _mod(self, name, values=None, action='CREATE'):
+        rrset = {'Name': name, 'Type': 'TXT'}
+        if values is None:
+            rrset['AliasTarget'] = {'DNSName': 'target.unit.tests.'}
+        else:
+            rrset['ResourceRecords'] = [{'Value': v} for v in values]
+        return {'Action': action, 'ResourceRecordSet': rrset}
+
+    def test_mod_cost(self):
+        self.assertEqual((2, 7), _mod_cost(self._mod('a', ['abc', 'defg'])))
+        # upserts count twice
+        self.assertEqual(
+            (4, 14), _mod_cost(self._mod('a', ['abc', 'defg'], 'UPSERT'))
+        )
+        # aliases have no values, but still count
+        self.assertEqual((1, 0), _mod_cost(self._mod('a')))
+        self.assertEqual((2, 0), _mod_cost(self._mod('a', action='UPSERT')))
+
+    def test_batch_mods(self):
+        a = self._mod('a', ['aaaa'])
+        b = self._mod('b', ['bbbb', 'bbbb'], 'UPSERT')
+        c = self._mod('c')
+        d = self._mod('d', ['dddd'], 'DELETE')
+
+        # nothing in, nothing out
+        self.assertEqual([], list(_batch_mods([], 10, 100)))
+        self.assertEqual([], list(_batch_mods([[]], 10, 100)))
+
+        # everything fits
+        self.assertEqual(
+            [([a, b, c, d], 7, 24)],
+            list(_batch_mods([[a], [b, c], [d]], 10, 100)),
+        )
+
+        # rrs limited, [b, c] is kept together
+        self.assertEqual(
+            [([a], 1, 4), ([b, c], 5, 16), ([d], 1, 4)],
+            list(_batch_mods([[a], [b, c], [d]], 5, 100)),
+        )
+
+        # chars limited
+        self.assertEqual(
+            [([a, b, c], 6, 20), ([d], 1, 4)],
+            list(_batch_mods([[a], [b, c], [d]], 10, 20)),
+        )
+
+        # [a, b, c] is too big for a single batch and gets split in order
+        self.assertEqual(
+            [([d, a], 2, 8), ([b, c], 5, 16)],
+            list(_batch_mods([[d], [a, b, c]], 5, 100)),
+        )
+
+        # a single mod that can never fit
+        with self.assertRaises(Route53ProviderException) as ctx:
+            list(_batch_mods([[a], [b]], 10, 15))
+        self.assertEqual(
+            'Too many modifications for b TXT: 4 ResourceRecords, 16 '
+            'characters',
+            str(ctx.exception),
+        )
+
+
 class TestModKeyer(TestCase):
     def test_mod_keyer(self):
         # First "column" is the action priority for C/R/U
@@ -0,0 +1,67 @@
+#
+#
+#
+
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from octodns_route53.cache import _SnapshotCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSnapshotCache(TestCase):
+    def test_basics(self):
+        with TemporaryDirectory() as tmpdir:
+            clock = FakeClock()
+            path = join(tmpdir, 'cache.db')
+            cache = _SnapshotCache(path, 60, clock=clock)
+
+            self.assertIsNone(cache.get('nope'))
+
+            data = {'a': [1, 2, {'b': True}]}
+            cache.put('key', data)
+            self.assertEqual(data, cache.get('key'))
+
+            # persisted, another instance on the same file sees it
+            other = _SnapshotCache(path, 60, clock=clock)
+            self.assertEqual(data, other.get('key'))
+
+            # replace
+            cache.put('key', [42])
+            self.assertEqual([42], other.get('key'))
+
+            # expires
+            clock.now += 61
+            self.assertIsNone(cache.get('key'))
+
+            cache.put('key', [43])
+            self.assertEqual([43], cache.get('key'))
+            cache.delete('key')
+            self.assertIsNone(cache.get('key'))
+            # deleting something that doesn't exist is a noop
+            cache.delete('key')
+
+    def test_validator(self):
+        with TemporaryDirectory() as tmpdir:
+            cache = _SnapshotCache(join(tmpdir, 'cache.db'), 60)
+
+            cache.put('key', 'data', 42)
+            # matches
+            self.assertEqual('data', cache.get('key', 42))
+            # doesn't care
+            self.assertEqual('data', cache.get('key'))
+            # doesn't match
+            self.assertIsNone(cache.get('key', 43))
+            self.assertIsNone(cache.get('key', '42'))
+
+            # stored without, asked with
+            cache.put('key', 'data')
+            self.assertIsNone(cache.get('key', 42))
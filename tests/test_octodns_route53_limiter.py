@@ -0,0 +1,161 @@
+#
+#
+#
+
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+from boto3 import Session
+
+from octodns_route53.limiter import _TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, duration):
+        self.sleeps.append(duration)
+        self.now += duration
+
+
+class TestTokenBucket(TestCase):
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            _TokenBucket(0)
+
+    def test_burst_then_wait(self):
+        clock = FakeClock()
+        bucket = _TokenBucket(5, clock=clock, sleep=clock.sleep)
+        self.assertEqual(5, bucket.burst)
+
+        # the initial burst goes straight through
+        for _ in range(5):
+            self.assertEqual(0, bucket.acquire())
+        self.assertEqual([], clock.sleeps)
+
+        # then we're limited to the rate
+        self.assertAlmostEqual(0.2, bucket.acquire())
+        self.assertAlmostEqual(0.2, bucket.acquire())
+        self.assertEqual(2, len(clock.sleeps))
+
+        # after a long pause we're back to a full burst, but no more
+        clock.now += 60
+        for _ in range(5):
+            self.assertEqual(0, bucket.acquire())
+        self.assertAlmostEqual(0.2, bucket.acquire())
+
+    def test_fractional_rate(self):
+        clock = FakeClock()
+        bucket = _TokenBucket(0.5, clock=clock, sleep=clock.sleep)
+        self.assertEqual(1, bucket.burst)
+        self.assertEqual(0, bucket.acquire())
+        self.assertAlmostEqual(2, bucket.acquire())
+
+    def test_concurrent_callers_queue(self):
+        sleeps = []
+        # time stands still so nothing is ever refilled
+        bucket = _TokenBucket(
+            1000, burst=1, clock=lambda: 0.0, sleep=sleeps.append
+        )
+
+        threads = [Thread(target=bucket.acquire) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # one of them got the initial token, the rest had to wait, each a bit
+        # longer than the one before it
+        self.assertEqual(4, len(sleeps))
+        for expected, got in zip((0.001, 0.002, 0.003, 0.004), sorted(sleeps)):
+            self.assertAlmostEqual(expected, got)
+
+    def test_stats(self):
+        clock = FakeClock()
+        bucket = _TokenBucket(1, clock=clock, sleep=clock.sleep)
+        self.assertEqual(
+            {'requests': 0, 'waits': 0, 'wait_time': 0, 'throttles': 0},
+            bucket.stats(),
+        )
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(
+            {'requests': 3, 'waits': 2, 'wait_time': 2.0, 'throttles': 0},
+            bucket.stats(),
+        )
+
+    def test_throttled(self):
+        clock = FakeClock()
+        bucket = _TokenBucket(2, burst=10, clock=clock, sleep=clock.sleep)
+        # we have a full burst available
+        self.assertEqual(0, bucket.acquire())
+        with patch.object(bucket.log, 'warning') as warning_mock:
+            bucket.throttled()
+        warning_mock.assert_called_once_with('throttled: throttles=%d', 1)
+        self.assertEqual(1, bucket.stats()['throttles'])
+        # but after being throttled it's gone and we have to wait
+        self.assertAlmostEqual(0.5, bucket.acquire())
+
+    def test_shared(self):
+        bucket = _TokenBucket.shared('test-shared', 3)
+        self.assertEqual('test-shared', bucket.name)
+        self.assertEqual(3, bucket.rate)
+        self.assertIs(bucket, _TokenBucket.shared('test-shared', 3))
+        self.assertIs(bucket, _TokenBucket.shared('test-shared', 3, 3))
+        self.assertIsNot(bucket, _TokenBucket.shared('test-shared-other', 3))
+
+        with self.assertRaises(ValueError) as ctx:
+            _TokenBucket.shared('test-shared', 4)
+        self.assertEqual(
+            'rate limit group "test-shared" already configured with '
+            'rate=3.0, burst=3.0',
+            str(ctx.exception),
+        )
+        with self.assertRaises(ValueError):
+            _TokenBucket.shared('test-shared', 3, 10)
+
+    def test_install(self):
+        client = Session(
+            aws_access_key_id='abc', aws_secret_access_key='123'
+        ).client('route53')
+        bucket = _TokenBucket(5)
+        self.assertIs(client, bucket.install(client))
+
+        events = client.meta.events
+        bucket.acquire = Mock()
+        events.emit('before-send.route-53.ListHostedZones', request=None)
+        bucket.acquire.assert_called_once_with()
+
+        # and check that everything we expect is registered
+        client = Mock()
+        bucket.install(client)
+        client.meta.events.register.assert_has_calls(
+            [
+                call('before-send', bucket._before_send),
+                call('needs-retry', bucket._needs_retry),
+            ]
+        )
+
+    def test_needs_retry(self):
+        bucket = _TokenBucket(5)
+        bucket.throttled = Mock()
+
+        # no response, e.g. a connection error
+        bucket._needs_retry(response=None, attempts=1)
+        # some other error
+        bucket._needs_retry(
+            response=(None, {'Error': {'Code': 'InvalidInput'}})
+        )
+        # success
+        bucket._needs_retry(response=(None, {'HostedZones': []}))
+        bucket.throttled.assert_not_called()
+
+        bucket._needs_retry(response=(None, {'Error': {'Code': 'Throttling'}}))
+        bucket.throttled.assert_called_once_with()
@@ -0,0 +1,44 @@
+#
+#
+#
+
+from threading import Thread
+from unittest import TestCase
+
+from octodns_route53.locks import _KeyedLocks
+
+
+class TestKeyedLocks(TestCase):
+    def test_locks(self):
+        locks = _KeyedLocks()
+
+        # same key, same lock
+        a = locks('a')
+        self.assertIs(a, locks('a'))
+        # different key, different lock
+        b = locks('b')
+        self.assertIsNot(a, b)
+
+        # re-entrant
+        with a:
+            with locks('a'):
+                pass
+
+        # held by another thread
+        acquired = []
+        with a:
+            thread = Thread(
+                target=lambda: acquired.append(a.acquire(blocking=False))
+            )
+            thread.start()
+            thread.join()
+        self.assertEqual([False], acquired)
+
+        # independent keys don't block each other
+        with a:
+            thread = Thread(
+                target=lambda: acquired.append(b.acquire(blocking=False))
+            )
+            thread.start()
+            thread.join()
+        self.assertEqual([False, True], acquired)
@@ -9,6 +9,7 @@ from botocore.stub import Stubber
 from octodns.zone import DuplicateRecordException, Zone
 
 from octodns_route53 import Ec2Source
+from octodns_route53.source import _FqdnIndex
 
 
 class TestEc2Source(TestCase):
@@ -115,6 +116,9 @@ class TestEc2Source(TestCase):
         self.assertEqual(0, len(in_addr_arpa.records))
         source.populate(ip6_arpa)
         self.assertEqual(0, len(ip6_arpa.records))
+        # instances were only requested once
+        self.assertEqual([], source.instances)
+        stubber.assert_no_pending_responses()
 
     def test_no_instances(self):
         source, stubber = self._get_stubbed_source()
@@ -179,6 +183,101 @@ class TestEc2Source(TestCase):
         )
         self.assertEqual(2, len(records))
 
+    def test_regions(self):
+        source = Ec2Source(
+            'test',
+            'us-east-1',
+            'abc',
+            '123',
+            regions=['us-west-2', 'us-east-1', 'eu-west-1'],
+        )
+        # region comes first, no duplicates
+        self.assertEqual(
+            ['us-east-1', 'us-west-2', 'eu-west-1'], source.regions
+        )
+        self.assertEqual(
+            'us-west-2', source._conns['us-west-2'].meta.region_name
+        )
+        self.assertIs(source._conns['us-east-1'], source._conn)
+
+        stubbers = []
+        for region, reservations in (
+            ('us-east-1', self.reservations[1:]),
+            ('us-west-2', self.reservations[:1]),
+            ('eu-west-1', []),
+        ):
+            stubber = Stubber(source._conns[region])
+            stubber.activate()
+            stubber.add_response(
+                'describe_instances', {'Reservations': reservations}
+            )
+            stubbers.append(stubber)
+
+        zone = Zone('unit.tests.', [])
+        source.populate(zone)
+        for stubber in stubbers:
+            stubber.assert_no_pending_responses()
+
+        # instances from all of the regions are merged in InstanceId order
+        # regardless of where they came from
+        self.assertEqual(
+            ['10.0.0.14', '10.0.0.15', '10.0.1.99', '10.0.0.16', None],
+            [i['private_v4'] for i in source.instances[:5]],
+        )
+        self.assertEqual(8, len(zone.records))
+
+    def test_regions_required(self):
+        with self.assertRaises(ValueError) as ctx:
+            Ec2Source('test', regions=[], access_key_id='abc')
+        self.assertEqual('region or regions is required', str(ctx.exception))
+
+        source = Ec2Source(
+            'test',
+            access_key_id='abc',
+            secret_access_key='123',
+            regions=['us-west-2'],
+        )
+        self.assertEqual(['us-west-2'], source.regions)
+
+    def test_instances_paginated(self):
+        source, stubber = self._get_stubbed_source(tag_prefix='dns')
+
+        zone = Zone('unit.tests.', [])
+
+        filters = [
+            {'Name': 'tag-key', 'Values': ['Name', 'dns*']},
+            {
+                'Name': 'instance-state-name',
+                'Values': [
+                    'pending',
+                    'running',
+                    'shutting-down',
+                    'stopping',
+                    'stopped',
+                ],
+            },
+        ]
+        stubber.add_response(
+            'describe_instances',
+            {'Reservations': self.reservations[:1], 'NextToken': 'next'},
+            {'Filters': filters, 'MaxResults': 1000},
+        )
+        stubber.add_response(
+            'describe_instances',
+            {'Reservations': self.reservations[1:]},
+            {'Filters': filters, 'MaxResults': 1000, 'NextToken': 'next'},
+        )
+        source.populate(zone)
+        stubber.assert_no_pending_responses()
+
+        # everything from both pages, octodns tags are ignored w/dns prefix
+        records = {(r.name, r._type): r for r in zone.records}
+        self.assertEqual(['10.0.0.14'], records[('all', 'A')].values)
+        self.assertEqual(['fc00::2'], records[('v6', 'AAAA')].values)
+        self.assertFalse(('v4', 'A') in records)
+        self.assertFalse(('2nd-v6', 'AAAA') in records)
+        self.assertEqual(5, len(records))
+
     def test_append(self):
         source, stubber = self._get_stubbed_source(append_to_names="org.")
 
@@ -287,3 +386,38 @@ class TestEc2Source(TestCase):
         )
         with self.assertRaises(DuplicateRecordException):
             source.populate(arpa)
+
+
+class TestFqdnIndex(TestCase):
+    def test_find(self):
+        index = _FqdnIndex()
+        index.add('b.unit.tests.', 1)
+        index.add('unit.tests.', 2)
+        index.add('a.b.unit.tests.', 3)
+        index.add('xunit.tests.', 4)
+        index.add('a.other.tests.', 5)
+        index.add('b.unit.tests.', 6)
+
+        # everything at or below, in the order it was added
+        self.assertEqual(
+            [
+                ('b.unit.tests.', 1),
+                ('unit.tests.', 2),
+                ('a.b.unit.tests.', 3),
+                ('b.unit.tests.', 6),
+            ],
+            index.find('unit.tests.'),
+        )
+        self.assertEqual(
+            [
+                ('b.unit.tests.', 1),
+                ('a.b.unit.tests.', 3),
+                ('b.unit.tests.', 6),
+            ],
+            index.find('b.unit.tests.'),
+        )
+        self.assertEqual([('xunit.tests.', 4)], index.find('xunit.tests.'))
+        self.assertEqual(6, len(index.find('tests.')))
+        # nothing there
+        self.assertEqual([], index.find('c.unit.tests.'))
+        self.assertEqual([], index.find('unit.other.'))
@@ -116,6 +116,7 @@ class TestElbSource(TestCase):
         # calls since we're stubbed and have no responses
         source.populate(zone)
         self.assertEqual(0, len(zone.records))
+        self.assertEqual([], list(source.lbs))
 
     def test_lbs(self):
         source, stubber = self._get_stubbed_source()
@@ -173,5 +174,133 @@ class TestElbSource(TestCase):
         for record in records.values():
             self.assertEqual('CNAME', record._type)
 
+    def test_lbs_paginated(self):
+        source, stubber = self._get_stubbed_source()
+
+        zone = Zone('unit.tests.', [])
+
+        lbs = self.load_balancers['LoadBalancers']
+        stubber.add_response(
+            'describe_load_balancers',
+            {'LoadBalancers': lbs[:3], 'NextMarker': 'next'},
+            {},
+        )
+        stubber.add_response(
+            'describe_load_balancers',
+            {'LoadBalancers': lbs[3:]},
+            {'Marker': 'next'},
+        )
+        # a single request for tags covering both pages
+        stubber.add_response(
+            'describe_tags',
+            self.tags,
+            {'ResourceArns': ['arn42', 'arn43', 'arn44', 'arn45', 'arn46']},
+        )
+
+        source.populate(zone)
+        stubber.assert_no_pending_responses()
+        self.assertEqual(8, len(zone.records))
+
+    def test_lbs_tag_batches(self):
+        source, stubber = self._get_stubbed_source(tag_workers=1)
+
+        zone = Zone('unit.tests.', [])
+
+        lbs = [
+            {
+                'DNSName': f'lb-{i}.aws.com',
+                'LoadBalancerArn': f'arn-{i}',
+                'LoadBalancerName': f'lb-{i}.unit.tests.',
+            }
+            for i in range(45)
+        ]
+        stubber.add_response('describe_load_balancers', {'LoadBalancers': lbs})
+        # tags are requested 20 at a time
+        for start in (0, 20, 40):
+            arns = [lb['LoadBalancerArn'] for lb in lbs[start : start + 20]]
+            stubber.add_response(
+                'describe_tags',
+                {
+                    'TagDescriptions': [
+                        {
+                            'ResourceArn': arn,
+                            'Tags': [
+                                {
+                                    'Key': 'octodns',
+                                    'Value': f'tag-{arn}.unit.tests.',
+                                }
+                            ],
+                        }
+                        for arn in arns
+                    ]
+                },
+                {'ResourceArns': arns},
+            )
+
+        source.populate(zone)
+        stubber.assert_no_pending_responses()
+
+        records = {r.name: r for r in zone.records}
+        self.assertEqual(90, len(records))
+        self.assertEqual('lb-0.aws.com.', records['lb-0'].value)
+        self.assertEqual('lb-0.aws.com.', records['tag-arn-0'].value)
+        self.assertEqual('lb-44.aws.com.', records['lb-44'].value)
+        self.assertEqual('lb-44.aws.com.', records['tag-arn-44'].value)
+
+    def test_regions(self):
+        source = ElbSource(
+            'test',
+            access_key_id='abc',
+            secret_access_key='123',
+            regions=['us-west-2', 'eu-west-1'],
+        )
+        self.assertEqual(['us-west-2', 'eu-west-1'], source.regions)
+
+        lbs = self.load_balancers['LoadBalancers']
+        tags = self.tags['TagDescriptions']
+        stubbers = []
+        for region, start, end in (('us-west-2', 2, 5), ('eu-west-1', 0, 2)):
+            stubber = Stubber(source._conns[region])
+            stubber.activate()
+            stubber.add_response(
+                'describe_load_balancers', {'LoadBalancers': lbs[start:end]}
+            )
+            stubber.add_response(
+                'describe_tags',
+                {'TagDescriptions': tags[start:end]},
+                {
+                    'ResourceArns': [
+                        lb['LoadBalancerArn'] for lb in lbs[start:end]
+                    ]
+                },
+            )
+            stubbers.append(stubber)
+
+        zone = Zone('unit.tests.', [])
+        source.populate(zone)
+        for stubber in stubbers:
+            stubber.assert_no_pending_responses()
+
+        # merged in region order
+        self.assertEqual(
+            [
+                'baz.aws.com.',
+                'blip.aws.com.',
+                'bang.aws.com.',
+                'foo.aws.com.',
+                'bar.aws.com.',
+            ],
+            [lb['dns_name'] for lb in source.lbs],
+        )
+        self.assertEqual(8, len(zone.records))
+
+    def test_tag_workers_invalid(self):
+        for bad in (0, 'many'):
+            with self.assertRaises(ValueError) as ctx:
+                ElbSource('test', 'us-east-1', tag_workers=bad)
+            self.assertEqual(
+                'tag_workers must be a positive integer', str(ctx.exception)
+            )
+
     def test_conflicting_fqdns(self):
         pass